@@ -0,0 +1,133 @@
+"""
+게시판 목록 추출 경로 벤치마크
+
+저장된 게시판 HTML(tests/fixtures/board_*.html)로 두 경로의 페이지당 추출 시간을 비교합니다.
+
+- 기존 경로: 게시글마다 element.get_attribute('outerHTML') + html.parser 트리 생성
+- 새 경로: driver.page_source 한 번 + lxml 트리 하나에서 전체 추출
+
+WebDriver 왕복 비용은 --rtt-ms로 흉내낼 수 있습니다 (기본 0, 순수 파싱 비용만 측정).
+
+사용법:
+    python benchmarks/bench_list_extraction.py --repeat 50 --rtt-ms 2
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bs4 import BeautifulSoup
+from everytime_crawler import EverytimeCrawler
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), '..', 'tests', 'fixtures')
+
+
+class FakeElement:
+    """outerHTML 요청마다 WebDriver 왕복을 흉내내는 요소"""
+
+    def __init__(self, outer_html, driver):
+        self._outer_html = outer_html
+        self._driver = driver
+
+    def get_attribute(self, name):
+        self._driver.round_trip()
+        return self._outer_html if name == 'outerHTML' else None
+
+
+class FakeDriver:
+    """저장된 HTML을 제공하고 왕복 횟수를 세는 가짜 WebDriver"""
+
+    def __init__(self, html, rtt):
+        self._html = html
+        self.rtt = rtt
+        self.round_trips = 0
+        # 기존 경로가 find_elements로 받던 요소들 (요청 전에 미리 준비)
+        soup = BeautifulSoup(html, 'html.parser')
+        self._articles = [str(elem) for elem in soup.select('article.list')]
+
+    def round_trip(self):
+        self.round_trips += 1
+        if self.rtt:
+            time.sleep(self.rtt)
+
+    @property
+    def page_source(self):
+        self.round_trip()
+        return self._html
+
+    def find_elements(self, by, selector):
+        self.round_trip()
+        if selector != 'article.list':
+            return []
+        return [FakeElement(html, self) for html in self._articles]
+
+
+def old_path(crawler, driver):
+    """기존 경로: 셀렉터 탐색 + 게시글별 outerHTML/html.parser"""
+    posts = []
+    for selector in crawler.POST_SELECTORS:
+        elements = driver.find_elements('css selector', selector)
+        if elements:
+            break
+    for element in elements[:20]:
+        post_info = crawler._extract_single_post_info(element, selector)
+        if post_info:
+            posts.append(post_info)
+    return posts
+
+
+def new_path(crawler, driver):
+    """새 경로: page_source 한 번 + lxml 단일 트리"""
+    return crawler._extract_posts_from_html(driver.page_source, 'free', 1)
+
+
+def measure(func, crawler, driver, repeat):
+    """페이지당 추출 시간(ms) 목록과 페이지당 왕복 수 반환"""
+    timings = []
+    driver.round_trips = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        posts = func(crawler, driver)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings, driver.round_trips / repeat, len(posts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시판 목록 추출 경로 벤치마크")
+    parser.add_argument('--repeat', type=int, default=30, help="페이지당 반복 횟수")
+    parser.add_argument('--rtt-ms', type=float, default=0.0, help="WebDriver 왕복 1회 지연(ms)")
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        crawler = EverytimeCrawler()
+
+    files = sorted(glob.glob(os.path.join(FIXTURES_DIR, 'board_*.html')))
+    print(f"{'fixture':32} {'path':5} {'median ms':>10} {'p95 ms':>8} {'round trips':>12} {'posts':>6}")
+
+    for path in files:
+        with open(path, encoding='utf-8') as f:
+            html = f.read()
+
+        results = {}
+        for name, func in (('old', old_path), ('new', new_path)):
+            driver = FakeDriver(html, args.rtt_ms / 1000)
+            with contextlib.redirect_stdout(io.StringIO()):
+                timings, round_trips, count = measure(func, crawler, driver, args.repeat)
+            timings.sort()
+            median = statistics.median(timings)
+            p95 = timings[int(len(timings) * 0.95) - 1]
+            results[name] = median
+            print(f"{os.path.basename(path):32} {name:5} {median:10.2f} {p95:8.2f} {round_trips:12.0f} {count:6d}")
+
+        print(f"{'':32} 속도 향상: {results['old'] / results['new']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
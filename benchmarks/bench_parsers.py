@@ -0,0 +1,269 @@
+"""
+파서 경로 벤치마크 (오프라인, 저장된 HTML fixture 사용)
+
+로그인이나 브라우저 없이 tests/fixtures의 HTML로 파싱 경로별 처리량과 메모리 사용량을 측정합니다.
+
+- list_page:         게시판 목록 페이지 -> _extract_posts_from_html
+- single_post_info:  게시글 요소별 outerHTML -> _extract_single_post_info
+- post_detail:       댓글 300개 이상 상세 페이지 -> _parse_post_detail (get_post_detail 파싱)
+- comment_info:      댓글 노드별 -> _extract_comment_info
+- timetable:         시간표 페이지 -> get_timetable (가짜 WebDriver)
+- time_from_style:   과목 style 속성 -> parse_time_from_style
+
+각 항목은 페이지(반복 1회)당 중앙값 시간, 초당 처리 항목 수(게시글/댓글/과목),
+tracemalloc으로 잰 페이지당 최대 메모리(peak KiB)를 출력합니다.
+--check는 저장된 기준값(benchmarks/baseline.json)보다 처리량이 tolerance 이상 낮거나
+메모리가 tolerance 이상 많으면 실패(종료 코드 1)합니다. 기준값은 측정한 머신에 따라 다르므로
+같은 머신에서 --update-baseline으로 갱신한 뒤 비교하세요.
+
+사용법:
+    python benchmarks/bench_parsers.py
+    python benchmarks/bench_parsers.py --check --tolerance 0.35
+    python benchmarks/bench_parsers.py --update-baseline
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+TESTS_DIR = os.path.join(BENCH_DIR, '..', 'tests')
+sys.path.append(os.path.join(BENCH_DIR, '..', 'src'))
+sys.path.append(TESTS_DIR)
+
+from bs4 import BeautifulSoup
+from everytime_crawler import EverytimeCrawler
+from fake_driver import FakeDriver
+
+FIXTURES_DIR = os.path.join(TESTS_DIR, 'fixtures')
+BASELINE_PATH = os.path.join(BENCH_DIR, 'baseline.json')
+LARGE_THREAD = 'post_384508500.html'
+TIMETABLE = 'timetable.html'
+
+# 메모리 비교 시 기준값이 아주 작은 항목(수 KiB)이 잡음으로 실패하지 않도록 허용하는 최소 여유
+MIN_PEAK_SLACK_KIB = 16
+
+
+def _read_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+class _OuterHtmlElement:
+    """outerHTML만 제공하는 WebElement (_extract_single_post_info 입력용)"""
+
+    def __init__(self, outer_html):
+        self._outer_html = outer_html
+
+    def get_attribute(self, name):
+        return self._outer_html if name == 'outerHTML' else None
+
+
+def build_cases(crawler):
+    """
+    벤치마크 항목 목록
+
+    Returns:
+        list: (이름, 단위, [(페이지 이름, 반복 1회 실행 함수 -> 처리 항목 수)]) 리스트
+    """
+    board_pages = [
+        (name, _read_fixture(name))
+        for name in sorted(os.path.basename(path) for path in glob.glob(os.path.join(FIXTURES_DIR, 'board_*.html')))
+    ]
+    detail_html = _read_fixture(LARGE_THREAD)
+    detail_items = BeautifulSoup(detail_html, 'lxml').select('ul.comments li')
+    timetable_styles = [
+        tag['style'] for tag in BeautifulSoup(_read_fixture(TIMETABLE), 'lxml').select('.subject')
+    ]
+
+    def list_page(html):
+        return lambda: len(crawler._extract_posts_from_html(html, 'free', 1))
+
+    def single_post_info(html):
+        elements = [
+            _OuterHtmlElement(str(tag))
+            for tag in BeautifulSoup(html, 'lxml').select('article.list')
+        ]
+        return lambda: sum(
+            crawler._extract_single_post_info(element, 'article.list') is not None
+            for element in elements
+        )
+
+    def post_detail():
+        return len(crawler._parse_post_detail(detail_html, 'https://everytime.kr/387605/v/384508500')['comments'])
+
+    def comment_info():
+        return sum(crawler._extract_comment_info(item) is not None for item in detail_items)
+
+    def timetable():
+        crawler.driver = FakeDriver({'/timetable': TIMETABLE})
+        return len(crawler.get_timetable(save_to_file=False))
+
+    def time_from_style():
+        return sum(crawler.parse_time_from_style(style) is not None for style in timetable_styles)
+
+    return [
+        ('list_page', 'posts', [(name, list_page(html)) for name, html in board_pages]),
+        ('single_post_info', 'posts', [(name, single_post_info(html)) for name, html in board_pages]),
+        ('post_detail', 'comments', [(LARGE_THREAD, post_detail)]),
+        ('comment_info', 'comments', [(LARGE_THREAD, comment_info)]),
+        ('timetable', 'subjects', [(TIMETABLE, timetable)]),
+        ('time_from_style', 'styles', [(TIMETABLE, time_from_style)]),
+    ]
+
+
+def measure(func, repeat):
+    """
+    반복 1회의 중앙값 시간(초), 처리 항목 수, peak 메모리(KiB)
+
+    시간과 메모리는 따로 잽니다 (tracemalloc이 켜져 있으면 실행이 느려짐).
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        items = func()  # 준비 실행 (지연 import, 셀렉터 컴파일 등)
+
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            base, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return statistics.median(timings), items, (peak - base) / 1024
+
+
+def run(repeat=20, only=None):
+    """
+    전체(또는 only에 포함된) 항목 측정
+
+    Returns:
+        dict: 항목 이름 -> {unit, pages, seconds_per_page, items_per_page, items_per_sec, peak_kib}
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        crawler = EverytimeCrawler()
+
+    results = {}
+    for name, unit, pages in build_cases(crawler):
+        if only and name not in only:
+            continue
+
+        seconds = items = peak = 0
+        for _, func in pages:
+            page_seconds, page_items, page_peak = measure(func, repeat)
+            seconds += page_seconds
+            items += page_items
+            peak = max(peak, page_peak)
+
+        results[name] = {
+            'unit': unit,
+            'pages': len(pages),
+            'seconds_per_page': seconds / len(pages),
+            'items_per_page': items / len(pages),
+            'items_per_sec': items / seconds if seconds else 0.0,
+            'peak_kib': peak,
+        }
+
+    return results
+
+
+def compare(results, baseline, tolerance=0.35):
+    """
+    기준값 대비 회귀 목록
+
+    Returns:
+        list: 회귀 설명 문자열 리스트 (없으면 빈 리스트)
+    """
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if not expected:
+            continue
+
+        min_rate = expected['items_per_sec'] * (1 - tolerance)
+        if result['items_per_sec'] < min_rate:
+            regressions.append(
+                f"{name}: 처리량 {result['items_per_sec']:.0f} {result['unit']}/s "
+                f"< 기준 {expected['items_per_sec']:.0f} x {1 - tolerance:.2f}"
+            )
+
+        max_peak = max(expected['peak_kib'] * (1 + tolerance), expected['peak_kib'] + MIN_PEAK_SLACK_KIB)
+        if result['peak_kib'] > max_peak:
+            regressions.append(
+                f"{name}: 메모리 {result['peak_kib']:.0f} KiB/page "
+                f"> 기준 {expected['peak_kib']:.0f} x {1 + tolerance:.2f}"
+            )
+
+    return regressions
+
+
+def load_baseline(path=BASELINE_PATH):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    baseline = {
+        name: {'items_per_sec': round(r['items_per_sec'], 1), 'peak_kib': round(r['peak_kib'], 1)}
+        for name, r in results.items()
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+def print_results(results, baseline):
+    print(f"{'case':18} {'ms/page':>9} {'items/s':>10} {'unit':>9} {'peak KiB':>9} {'vs base':>8}")
+    for name, r in results.items():
+        expected = baseline.get(name)
+        ratio = f"{r['items_per_sec'] / expected['items_per_sec']:.2f}x" if expected else '-'
+        print(f"{name:18} {r['seconds_per_page'] * 1000:9.2f} {r['items_per_sec']:10.0f} "
+              f"{r['unit']:>9} {r['peak_kib']:9.0f} {ratio:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파서 경로 벤치마크")
+    parser.add_argument('--repeat', type=int, default=20, help="페이지당 반복 횟수")
+    parser.add_argument('--only', nargs='*', help="측정할 항목 이름")
+    parser.add_argument('--check', action='store_true', help="기준값보다 느려지면 실패")
+    parser.add_argument('--tolerance', type=float, default=0.35, help="허용 오차 비율")
+    parser.add_argument('--update-baseline', action='store_true', help="측정값을 기준값으로 저장")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="기준값 파일 경로")
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline)
+    results = run(args.repeat, args.only)
+    print_results(results, baseline)
+
+    if args.update_baseline:
+        save_baseline({**baseline, **results} if args.only else results, args.baseline)
+        print(f"\n💾 기준값 저장: {args.baseline}")
+
+    if args.check:
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\n❌ 성능 회귀:")
+            for line in regressions:
+                print(f"   - {line}")
+            sys.exit(1)
+        print("\n✅ 기준값 대비 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,53 +3,70 @@
 """
 
 import os
+import sys
 import json
-import pandas as pd
+import heapq
 import glob
 from datetime import datetime
 import matplotlib.pyplot as plt
 import seaborn as sns
-from collections import Counter
+from collections import Counter, defaultdict
 import re
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from everytime_crawler.sinks import iter_jsonl
+
+# massive_crawl_{board_id}_{YYYYmmdd}_{HHMMSS}.json / .jsonl
+DATA_FILE_PATTERN = re.compile(r'^massive_crawl_(.+?)_\d{8}_\d{6}\.jsonl?$')
+KOREAN_WORD_PATTERN = re.compile(r'[가-힣]{2,}')
+STOP_WORDS = {'이번', '저번', '다음', '지난', '오늘', '내일', '어제', '그냥', '진짜', '정말', '완전', '너무', '엄청', '되게', '좀'}
+
+
+def _to_int(value):
+    """'12' 같은 문자열 숫자를 정수로 변환 (실패 시 0)"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
 
 class MassiveCrawlingAnalyzer:
     """대량 크롤링 데이터 분석 클래스"""
     
     def __init__(self, data_dir="data"):
         self.data_dir = data_dir
-        self.crawling_data = {}
+        self.data_files = defaultdict(list)  # 게시판 ID -> 데이터 파일 목록 (게시글은 메모리에 올리지 않음)
         self.summary_data = None
+        self.aggregates = None
         
     def load_crawling_data(self):
-        """크롤링된 데이터 로드"""
+        """크롤링 데이터 파일 목록과 요약 로드 (게시글은 분석 시 스트리밍으로 읽음)"""
         print("📂 크롤링 데이터 로드 중...")
         
-        # JSON 파일들 찾기
-        json_files = glob.glob(os.path.join(self.data_dir, "massive_crawl_*.json"))
+        # JSON / JSON Lines 파일들 찾기
+        data_files = sorted(
+            glob.glob(os.path.join(self.data_dir, "massive_crawl_*.json"))
+            + glob.glob(os.path.join(self.data_dir, "massive_crawl_*.jsonl"))
+        )
         summary_files = glob.glob(os.path.join(self.data_dir, "massive_crawl_summary_*.json"))
         
-        print(f"   데이터 파일 {len(json_files)}개 발견")
-        print(f"   요약 파일 {len(summary_files)}개 발견")
+        self.data_files.clear()
+        self.aggregates = None
         
-        # 게시판별 데이터 로드
-        for json_file in json_files:
-            filename = os.path.basename(json_file)
+        for data_file in data_files:
+            filename = os.path.basename(data_file)
             
             # 파일명에서 게시판 ID 추출
-            match = re.search(r'massive_crawl_(\w+)_\d+\.json', filename)
-            if match:
-                board_id = match.group(1)
-                
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    self.crawling_data[board_id] = data
-                    print(f"   ✅ {board_id}: {len(data)}개 게시글 로드")
-                    
-                except Exception as e:
-                    print(f"   ❌ {filename} 로드 실패: {e}")
+            match = DATA_FILE_PATTERN.match(filename)
+            if match and match.group(1) != 'summary':
+                self.data_files[match.group(1)].append(data_file)
+        
+        print(f"   데이터 파일 {sum(len(files) for files in self.data_files.values())}개 발견")
+        print(f"   요약 파일 {len(summary_files)}개 발견")
+        
+        for board_id, files in self.data_files.items():
+            print(f"   ✅ {board_id}: 파일 {len(files)}개")
         
         # 요약 데이터 로드 (가장 최신 것)
         if summary_files:
@@ -61,29 +78,124 @@ class MassiveCrawlingAnalyzer:
             except Exception as e:
                 print(f"   ❌ 요약 데이터 로드 실패: {e}")
         
-        return len(self.crawling_data) > 0
+        return len(self.data_files) > 0
+    
+    def iter_posts(self):
+        """
+        (board_id, post)를 하나씩 반환
+        
+        .jsonl은 한 줄씩 읽고, .json(배열)은 한 번에 한 파일만 메모리에 올립니다.
+        """
+        for board_id, files in self.data_files.items():
+            for data_file in files:
+                try:
+                    if data_file.endswith('.jsonl'):
+                        posts = iter_jsonl(data_file)
+                    else:
+                        with open(data_file, 'r', encoding='utf-8') as f:
+                            posts = json.load(f)
+                    
+                    for post in posts:
+                        yield board_id, post
+                    
+                except Exception as e:
+                    print(f"   ❌ {os.path.basename(data_file)} 로드 실패: {e}")
+    
+    def compute_aggregates(self):
+        """
+        모든 게시글을 한 번만 읽어 통계/작성 패턴/키워드 집계를 함께 계산
+        
+        메모리 사용량은 게시글 수가 아니라 집계 결과(게시판 수, 작성자/키워드 종류) 크기에 비례합니다.
+        """
+        board_counts = Counter()
+        author_counts = Counter()
+        keyword_counts = Counter()
+        board_keywords = defaultdict(Counter)
+        comment_histogram = Counter()
+        board_comment_sums = Counter()
+        comment_sum = 0
+        comment_max = 0
+        view_sum = 0
+        view_max = 0
+        view_posts = 0
+        top_commented = []  # (댓글 수, 순번, 게시판, 제목) 최소 힙, 크기 5
+        
+        for seq, (board_id, post) in enumerate(self.iter_posts()):
+            board_counts[board_id] += 1
+            
+            author = post.get('author')
+            if author:
+                author_counts[author] += 1
+            
+            comments = _to_int(post.get('comment_count'))
+            comment_sum += comments
+            comment_max = max(comment_max, comments)
+            comment_histogram[comments] += 1
+            board_comment_sums[board_id] += comments
+            
+            entry = (comments, seq, board_id, post.get('title') or 'N/A')
+            if len(top_commented) < 5:
+                heapq.heappush(top_commented, entry)
+            elif entry[0] > top_commented[0][0]:
+                heapq.heapreplace(top_commented, entry)
+            
+            if post.get('view_count') is not None:
+                views = _to_int(post.get('view_count'))
+                view_sum += views
+                view_max = max(view_max, views)
+                view_posts += 1
+            
+            title = post.get('title', '')
+            if title:
+                words = [w for w in KOREAN_WORD_PATTERN.findall(title) if w not in STOP_WORDS]
+                keyword_counts.update(words)
+                board_keywords[board_id].update(words)
+        
+        total_posts = sum(board_counts.values())
+        self.aggregates = {
+            'total_posts': total_posts,
+            'board_counts': dict(board_counts),
+            'author_counts': author_counts,
+            'average_comments': comment_sum / total_posts if total_posts else 0,
+            'max_comments': comment_max,
+            'comment_histogram': comment_histogram,
+            'board_average_comments': {
+                board_id: board_comment_sums[board_id] / count for board_id, count in board_counts.items()
+            },
+            'top_commented': sorted(top_commented, key=lambda e: (-e[0], e[1])),
+            'average_views': view_sum / view_posts if view_posts else None,
+            'max_views': view_max if view_posts else None,
+            'keyword_counts': keyword_counts,
+            'board_keywords': board_keywords
+        }
+        return self.aggregates
+    
+    def _get_aggregates(self):
+        """집계가 없으면 한 번 계산"""
+        if self.aggregates is None:
+            self.compute_aggregates()
+        return self.aggregates
     
     def generate_overall_statistics(self):
         """전체 통계 생성"""
         print("\n📊 전체 통계 분석")
         print("=" * 50)
         
-        if not self.crawling_data:
+        aggregates = self._get_aggregates()
+        if not aggregates['total_posts']:
             print("❌ 로드된 데이터가 없습니다.")
             return
         
-        total_posts = sum(len(posts) for posts in self.crawling_data.values())
-        total_boards = len(self.crawling_data)
+        board_counts = aggregates['board_counts']
+        total_posts = aggregates['total_posts']
+        total_boards = len(board_counts)
         
         print(f"📋 분석된 게시판 수: {total_boards}개")
         print(f"📝 총 게시글 수: {total_posts:,}개")
         
         # 게시판별 게시글 수
         print(f"\n📋 게시판별 게시글 수:")
-        board_counts = {}
-        for board_id, posts in self.crawling_data.items():
-            count = len(posts)
-            board_counts[board_id] = count
+        for board_id, count in board_counts.items():
             print(f"   {board_id}: {count:,}개")
         
         # 가장 활발한 게시판
@@ -102,90 +214,56 @@ class MassiveCrawlingAnalyzer:
         print("\n📈 게시글 작성 패턴 분석")
         print("=" * 50)
         
-        all_posts = []
-        for board_id, posts in self.crawling_data.items():
-            for post in posts:
-                post['board_id'] = board_id
-                all_posts.append(post)
-        
-        if not all_posts:
+        aggregates = self._get_aggregates()
+        if not aggregates['total_posts']:
             print("❌ 분석할 데이터가 없습니다.")
             return
         
-        # DataFrame 생성
-        df = pd.DataFrame(all_posts)
-        
-        print(f"📊 총 분석 대상: {len(df)}개 게시글")
+        print(f"📊 총 분석 대상: {aggregates['total_posts']}개 게시글")
         
         # 작성자 분석
-        if 'author' in df.columns:
-            author_counts = df['author'].value_counts()
+        author_counts = aggregates['author_counts']
+        if author_counts:
             print(f"\n✍️ 상위 작성자 (TOP 10):")
-            for i, (author, count) in enumerate(author_counts.head(10).items(), 1):
+            for i, (author, count) in enumerate(author_counts.most_common(10), 1):
                 print(f"   {i:2d}. {author}: {count}개")
         
         # 댓글 수 분석
-        if 'comment_count' in df.columns:
-            df['comment_count'] = pd.to_numeric(df['comment_count'], errors='coerce').fillna(0)
-            
-            avg_comments = df['comment_count'].mean()
-            max_comments = df['comment_count'].max()
-            
-            print(f"\n💬 댓글 통계:")
-            print(f"   평균 댓글 수: {avg_comments:.1f}개")
-            print(f"   최대 댓글 수: {max_comments}개")
-            
-            # 댓글이 많은 게시글
-            top_commented = df.nlargest(5, 'comment_count')
-            print(f"\n🔥 댓글 많은 게시글 (TOP 5):")
-            for i, (_, post) in enumerate(top_commented.iterrows(), 1):
-                title = post.get('title', 'N/A')[:50]
-                comments = post.get('comment_count', 0)
-                board = post.get('board_id', 'N/A')
-                print(f"   {i}. [{board}] {title}... ({comments}개)")
+        print(f"\n💬 댓글 통계:")
+        print(f"   평균 댓글 수: {aggregates['average_comments']:.1f}개")
+        print(f"   최대 댓글 수: {aggregates['max_comments']}개")
+        
+        # 댓글이 많은 게시글
+        print(f"\n🔥 댓글 많은 게시글 (TOP 5):")
+        for i, (comments, _, board, title) in enumerate(aggregates['top_commented'], 1):
+            print(f"   {i}. [{board}] {title[:50]}... ({comments}개)")
         
         # 조회수 분석 (있는 경우)
-        if 'view_count' in df.columns:
-            df['view_count'] = pd.to_numeric(df['view_count'], errors='coerce').fillna(0)
-            
-            avg_views = df['view_count'].mean()
-            max_views = df['view_count'].max()
-            
+        if aggregates['average_views'] is not None:
             print(f"\n👁️ 조회수 통계:")
-            print(f"   평균 조회수: {avg_views:.1f}회")
-            print(f"   최대 조회수: {max_views}회")
+            print(f"   평균 조회수: {aggregates['average_views']:.1f}회")
+            print(f"   최대 조회수: {aggregates['max_views']}회")
         
-        return df
+        return {
+            'total_posts_analyzed': aggregates['total_posts'],
+            'unique_authors': len(author_counts),
+            'average_comments': float(aggregates['average_comments']),
+            'max_comments': int(aggregates['max_comments'])
+        }
     
     def analyze_content_trends(self):
         """콘텐츠 트렌드 분석"""
         print("\n📝 콘텐츠 트렌드 분석")
         print("=" * 50)
         
-        all_titles = []
-        for board_id, posts in self.crawling_data.items():
-            for post in posts:
-                title = post.get('title', '')
-                if title:
-                    all_titles.append(title)
+        aggregates = self._get_aggregates()
+        word_counts = aggregates['keyword_counts']
         
-        if not all_titles:
+        if not word_counts:
             print("❌ 분석할 제목 데이터가 없습니다.")
             return
         
-        print(f"📊 분석 대상 제목: {len(all_titles)}개")
-        
-        # 단어 빈도 분석 (간단한 키워드 추출)
-        all_text = ' '.join(all_titles)
-        
-        # 한글 키워드 추출 (2글자 이상)
-        korean_words = re.findall(r'[가-힣]{2,}', all_text)
-        
-        # 불용어 제거
-        stop_words = {'이번', '저번', '다음', '지난', '오늘', '내일', '어제', '그냥', '진짜', '정말', '완전', '너무', '엄청', '되게', '좀'}
-        korean_words = [word for word in korean_words if word not in stop_words]
-        
-        word_counts = Counter(korean_words)
+        print(f"📊 분석 대상 게시글: {aggregates['total_posts']}개")
         
         print(f"\n🔍 인기 키워드 (TOP 20):")
         for i, (word, count) in enumerate(word_counts.most_common(20), 1):
@@ -193,14 +271,8 @@ class MassiveCrawlingAnalyzer:
         
         # 게시판별 인기 키워드
         print(f"\n📋 게시판별 인기 키워드:")
-        for board_id, posts in self.crawling_data.items():
-            board_titles = [post.get('title', '') for post in posts]
-            board_text = ' '.join(board_titles)
-            board_words = re.findall(r'[가-힣]{2,}', board_text)
-            board_words = [word for word in board_words if word not in stop_words]
-            
-            if board_words:
-                board_word_counts = Counter(board_words)
+        for board_id, board_word_counts in aggregates['board_keywords'].items():
+            if board_word_counts:
                 top_words = board_word_counts.most_common(5)
                 word_str = ', '.join([f"{word}({count})" for word, count in top_words])
                 print(f"   {board_id}: {word_str}")
@@ -213,8 +285,10 @@ class MassiveCrawlingAnalyzer:
         print("=" * 50)
         
         try:
+            aggregates = self._get_aggregates()
+            
             # 게시판별 게시글 수 차트
-            board_counts = {board_id: len(posts) for board_id, posts in self.crawling_data.items()}
+            board_counts = aggregates['board_counts']
             
             plt.figure(figsize=(12, 8))
             
@@ -234,38 +308,19 @@ class MassiveCrawlingAnalyzer:
             plt.pie(counts, labels=boards, autopct='%1.1f%%')
             plt.title('게시판별 게시글 비율')
             
-            # 3. 댓글 수 분포 (모든 게시글)
-            all_comments = []
-            for posts in self.crawling_data.values():
-                for post in posts:
-                    comment_count = post.get('comment_count', '0')
-                    try:
-                        all_comments.append(int(comment_count))
-                    except:
-                        all_comments.append(0)
-            
-            if all_comments:
+            # 3. 댓글 수 분포 (모든 게시글, 값별 개수를 가중치로 사용)
+            comment_histogram = aggregates['comment_histogram']
+            if comment_histogram:
                 plt.subplot(2, 2, 3)
-                plt.hist(all_comments, bins=20, color='lightgreen', alpha=0.7)
+                plt.hist(list(comment_histogram.keys()), weights=list(comment_histogram.values()),
+                         bins=20, color='lightgreen', alpha=0.7)
                 plt.title('댓글 수 분포')
                 plt.xlabel('댓글 수')
                 plt.ylabel('게시글 수')
             
             # 4. 게시판별 평균 댓글 수
             plt.subplot(2, 2, 4)
-            board_avg_comments = {}
-            
-            for board_id, posts in self.crawling_data.items():
-                comments = []
-                for post in posts:
-                    comment_count = post.get('comment_count', '0')
-                    try:
-                        comments.append(int(comment_count))
-                    except:
-                        comments.append(0)
-                
-                if comments:
-                    board_avg_comments[board_id] = sum(comments) / len(comments)
+            board_avg_comments = aggregates['board_average_comments']
             
             if board_avg_comments:
                 boards = list(board_avg_comments.keys())
@@ -298,9 +353,10 @@ class MassiveCrawlingAnalyzer:
         print("\n📋 종합 분석 보고서 생성")
         print("=" * 50)
         
-        # 분석 실행
+        # 분석 실행 (게시글은 compute_aggregates에서 한 번만 읽음)
+        self.compute_aggregates()
         overall_stats = self.generate_overall_statistics()
-        df = self.analyze_posting_patterns()
+        posting_patterns = self.analyze_posting_patterns()
         word_counts = self.analyze_content_trends()
         
         # 보고서 생성
@@ -317,14 +373,9 @@ class MassiveCrawlingAnalyzer:
             }
         }
         
-        # DataFrame 통계 추가
-        if df is not None and not df.empty:
-            report['posting_patterns'] = {
-                'total_posts_analyzed': len(df),
-                'unique_authors': df['author'].nunique() if 'author' in df.columns else 0,
-                'average_comments': float(df['comment_count'].mean()) if 'comment_count' in df.columns else 0,
-                'max_comments': int(df['comment_count'].max()) if 'comment_count' in df.columns else 0
-            }
+        # 작성 패턴 통계 추가
+        if posting_patterns:
+            report['posting_patterns'] = posting_patterns
         
         # 요약 데이터 추가
         if self.summary_data:
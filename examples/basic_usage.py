@@ -3,7 +3,7 @@
 """
 
 from dotenv import load_dotenv
-from everytime_crawler import EverytimeCrawler
+from everytime_crawler import EverytimeCrawler, configure_logging
 import os
 import time
 from datetime import datetime
@@ -142,7 +142,7 @@ def example_specific_date_range_crawling():
                     crawler.save_board_posts_to_csv(posts, csv_filename)
                     
                     # JSON 저장
-                    json_filename = f"data/bulk_{board_id}_{timestamp}.json"
+                    json_filename = f"data/bulk_{board_id}_{timestamp}.jsonl"
                     crawler.save_board_posts_to_json(posts, json_filename)
                     
                     print(f"💾 저장 완료: {csv_filename}, {json_filename}")
@@ -202,4 +202,5 @@ def main():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    configure_logging()
     main()
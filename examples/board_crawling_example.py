@@ -10,7 +10,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 # 환경변수 로드
 load_dotenv()
 
-from everytime_crawler import EverytimeCrawler
+from everytime_crawler import EverytimeCrawler, configure_logging
 import time
 
 
@@ -149,6 +149,7 @@ def demo_board_analysis():
 
 
 if __name__ == "__main__":
+    configure_logging()
     print("🚀 에브리타임 게시판 크롤러 실행")
     print("=" * 50)
     
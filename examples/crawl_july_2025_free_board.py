@@ -11,75 +11,16 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 # 환경변수 로드
 load_dotenv()
 
-from everytime_crawler import EverytimeCrawler
-import time
+from everytime_crawler import EverytimeCrawler, configure_logging
+from everytime_crawler.columnar import ParquetSink
 import json
 import pandas as pd
-from datetime import datetime, timedelta
-import re
+from datetime import datetime
 
 
-def parse_everytime_time(time_str):
-    """에브리타임 시간 문자열을 datetime 객체로 변환"""
-    if not time_str:
-        return None
-    
-    now = datetime.now()
-    
-    # "3분 전", "17분 전" 형태
-    if "분 전" in time_str:
-        minutes = int(re.findall(r'\d+', time_str)[0])
-        return now - timedelta(minutes=minutes)
-    
-    # "1시간 전", "2시간 전" 형태
-    elif "시간 전" in time_str:
-        hours = int(re.findall(r'\d+', time_str)[0])
-        return now - timedelta(hours=hours)
-    
-    # "07/01 09:11", "20:26" 형태
-    elif "/" in time_str:
-        # "07/01 09:11" 형태
-        try:
-            month_day, time_part = time_str.split(" ")
-            month, day = month_day.split("/")
-            hour, minute = time_part.split(":")
-            
-            # 2025년으로 가정
-            return datetime(2025, int(month), int(day), int(hour), int(minute))
-        except:
-            pass
-    
-    elif ":" in time_str and len(time_str) == 5:
-        # "20:26" 형태 (오늘)
-        try:
-            hour, minute = time_str.split(":")
-            today = now.date()
-            return datetime.combine(today, datetime.strptime(f"{hour}:{minute}", "%H:%M").time())
-        except:
-            pass
-    
-    return None
-
-
-def is_july_2025(time_str):
-    """주어진 시간 문자열이 2025년 7월에 해당하는지 확인"""
-    parsed_time = parse_everytime_time(time_str)
-    if parsed_time:
-        return parsed_time.year == 2025 and parsed_time.month == 7
-    
-    # 파싱에 실패한 경우 문자열로 판단
-    if "07/" in time_str:  # 07/01, 07/02 등
-        return True
-    
-    # 최근 글 (분 전, 시간 전)도 7월로 간주 (현재가 7월이므로)
-    if "분 전" in time_str or "시간 전" in time_str:
-        return True
-    
-    # 오늘 작성된 글 (시:분 형태)도 7월로 간주
-    if ":" in time_str and len(time_str) == 5:
-        return True
-    
-    return False
+# 수집 대상 기간 [JULY_START, JULY_END)
+JULY_START = datetime(2025, 7, 1)
+JULY_END = datetime(2025, 8, 1)
 
 
 def crawl_july_2025_free_board():
@@ -101,60 +42,18 @@ def crawl_july_2025_free_board():
             return
         
         print("✅ 로그인 성공!")
-        print("\n📋 자유게시판 크롤링 시작...")
         
-        # 충분한 페이지 수로 크롤링 (7월 전체 데이터 확보)
-        max_pages = 50  # 필요에 따라 조정
-        current_page = 1
-        consecutive_non_july = 0  # 연속으로 7월이 아닌 글 수
+        # 상세 페이지는 로그인 쿠키를 복사한 HTTP 세션으로 동시에 수집
+        crawler.sync_session_cookies()
         
-        while current_page <= max_pages:
-            print(f"\n📄 페이지 {current_page} 크롤링 중...")
-            
-            try:
-                # 한 페이지씩 크롤링
-                posts = crawler.get_board_posts("free", pages=1, delay=3)
-                
-                if not posts:
-                    print(f"❌ 페이지 {current_page}에서 게시글을 찾을 수 없습니다.")
-                    break
-                
-                page_july_posts = []
-                page_non_july_posts = 0
-                
-                for post in posts:
-                    created_time = post.get('created_time', '')
-                    
-                    if is_july_2025(created_time):
-                        page_july_posts.append(post)
-                        consecutive_non_july = 0  # 7월 글을 찾았으므로 카운터 리셋
-                    else:
-                        page_non_july_posts += 1
-                        consecutive_non_july += 1
-                
-                all_july_posts.extend(page_july_posts)
-                
-                print(f"   📅 7월 게시글: {len(page_july_posts)}개")
-                print(f"   📊 누적 7월 게시글: {len(all_july_posts)}개")
-                
-                # 연속으로 50개 이상의 비-7월 글이 나오면 중단
-                if consecutive_non_july >= 50:
-                    print(f"\n⏹️ 연속으로 7월이 아닌 글이 {consecutive_non_july}개 나왔으므로 크롤링을 중단합니다.")
-                    break
-                
-                # 페이지에 7월 글이 하나도 없고, 이미 충분한 7월 글을 수집했다면 중단
-                if len(page_july_posts) == 0 and len(all_july_posts) > 100:
-                    print(f"\n⏹️ 7월 글이 더 이상 없으므로 크롤링을 중단합니다.")
-                    break
-                
-                current_page += 1
-                time.sleep(3)  # 페이지 간 대기
-                
-            except Exception as e:
-                print(f"❌ 페이지 {current_page} 크롤링 중 오류: {e}")
-                current_page += 1
-                time.sleep(5)
-                continue
+        print("\n📋 자유게시판 크롤링 시작...")
+        
+        # 7월 말 글이 있는 페이지를 페이지 번호 탐색으로 찾은 뒤 7월 1일 이전 글이 나올 때까지만 수집
+        max_pages = 50  # 범위 안에서 수집할 최대 페이지 수 (필요에 따라 조정)
+        all_july_posts = crawler.get_board_posts(
+            "free", pages=max_pages, delay=3, since=JULY_START, until=JULY_END
+        )
+        pages_crawled = len({p.get('page') for p in all_july_posts})
         
         print(f"\n🎉 7월 게시글 수집 완료! 총 {len(all_july_posts)}개")
         
@@ -167,25 +66,26 @@ def crawl_july_2025_free_board():
         posts_with_comments = [p for p in all_july_posts if int(p.get('comment_count', '0')) > 0]
         print(f"📊 댓글이 있는 7월 게시글: {len(posts_with_comments)}개")
         
-        # 댓글이 있는 게시글 중 최대 30개 상세 크롤링
-        max_detailed = min(30, len(posts_with_comments))
-        for i, post in enumerate(posts_with_comments[:max_detailed]):
-            if post.get('post_link'):
-                print(f"   📖 {i+1}/{max_detailed} 게시글 상세 정보 수집 중...")
-                detail = crawler.get_post_detail(post['post_link'])
-                if detail:
-                    combined_post = post.copy()
-                    combined_post.update({
-                        'full_content': detail.get('content', ''),
-                        'comments': detail.get('comments', []),
-                        'detailed_comment_count': detail.get('comment_count', 0)
-                    })
-                    july_detailed_posts.append(combined_post)
-                    
-                    comment_count = len(detail.get('comments', []))
-                    print(f"     💬 댓글 {comment_count}개 수집")
+        # 댓글이 있는 게시글 중 최대 30개 상세 크롤링 (동시 4개 / 초당 2회)
+        targets = [p for p in posts_with_comments[:30] if p.get('post_link')]
+        details = crawler.fetch_post_details(
+            [p['post_link'] for p in targets], concurrency=4, rate=2.0
+        )
+        details_by_url = {d['url']: d for d in details}
+        
+        for post in targets:
+            detail = details_by_url.get(post['post_link'])
+            if detail:
+                combined_post = post.copy()
+                combined_post.update({
+                    'full_content': detail.get('content', ''),
+                    'comments': detail.get('comments', []),
+                    'detailed_comment_count': detail.get('comment_count', 0)
+                })
+                july_detailed_posts.append(combined_post)
                 
-                time.sleep(2)  # 요청 간 대기
+                comment_count = len(detail.get('comments', []))
+                print(f"     💬 댓글 {comment_count}개 수집")
         
         # 데이터 저장
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -215,7 +115,7 @@ def crawl_july_2025_free_board():
                     'full_content': p.get('full_content', ''),
                     'author': p.get('author', ''),
                     'created_time': p.get('created_time', ''),
-                    'parsed_datetime': parse_everytime_time(p.get('created_time', '')),
+                    'parsed_datetime': p.get('created_at'),
                     'comment_count': p.get('comment_count', ''),
                     'detailed_comment_count': p.get('detailed_comment_count', 0),
                     'post_link': p.get('post_link', ''),
@@ -232,15 +132,30 @@ def crawl_july_2025_free_board():
                 json.dump(july_detailed_posts, f, ensure_ascii=False, indent=2)
             print(f"📄 상세정보 JSON: {detailed_json}")
         
+        # Parquet 저장 (pyarrow 설치 시): 게시글과 댓글을 글 번호로 연결된 별도 테이블로 저장
+        try:
+            detailed_by_link = {p['post_link']: p for p in july_detailed_posts}
+            with ParquetSink("data/parquet") as sink:
+                sink.write_posts(
+                    [detailed_by_link.get(p.get('post_link'), p) for p in all_july_posts],
+                    board_id='free'
+                )
+                for p in july_detailed_posts:
+                    sink.write_comments(p.get('article_id'), 'free', p.get('comments', []),
+                                        collected_at=p.get('collected_at'))
+            print(f"📄 Parquet: data/parquet (파일 {len(sink.files)}개)")
+        except ImportError as e:
+            print(f"⚠️ Parquet 저장 생략: {e}")
+        
         # 통계 정보 생성
         total_comments = sum(len(p.get('comments', [])) for p in july_detailed_posts)
         
         # 일별 게시글 수 통계
         daily_stats = {}
         for post in all_july_posts:
-            parsed_time = parse_everytime_time(post.get('created_time', ''))
-            if parsed_time:
-                date_key = parsed_time.strftime('%Y-%m-%d')
+            created_at = post.get('created_at')
+            if created_at:
+                date_key = created_at[:10]
                 daily_stats[date_key] = daily_stats.get(date_key, 0) + 1
         
         # 요약 정보
@@ -249,7 +164,7 @@ def crawl_july_2025_free_board():
                 'target_period': '2025년 7월',
                 'board_name': '성남캠 자유게시판',
                 'crawl_completed_at': datetime.now().isoformat(),
-                'pages_crawled': current_page - 1
+                'pages_crawled': pages_crawled
             },
             'statistics': {
                 'total_july_posts': len(all_july_posts),
@@ -280,7 +195,7 @@ def crawl_july_2025_free_board():
         print(f"   - 댓글 있는 게시글: {len(posts_with_comments)}개")
         print(f"   - 상세 수집 게시글: {len(july_detailed_posts)}개")
         print(f"   - 총 수집 댓글: {total_comments}개")
-        print(f"   - 크롤링 페이지: {current_page - 1}페이지")
+        print(f"   - 7월 글이 있는 페이지: {pages_crawled}페이지")
         
         print(f"\n📅 일별 게시글 수:")
         for date, count in sorted(daily_stats.items()):
@@ -300,4 +215,5 @@ def crawl_july_2025_free_board():
 
 
 if __name__ == "__main__":
+    configure_logging()
     crawl_july_2025_free_board()
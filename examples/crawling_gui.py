@@ -11,6 +11,7 @@ from tkinter import ttk, messagebox, filedialog, scrolledtext
 import threading
 import queue
 import subprocess
+import json
 from datetime import datetime
 
 
@@ -234,7 +235,7 @@ class MassiveCrawlingGUI:
                     break
                 
                 if output:
-                    self.output_queue.put(('output', output.strip()))
+                    self.output_queue.put(self.parse_output_line(output.strip()))
             
             # 프로세스 완료 처리
             return_code = process.wait()
@@ -247,6 +248,40 @@ class MassiveCrawlingGUI:
         except Exception as e:
             self.output_queue.put(('error', f'❌ 크롤링 중 오류: {e}'))
     
+    @staticmethod
+    def parse_output_line(line):
+        """
+        크롤러 출력 한 줄을 큐 메시지로 변환
+        
+        CRAWLING_GUI_MODE=1에서는 진행 상황이 한 줄에 JSON 이벤트 하나로 출력되므로
+        ('event', dict)로, JSON이 아닌 줄(print 출력)은 ('output', str)로 전달합니다.
+        """
+        if line.startswith('{'):
+            try:
+                payload = json.loads(line)
+            except ValueError:
+                payload = None
+            if isinstance(payload, dict) and 'message' in payload:
+                return ('event', payload)
+        return ('output', line)
+    
+    def handle_event(self, payload):
+        """구조화 이벤트 처리 (로그 표시 + 진행 상황 갱신)"""
+        self.log_message(payload['message'])
+        
+        name = payload.get('event')
+        board = payload.get('board')
+        if name == 'board_start':
+            self.progress_var.set(f"[{payload.get('index')}/{payload.get('total')}] {board} 크롤링 중...")
+        elif name == 'page_done':
+            self.progress_var.set(
+                f"{board} {payload.get('page')}페이지: {payload.get('posts')}개 ({payload.get('elapsed_ms')}ms)"
+            )
+        elif name == 'board_progress':
+            self.progress_var.set(f"{board} {payload.get('page')}페이지, 누적 {payload.get('posts')}개")
+        elif name == 'board_done':
+            self.progress_var.set(f"{board} 완료: {payload.get('posts')}개")
+    
     def stop_crawling(self):
         """크롤링 중단"""
         self.is_crawling = False
@@ -279,6 +314,8 @@ class MassiveCrawlingGUI:
                 
                 if msg_type == 'output':
                     self.log_message(message)
+                elif msg_type == 'event':
+                    self.handle_event(message)
                 elif msg_type == 'complete':
                     self.log_message(message)
                     self.stop_crawling()
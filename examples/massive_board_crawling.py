@@ -11,27 +11,42 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 # 환경변수 로드
 load_dotenv()
 
-from everytime_crawler import EverytimeCrawler, BOARD_MAP
+from everytime_crawler import BOARD_MAP, DriverPool, RateLimiter, SQLiteStore
+from everytime_crawler.crawl_state import CrawlCheckpoint, HighWaterMarks, split_new_posts
+from everytime_crawler.sinks import JsonlWriter
+from everytime_crawler.columnar import ParquetSink
+from everytime_crawler.timeparse import add_created_at
+from everytime_crawler.metrics import Metrics
+from everytime_crawler.log import configure_logging, event, get_logger
 import time
 import json
 import pandas as pd
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 import threading
-import queue
 import signal
+import logging
+
+logger = get_logger("massive")
 
 
 class MassiveBoardCrawler:
     """대량 게시판 크롤링 전용 클래스"""
     
     def __init__(self):
-        self.crawler = None
+        self.pool = None
         self.total_posts = 0
         self.total_boards = 0
         self.failed_boards = []
         self.success_boards = []
         self.start_time = None
         self.stop_crawling = False
+        self._lock = threading.Lock()  # 병렬 게시판 결과 병합용
+        self.high_water_marks = HighWaterMarks("data/high_water_marks.json")  # 게시판별 최대 글 번호
+        self.checkpoint = CrawlCheckpoint("data/massive_crawl_checkpoint.json")  # 중단 후 재개용
+        self.parquet_sink = None  # parquet_dir 설정 시 게시판/날짜별 Parquet 저장
+        self.store = None  # sqlite_path 설정 시 글 번호 기준 upsert
+        self.metrics = Metrics()  # 단계별 소요 시간/처리 건수 (풀의 모든 크롤러가 공유)
         
         # 안전한 종료를 위한 시그널 핸들러
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -86,16 +101,35 @@ class MassiveBoardCrawler:
                                 max_pages_per_board=None,
                                 delay_between_pages=3,
                                 delay_between_boards=10,
-                                save_interval=50):
+                                save_interval=50,
+                                workers=1,
+                                recycle_after_pages=200,
+                                incremental=False,
+                                resume=False,
+                                parquet_dir=None,
+                                sqlite_path=None,
+                                metrics_file="data/massive_crawl_metrics.json",
+                                metrics_interval=60,
+                                metrics_port=None):
         """
         대량 게시판 데이터 크롤링
         
         Args:
             target_boards (list): 크롤링할 게시판 ID 리스트 (None이면 모든 게시판)
             max_pages_per_board (int): 게시판당 최대 페이지 수 (None이면 제한 없음)
-            delay_between_pages (int): 페이지 간 대기 시간(초)
-            delay_between_boards (int): 게시판 간 대기 시간(초)
-            save_interval (int): 몇 개 게시글마다 중간 저장할지
+            delay_between_pages (int): 같은 게시판의 페이지 요청 간 최소 간격(초, 게시판마다 따로 적용)
+            delay_between_boards (int): 게시판 간 대기 시간(초, workers=1일 때만 사용)
+            save_interval (int): 몇 개 게시글마다 디스크에 fsync할지 (게시글은 페이지마다 바로 파일에 추가됨)
+            workers (int): 병렬로 크롤링할 게시판 수 (로그인된 WebDriver 수)
+            recycle_after_pages (int): WebDriver를 재생성하기 전 처리할 최대 페이지 수
+            incremental (bool): True이면 이전 실행에서 수집한 글 번호에 도달하는 즉시 게시판 크롤링 중단
+            resume (bool): True이면 체크포인트를 읽어 완료된 게시판은 건너뛰고,
+                중단된 게시판은 마지막 페이지 다음부터 같은 출력 파일에 이어서 기록
+            parquet_dir (str): 설정하면 JSONL과 함께 Parquet(게시판/날짜 파티션)으로도 저장 (pyarrow 필요)
+            sqlite_path (str): 설정하면 SQLite DB에 글 번호 기준으로 upsert (페이지당 트랜잭션 1개)
+            metrics_file (str): 단계별 소요 시간/처리 건수 JSON 스냅샷 경로 (None이면 저장 안 함)
+            metrics_interval (float): 스냅샷 저장 간격(초)
+            metrics_port (int): 설정하면 http://127.0.0.1:{port}/metrics 에서 Prometheus 형식으로 제공
         """
         
         if target_boards is None:
@@ -104,79 +138,84 @@ class MassiveBoardCrawler:
         if max_pages_per_board is None:
             max_pages_per_board = 1000  # 안전한 기본값
         
+        workers = max(1, min(workers, len(target_boards)))
+        
         print(f"🚀 대량 게시판 크롤링 시작")
         print(f"📋 대상 게시판: {len(target_boards)}개")
         print(f"📄 게시판당 최대 페이지: {max_pages_per_board}")
         print(f"⏱️ 페이지 간 대기: {delay_between_pages}초")
-        print(f"⏱️ 게시판 간 대기: {delay_between_boards}초")
+        if workers == 1:
+            print(f"⏱️ 게시판 간 대기: {delay_between_boards}초")
+        print(f"🚗 병렬 WebDriver: {workers}개 ({recycle_after_pages}페이지마다 재생성)")
+        if incremental:
+            print("🔖 증분 모드: 이전 실행 이후의 새 글만 수집")
+        if resume:
+            in_progress = [b for b, state in self.checkpoint.boards().items() if state.get('status') == 'in_progress']
+            print(f"⏯️ 재개 모드: 체크포인트에서 이어서 진행 (진행 중이던 게시판: {in_progress or '없음'})")
+        else:
+            self.checkpoint.reset()
         print("=" * 60)
         
         self.start_time = datetime.now()
-        self.crawler = EverytimeCrawler()
+        if parquet_dir:
+            try:
+                # 몇 시간짜리 크롤링: 15분마다 파일을 완성해 중단되어도 그 이전 데이터는 남김
+                self.parquet_sink = ParquetSink(parquet_dir, flush_interval=15 * 60)
+                print(f"🗂️ Parquet 저장: {parquet_dir}")
+            except ImportError as e:
+                print(f"⚠️ {e}")
+        
+        if sqlite_path:
+            self.store = SQLiteStore(sqlite_path)
+            print(f"🗄️ SQLite 저장: {sqlite_path}")
+        
+        self.metrics.reset()
+        metrics_server = None
+        if metrics_file:
+            self.metrics.start_snapshots(metrics_file, interval=metrics_interval)
+        if metrics_port:
+            metrics_server = self.metrics.serve(metrics_port)
+            print(f"📈 메트릭: http://127.0.0.1:{metrics_port}/metrics")
+        
+        self.pool = DriverPool(
+            size=workers,
+            headless=True,  # 헤드리스 모드로 리소스 절약
+            max_pages_per_driver=recycle_after_pages,
+            metrics=self.metrics
+        )
         
         try:
-            # WebDriver 설정 (헤드리스 모드로 리소스 절약)
-            self.crawler.setup_driver(headless=True)
-            
-            # 로그인
-            if not self.crawler.login():
-                print("❌ 로그인 실패! 크롤링을 중단합니다.")
+            try:
+                self.pool.start()
+            except RuntimeError as e:
+                print(f"❌ 로그인 실패! 크롤링을 중단합니다. ({e})")
                 return
             
             print("✅ 로그인 성공!")
             
-            # 각 게시판별 크롤링
-            for board_idx, board_id in enumerate(target_boards, 1):
-                if self.stop_crawling:
-                    print("\n🛑 사용자에 의해 크롤링이 중단되었습니다.")
-                    break
-                
-                board_name = BOARD_MAP.get(board_id, board_id)
-                print(f"\n📋 [{board_idx}/{len(target_boards)}] {board_name} 크롤링 시작...")
-                
-                try:
-                    # 게시판별 크롤링 실행
-                    board_posts = self._crawl_single_board_comprehensive(
-                        board_id, 
-                        max_pages_per_board, 
-                        delay_between_pages,
-                        save_interval
-                    )
-                    
-                    if board_posts:
-                        self.success_boards.append({
-                            'board_id': board_id,
-                            'board_name': board_name,
-                            'post_count': len(board_posts),
-                            'completed_at': datetime.now().isoformat()
-                        })
-                        
-                        self.total_posts += len(board_posts)
-                        print(f"✅ {board_name} 완료: {len(board_posts)}개 게시글")
-                        
-                        # 게시판별 결과 저장
-                        self._save_board_results(board_id, board_posts)
-                        
-                    else:
-                        print(f"❌ {board_name}: 게시글을 찾을 수 없음")
-                        self.failed_boards.append({
-                            'board_id': board_id,
-                            'board_name': board_name,
-                            'error': 'No posts found'
-                        })
-                
-                except Exception as e:
-                    print(f"❌ {board_name} 크롤링 실패: {e}")
-                    self.failed_boards.append({
-                        'board_id': board_id,
-                        'board_name': board_name,
-                        'error': str(e)
-                    })
+            def crawl_board(board_idx, board_id):
+                result = self._crawl_board_with_pool(
+                    board_idx, len(target_boards), board_id,
+                    max_pages_per_board, delay_between_pages, save_interval, incremental
+                )
                 
-                # 게시판 간 대기 (마지막 게시판이 아닌 경우)
-                if board_idx < len(target_boards) and not self.stop_crawling:
+                # 게시판 간 대기 (순차 모드에서 마지막 게시판이 아닌 경우)
+                if workers == 1 and board_idx < len(target_boards) and not self.stop_crawling:
                     print(f"⏳ {delay_between_boards}초 대기 중...")
                     time.sleep(delay_between_boards)
+                
+                return result
+            
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(crawl_board, board_idx, board_id)
+                    for board_idx, board_id in enumerate(target_boards, 1)
+                ]
+                for future in futures:
+                    future.result()
+            
+            if self.stop_crawling:
+                print("\n🛑 사용자에 의해 크롤링이 중단되었습니다.")
             
             # 최종 결과 저장
             self._save_final_summary()
@@ -187,19 +226,157 @@ class MassiveBoardCrawler:
             traceback.print_exc()
             
         finally:
-            if self.crawler and self.crawler.driver:
-                self.crawler.quit()
+            if self.pool:
+                self.pool.close()
+            
+            if self.parquet_sink:
+                self.parquet_sink.close()
+            
+            if self.store:
+                self.store.close()
+            
+            self.metrics.stop_snapshots()
+            if metrics_server is not None:
+                metrics_server.shutdown()
+                metrics_server.server_close()
             
             self._print_final_statistics()
     
-    def _crawl_single_board_comprehensive(self, board_id, max_pages, delay, save_interval):
-        """단일 게시판의 포괄적 크롤링"""
-        all_posts = []
-        page = 1
-        consecutive_empty_pages = 0
+    def _crawl_board_with_pool(self, board_idx, board_total, board_id, max_pages, delay, save_interval,
+                               incremental=False):
+        """풀에서 WebDriver를 빌려 게시판 하나를 크롤링하고 결과를 요약에 합침"""
+        if self.stop_crawling:
+            return
+        
+        board_name = BOARD_MAP.get(board_id, {}).get('name', board_id)
+        logger.info("📋 [%d/%d] %s 크롤링 시작...", board_idx, board_total, board_name,
+                    extra=event('board_start', board=board_id, index=board_idx, total=board_total))
+        
+        state = self._load_resume_state(board_id)
+        if state and state.get('status') == 'completed':
+            logger.info("⏭️ %s: 이전 실행에서 완료됨 (%d개 게시글), 건너뜀", board_name, state.get('post_count', 0),
+                        extra=event('board_skipped', board=board_id, posts=state.get('post_count', 0)))
+            with self._lock:
+                self.success_boards.append({
+                    'board_id': board_id,
+                    'board_name': board_name,
+                    'post_count': state.get('post_count', 0),
+                    'output_file': state.get('output_file'),
+                    'completed_at': state.get('completed_at')
+                })
+                self.total_posts += state.get('post_count', 0)
+            return
+        
+        if state:
+            jsonl_filename = state['output_file']
+            logger.info("⏯️ %s: 페이지 %d부터 재개 (%s)", board_name, state['last_page'] + 1, jsonl_filename,
+                        extra=event('board_resume', board=board_id, page=state['last_page'] + 1))
+        else:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            jsonl_filename = f"data/massive_crawl_{board_id}_{timestamp}.jsonl"
+        
+        try:
+            # 게시글은 페이지마다 바로 파일에 추가 (메모리에 모아 두지 않음)
+            with self.pool.acquire() as crawler, JsonlWriter(jsonl_filename, fsync_every=save_interval) as writer:
+                # 게시판별 크롤링 실행
+                post_count = self._crawl_single_board_comprehensive(
+                    crawler,
+                    board_id, 
+                    max_pages, 
+                    delay,
+                    save_interval,
+                    incremental,
+                    writer,
+                    state
+                )
+            
+            if post_count:
+                with self._lock:
+                    self.success_boards.append({
+                        'board_id': board_id,
+                        'board_name': board_name,
+                        'post_count': post_count,
+                        'output_file': jsonl_filename,
+                        'completed_at': datetime.now().isoformat()
+                    })
+                    self.total_posts += post_count
+                
+                logger.info("✅ %s 완료: %d개 게시글", board_name, post_count,
+                            extra=event('board_done', board=board_id, posts=post_count))
+                
+                # 게시판별 결과 저장
+                self._save_board_results(board_id, jsonl_filename)
+                
+            else:
+                logger.warning("❌ %s: 게시글을 찾을 수 없음", board_name,
+                               extra=event('board_error', board=board_id, error='No posts found'))
+                with self._lock:
+                    self.failed_boards.append({
+                        'board_id': board_id,
+                        'board_name': board_name,
+                        'error': 'No posts found'
+                    })
+        
+        except Exception as e:
+            logger.error("❌ %s 크롤링 실패: %s", board_name, e, extra=event('board_error', board=board_id, error=str(e)))
+            with self._lock:
+                self.failed_boards.append({
+                    'board_id': board_id,
+                    'board_name': board_name,
+                    'error': str(e)
+                })
+    
+    def _load_resume_state(self, board_id):
+        """
+        체크포인트에서 게시판 진행 상황을 읽고 출력 파일을 체크포인트 시점으로 되돌림
+        
+        Returns:
+            dict: 진행 상황 (새로 시작해야 하면 None)
+        """
+        state = self.checkpoint.get(board_id)
+        if not state or state.get('status') == 'completed':
+            return state
+        
+        output_file = state.get('output_file')
+        offset = state.get('output_offset', 0)
+        if not output_file or not os.path.exists(output_file) or os.path.getsize(output_file) < offset:
+            # 체크포인트 이후 파일이 유실된 경우 처음부터 다시 수집
+            print(f"⚠️ [{board_id}] 체크포인트의 출력 파일을 사용할 수 없어 처음부터 다시 시작합니다.")
+            return None
+        
+        # 마지막 체크포인트 이후에 일부만 기록된 페이지는 잘라냄
+        os.truncate(output_file, offset)
+        return state
+    
+    def _crawl_single_board_comprehensive(self, crawler, board_id, max_pages, delay, save_interval,
+                                          incremental=False, writer=None, resume_state=None):
+        """
+        단일 게시판의 포괄적 크롤링
+        
+        Args:
+            resume_state (dict): 체크포인트의 게시판 진행 상황 (있으면 다음 페이지부터 이어서 진행)
+        
+        Returns:
+            int: 수집한 게시글 수 (게시글은 writer에 페이지 단위로 기록)
+        """
+        state = resume_state or {}
+        post_count = state.get('post_count', 0)
+        last_synced = post_count
+        max_article_id = state.get('max_article_id')
+        if 'since_id' in state:
+            since_id = state['since_id']
+        else:
+            since_id = self.high_water_marks.get(board_id) if incremental else None
+        reached = False
+        page = state.get('last_page', 0) + 1
+        consecutive_empty_pages = state.get('empty_pages', 0)
         max_empty_pages = 5  # 연속으로 빈 페이지가 5개 나오면 중단
+        limiter = RateLimiter.from_delay(delay)  # 게시판별 속도 제한
         
-        print(f"   📄 페이지별 크롤링 시작 (최대 {max_pages}페이지)")
+        logger.info("   📄 [%s] 페이지별 크롤링 시작 (최대 %d페이지)", board_id, max_pages)
+        if since_id is not None:
+            logger.info("   🔖 [%s] 글 번호 %s 이후만 수집", board_id, since_id,
+                        extra=event('incremental', board=board_id, since_id=since_id))
         
         while page <= max_pages and consecutive_empty_pages < max_empty_pages:
             if self.stop_crawling:
@@ -207,28 +384,58 @@ class MassiveBoardCrawler:
             
             try:
                 # 현재 페이지 크롤링
-                page_posts = self.crawler.get_board_posts(
+                self.metrics.observe('throttle', limiter.acquire())
+                page_started = time.perf_counter()
+                page_posts = crawler.get_board_posts(
                     board_id=board_id,
                     pages=1,  # 한 페이지씩 처리
-                    delay=delay
+                    delay=0,
+                    start_page=page
                 )
+                self.pool.record_page(crawler)
+                page_posts, reached = split_new_posts(page_posts, since_id)
                 
                 if page_posts:
-                    all_posts.extend(page_posts)
+                    with self.metrics.stage('persist'):
+                        if writer is not None:
+                            writer.write_many(page_posts)
+                        if self.parquet_sink is not None:
+                            self.parquet_sink.write_posts(page_posts, board_id=board_id)
+                        if self.store is not None:
+                            self.store.upsert_posts(page_posts, board_id=board_id)
+                    post_count += len(page_posts)
+                    ids = [p['article_id'] for p in page_posts if p.get('article_id') is not None]
+                    if ids:
+                        max_article_id = max(ids + [max_article_id or 0])
                     consecutive_empty_pages = 0
-                    print(f"     페이지 {page}: {len(page_posts)}개 게시글")
+                    logger.info("     [%s] 페이지 %d: %d개 게시글", board_id, page, len(page_posts),
+                                extra=event('page_done', board=board_id, page=page, posts=len(page_posts),
+                                            elapsed_ms=round((time.perf_counter() - page_started) * 1000, 1)))
                     
-                    # 중간 저장 (메모리 관리)
-                    if len(all_posts) % save_interval == 0:
-                        self._save_intermediate_results(board_id, all_posts[-save_interval:])
+                    # 중간 저장 (디스크 동기화)
+                    if writer is not None and post_count - last_synced >= save_interval:
+                        self._save_intermediate_results(board_id, writer)
+                        last_synced = post_count
                     
                 else:
                     consecutive_empty_pages += 1
-                    print(f"     페이지 {page}: 빈 페이지 ({consecutive_empty_pages}/{max_empty_pages})")
+                    logger.info("     [%s] 페이지 %d: 빈 페이지 (%d/%d)", board_id, page,
+                                consecutive_empty_pages, max_empty_pages,
+                                extra=event('page_empty', board=board_id, page=page, empty_pages=consecutive_empty_pages))
+                
+                # 페이지 처리 완료 기록 (재개 시 다음 페이지부터)
+                self._save_checkpoint(board_id, page, post_count, max_article_id, since_id,
+                                      consecutive_empty_pages, writer)
+                
+                if reached:
+                    logger.info("     🔖 [%s] 이미 수집한 글에 도달, 크롤링 중단", board_id,
+                                extra=event('reached_mark', board=board_id, page=page))
+                    break
                 
                 # 2년치 데이터인지 확인 (날짜 기반 중단)
                 if self._should_stop_by_date(page_posts):
-                    print(f"     📅 2년 이전 데이터 도달, 크롤링 중단")
+                    logger.info("     📅 [%s] 2년 이전 데이터 도달, 크롤링 중단", board_id,
+                                extra=event('reached_date_limit', board=board_id, page=page))
                     break
                 
                 page += 1
@@ -236,87 +443,85 @@ class MassiveBoardCrawler:
                 # 진행률 표시
                 if page % 10 == 0:
                     elapsed = datetime.now() - self.start_time
-                    print(f"     📊 진행: {page}페이지, 총 {len(all_posts)}개 게시글, 경과시간: {elapsed}")
+                    logger.info("     📊 [%s] 진행: %d페이지, 총 %d개 게시글, 경과시간: %s", board_id, page, post_count, elapsed,
+                                extra=event('board_progress', board=board_id, page=page, posts=post_count,
+                                            elapsed_ms=round(elapsed.total_seconds() * 1000, 1)))
                 
             except Exception as e:
-                print(f"     ❌ 페이지 {page} 크롤링 실패: {e}")
+                logger.error("     ❌ [%s] 페이지 %d 크롤링 실패: %s", board_id, page, e,
+                             extra=event('page_error', board=board_id, page=page, error=str(e)))
+                self.metrics.inc('errors')
                 consecutive_empty_pages += 1
                 page += 1
                 continue
         
-        print(f"   ✅ 게시판 크롤링 완료: 총 {len(all_posts)}개 게시글")
-        return all_posts
+        if self.stop_crawling:
+            # 중단된 게시판은 체크포인트에 진행 중으로 남겨 resume=True로 이어서 진행
+            logger.info("   ⏸️ [%s] 페이지 %d까지 처리 후 중단 (resume=True로 재개 가능)", board_id, page - 1,
+                        extra=event('board_paused', board=board_id, page=page - 1))
+            return post_count
+        
+        # 이전 mark까지 빈틈없이 수집한 경우에만 mark를 올림
+        if reached or since_id is None:
+            self.high_water_marks.advance(board_id, max_article_id)
+        
+        self.checkpoint.update(board_id, status='completed', completed_at=datetime.now().isoformat())
+        
+        logger.info("   ✅ [%s] 게시판 크롤링 완료: 총 %d개 게시글", board_id, post_count)
+        return post_count
+    
+    def _save_checkpoint(self, board_id, page, post_count, max_article_id, since_id, empty_pages, writer):
+        """페이지 하나를 처리한 직후의 진행 상황 기록"""
+        self.checkpoint.update(
+            board_id,
+            status='in_progress',
+            last_page=page,
+            post_count=post_count,
+            max_article_id=max_article_id,
+            since_id=since_id,
+            empty_pages=empty_pages,
+            output_file=writer.path if writer is not None else None,
+            output_offset=writer.offset if writer is not None else 0,
+            updated_at=datetime.now().isoformat()
+        )
     
     def _should_stop_by_date(self, posts):
-        """날짜 기반으로 크롤링 중단 여부 결정"""
+        """날짜 기반으로 크롤링 중단 여부 결정 (게시글의 절대 작성 시각 created_at 사용)"""
         if not posts:
             return False
         
         # 2년 전 날짜 계산
         two_years_ago = datetime.now() - timedelta(days=730)
         
+        if any('created_at' not in post for post in posts):
+            add_created_at(posts)
+        
         for post in posts:
-            created_time = post.get('created_time', '')
-            if created_time:
-                try:
-                    # 에브리타임 날짜 형식 파싱 시도
-                    # 예: "07/02", "2023/07/02" 등
-                    if '/' in created_time:
-                        parts = created_time.split('/')
-                        if len(parts) == 2:  # "MM/DD" 형식
-                            # 현재 연도 기준으로 파싱
-                            current_year = datetime.now().year
-                            month, day = int(parts[0]), int(parts[1])
-                            post_date = datetime(current_year, month, day)
-                            
-                            # 만약 미래 날짜라면 작년 데이터로 간주
-                            if post_date > datetime.now():
-                                post_date = datetime(current_year - 1, month, day)
-                            
-                        elif len(parts) == 3:  # "YYYY/MM/DD" 형식
-                            year, month, day = int(parts[0]), int(parts[1]), int(parts[2])
-                            post_date = datetime(year, month, day)
-                        else:
-                            continue
-                        
-                        # 2년 이전 데이터인지 확인
-                        if post_date < two_years_ago:
-                            return True
-                            
-                except (ValueError, IndexError):
-                    continue
+            created_at = post.get('created_at')
+            if created_at and datetime.fromisoformat(created_at) < two_years_ago:
+                return True
         
         return False
     
-    def _save_intermediate_results(self, board_id, posts):
-        """중간 결과 저장 (메모리 관리용)"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"data/intermediate_{board_id}_{timestamp}.json"
-        
+    def _save_intermediate_results(self, board_id, writer):
+        """중간 결과 저장 (이미 파일에 추가된 게시글을 디스크까지 fsync)"""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(posts, f, ensure_ascii=False, indent=2)
+            writer.sync()
         except Exception as e:
-            print(f"     ⚠️ 중간 저장 실패: {e}")
+            logger.warning("     ⚠️ [%s] 중간 저장 실패: %s", board_id, e)
     
-    def _save_board_results(self, board_id, posts):
-        """게시판별 최종 결과 저장"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # JSON 저장
-        json_filename = f"data/massive_crawl_{board_id}_{timestamp}.json"
-        try:
-            with open(json_filename, 'w', encoding='utf-8') as f:
-                json.dump(posts, f, ensure_ascii=False, indent=2)
-            print(f"     💾 JSON 저장: {json_filename}")
-        except Exception as e:
-            print(f"     ❌ JSON 저장 실패: {e}")
+    def _save_board_results(self, board_id, jsonl_filename):
+        """게시판별 최종 결과 저장 (JSONL은 크롤링 중 기록됨, CSV는 청크 단위로 변환)"""
+        print(f"     💾 JSONL 저장: {jsonl_filename}")
         
         # CSV 저장
-        csv_filename = f"data/massive_crawl_{board_id}_{timestamp}.csv"
+        csv_filename = jsonl_filename[:-len('.jsonl')] + '.csv'
         try:
-            df = pd.DataFrame(posts)
-            df.to_csv(csv_filename, index=False, encoding='utf-8-sig')
+            chunks = pd.read_json(jsonl_filename, lines=True, chunksize=1000,
+                                  dtype=False, convert_dates=False)
+            with open(csv_filename, 'w', encoding='utf-8-sig', newline='') as f:
+                for idx, df in enumerate(chunks):
+                    df.to_csv(f, index=False, header=(idx == 0))
             print(f"     💾 CSV 저장: {csv_filename}")
         except Exception as e:
             print(f"     ❌ CSV 저장 실패: {e}")
@@ -340,7 +545,8 @@ class MassiveBoardCrawler:
                 'failed_boards': len(self.failed_boards)
             },
             'successful_boards': self.success_boards,
-            'failed_boards': self.failed_boards
+            'failed_boards': self.failed_boards,
+            'metrics': self.metrics.snapshot()
         }
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -380,10 +586,20 @@ class MassiveBoardCrawler:
             avg_time_per_post = duration.total_seconds() / self.total_posts
             print(f"\n📈 평균 게시글당 소요시간: {avg_time_per_post:.2f}초")
         
+        stages = self.metrics.snapshot()['stages']
+        if stages:
+            print("\n⏱️ 단계별 소요 시간:")
+            for stage, stats in stages.items():
+                print(f"   {stage}: 총 {stats['sum']:.1f}초 ({stats['count']}회, 평균 {stats['avg']:.3f}초, 최대 {stats['max']:.2f}초)")
+        
         print("\n💾 저장된 파일들:")
-        print("   data/massive_crawl_*.json - 게시판별 JSON 데이터")
+        print("   data/massive_crawl_*.jsonl - 게시판별 JSON Lines 데이터 (한 줄에 게시글 하나)")
         print("   data/massive_crawl_*.csv - 게시판별 CSV 데이터")
         print("   data/massive_crawl_summary_*.json - 크롤링 요약")
+        print("   data/massive_crawl_checkpoint.json - 재개용 체크포인트 (resume=True)")
+        print("   data/massive_crawl_metrics.json - 단계별 소요 시간/처리 건수 스냅샷")
+        if self.parquet_sink:
+            print(f"   {self.parquet_sink.root_dir}/posts/board_id=*/date=*/*.parquet - Parquet 데이터")
 
 
 def main():
@@ -408,6 +624,16 @@ def main():
     response = input("대량 크롤링을 시작하시겠습니까? (y/N): ").strip().lower()
     
     if response in ['y', 'yes']:
+        # 이전에 중단된 크롤링이 있으면 이어서 진행할지 확인
+        resume = False
+        in_progress = [
+            board_id for board_id, state in massive_crawler.checkpoint.boards().items()
+            if state.get('status') == 'in_progress'
+        ]
+        if in_progress:
+            print(f"\n⏯️ 중단된 크롤링이 있습니다: {', '.join(in_progress)}")
+            resume = input("이어서 진행하시겠습니까? (Y/n): ").strip().lower() not in ['n', 'no']
+        
         print("\n🚀 대량 크롤링을 시작합니다...")
         print("언제든지 Ctrl+C를 눌러 안전하게 중단할 수 있습니다.")
         
@@ -417,7 +643,9 @@ def main():
             max_pages_per_board=500,  # 게시판당 최대 500페이지 (2년치 추정)
             delay_between_pages=3,  # 페이지 간 3초 대기
             delay_between_boards=10,  # 게시판 간 10초 대기
-            save_interval=100  # 100개 게시글마다 중간 저장
+            save_interval=100,  # 100개 게시글마다 중간 저장
+            workers=4,  # 게시판 4개 병렬 크롤링
+            resume=resume  # 체크포인트에서 이어서 진행
         )
         
     else:
@@ -440,7 +668,32 @@ def quick_test_crawling():
     )
 
 
+def setup_logging():
+    """콘솔 로그 설정 (CRAWLING_GUI_MODE=1이면 한 줄에 JSON 이벤트 하나)"""
+    configure_logging()
+    # 페이지 진행 상황은 대량 크롤링 루프가 기록하므로 라이브러리 로그는 경고 이상만 출력
+    get_logger("everytime_crawler.crawler").setLevel(logging.WARNING)
+
+
+def gui_crawling():
+    """GUI(crawling_gui.py)에서 실행: 입력 없이 환경변수(MAX_PAGES, DELAY, TARGET_BOARDS) 설정으로 크롤링"""
+    target_boards = os.getenv('TARGET_BOARDS')
+    massive_crawler = MassiveBoardCrawler()
+    massive_crawler.crawl_massive_board_data(
+        target_boards=[b for b in target_boards.split(',') if b in BOARD_MAP] or None if target_boards else None,
+        max_pages_per_board=int(os.getenv('MAX_PAGES', '500')),
+        delay_between_pages=float(os.getenv('DELAY', '3')),
+        save_interval=100
+    )
+
+
 if __name__ == "__main__":
+    setup_logging()
+    
+    if os.getenv('CRAWLING_GUI_MODE') == '1':
+        gui_crawling()
+        sys.exit(0)
+    
     print("선택하세요:")
     print("1. 전체 대량 크롤링 (2년치)")
     print("2. 빠른 테스트 크롤링")
@@ -11,7 +11,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 # 환경변수 로드
 load_dotenv()
 
-from everytime_crawler import EverytimeCrawler
+from everytime_crawler import EverytimeCrawler, configure_logging
 import time
 import json
 import pandas as pd
@@ -36,6 +36,9 @@ def massive_board_crawling_with_comments():
         
         print("✅ 로그인 성공!")
         
+        # 상세 페이지는 로그인 쿠키를 복사한 HTTP 세션으로 동시에 수집
+        crawler.sync_session_cookies()
+        
         # 크롤링할 게시판 목록
         boards_to_crawl = [
             ("free", "성남캠 자유게시판", 5),     # 5페이지
@@ -63,24 +66,26 @@ def massive_board_crawling_with_comments():
                     posts_with_comments = [p for p in posts if int(p.get('comment_count', '0')) > 0]
                     print(f"📊 댓글이 있는 게시글: {len(posts_with_comments)}개")
                     
-                    # 댓글이 있는 게시글만 상세 크롤링 (최대 10개)
-                    for i, post in enumerate(posts_with_comments[:10]):
-                        if post.get('post_link'):
-                            print(f"   📖 {i+1}/{min(10, len(posts_with_comments))} 게시글 상세 정보 수집 중...")
-                            detail = crawler.get_post_detail(post['post_link'])
-                            if detail:
-                                combined_post = post.copy()
-                                combined_post.update({
-                                    'full_content': detail.get('content', ''),
-                                    'comments': detail.get('comments', []),
-                                    'detailed_comment_count': detail.get('comment_count', 0)
-                                })
-                                detailed_posts.append(combined_post)
-                                
-                                comment_count = len(detail.get('comments', []))
-                                print(f"     💬 댓글 {comment_count}개 수집")
+                    # 댓글이 있는 게시글만 상세 크롤링 (최대 10개, 동시 4개 / 초당 2회)
+                    targets = [p for p in posts_with_comments[:10] if p.get('post_link')]
+                    details = crawler.fetch_post_details(
+                        [p['post_link'] for p in targets], concurrency=4, rate=2.0
+                    )
+                    details_by_url = {d['url']: d for d in details}
+                    
+                    for post in targets:
+                        detail = details_by_url.get(post['post_link'])
+                        if detail:
+                            combined_post = post.copy()
+                            combined_post.update({
+                                'full_content': detail.get('content', ''),
+                                'comments': detail.get('comments', []),
+                                'detailed_comment_count': detail.get('comment_count', 0)
+                            })
+                            detailed_posts.append(combined_post)
                             
-                            time.sleep(2)  # 요청 간 대기
+                            comment_count = len(detail.get('comments', []))
+                            print(f"     💬 댓글 {comment_count}개 수집")
                     
                     # 데이터 저장
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -195,4 +200,5 @@ def massive_board_crawling_with_comments():
 
 
 if __name__ == "__main__":
+    configure_logging()
     massive_board_crawling_with_comments()
@@ -11,7 +11,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 # 환경변수 로드
 load_dotenv()
 
-from everytime_crawler import EverytimeCrawler
+from everytime_crawler import EverytimeCrawler, configure_logging
 import time
 from datetime import datetime
 
@@ -167,6 +167,7 @@ def simple_board_crawling():
 
 
 if __name__ == "__main__":
+    configure_logging()
     # 환경변수 확인
     if not os.path.exists('.env'):
         print("❌ .env 파일이 없습니다!")
@@ -19,6 +19,14 @@ __description__ = "에브리타임에서 강의 시간표, 게시판 글 등을
 
 from .crawler import EverytimeCrawler
 from .utils import DataManager, TimetableAnalyzer, BoardAnalyzer, ScheduledCrawler
+from .rate_limiter import RateLimiter
+from .driver_pool import DriverPool
+from .session_store import SessionStore
+from .storage import SQLiteStore
+from .metrics import Metrics
+from .log import configure_logging
+from .timeslots import TimeSlotIndex
+from .catalogue import CatalogueCrawler
 
 # 게시판 ID 매핑 (실제 에브리타임 URL 기준)
 BOARD_MAP = {
@@ -42,6 +50,14 @@ __all__ = [
     'TimetableAnalyzer',
     'BoardAnalyzer',
     'ScheduledCrawler',
+    'RateLimiter',
+    'DriverPool',
+    'SessionStore',
+    'SQLiteStore',
+    'Metrics',
+    'configure_logging',
+    'TimeSlotIndex',
+    'CatalogueCrawler',
     'BOARD_MAP',
     'BOARD_NAMES'
 ]
@@ -2,13 +2,20 @@
 에브리타임 게시판 크롤링 전용 모듈
 """
 
-import time
 import json
+import time
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
+from .rate_limiter import RateLimiter
+from .waits import BOARD_READY_SELECTORS, POST_DETAIL_SELECTORS
+from .crawl_state import extract_article_id
+from .timeparse import add_created_at
+from .log import get_logger, event, log_page_done, log_post_done
+
+logger = get_logger(__name__)
 
 
 class BoardCrawler:
@@ -24,6 +31,9 @@ class BoardCrawler:
         self.crawler = crawler_instance
         self.driver = crawler_instance.driver
         self.base_url = crawler_instance.base_url
+        self.waiter = crawler_instance.waiter
+        self.metrics = crawler_instance.metrics
+        self.selector_cache = crawler_instance.selector_cache
         
         # 게시판 ID 매핑
         self.board_map = {
@@ -44,108 +54,130 @@ class BoardCrawler:
         Args:
             board_id (str): 게시판 ID (free, secret, freshman 등)
             pages (int): 크롤링할 페이지 수
-            delay (int): 페이지 간 대기 시간(초)
+            delay (int): 페이지 요청 간 최소 간격(초, 속도 제한 전용)
             
         Returns:
             list: 게시글 정보 리스트
         """
-        print(f"🔍 '{self.board_map.get(board_id, board_id)}' 게시판 크롤링 시작...")
+        logger.info("🔍 '%s' 게시판 크롤링 시작...", self.board_map.get(board_id, board_id),
+                    extra=event('board_start', board=board_id, pages=pages))
+        started = time.perf_counter()
         
         all_posts = []
+        limiter = RateLimiter.from_delay(delay)
         
         try:
-            # 게시판 메인 페이지로 이동
             board_url = f"{self.base_url}/{board_id}"
-            self.driver.get(board_url)
-            time.sleep(3)
-            
-            print(f"📍 현재 URL: {self.driver.current_url}")
             
             for page in range(1, pages + 1):
-                print(f"📄 페이지 {page}/{pages} 크롤링 중...")
+                logger.debug("📄 페이지 %d/%d 크롤링 중...", page, pages)
                 
-                # 페이지 이동 (첫 페이지가 아닌 경우)
-                if page > 1:
-                    page_url = f"{board_url}?page={page}"
+                # 페이지 이동 (delay는 페이지 간 최소 간격으로만 사용)
+                self.metrics.observe('throttle', limiter.acquire())
+                page_started = time.perf_counter()
+                page_url = board_url if page == 1 else f"{board_url}?page={page}"
+                with self.metrics.stage('navigation'):
                     self.driver.get(page_url)
-                    time.sleep(delay)
+                with self.metrics.stage('wait'):
+                    self.waiter.for_any(BOARD_READY_SELECTORS, "board_list")
+                
+                if page == 1:
+                    logger.debug("📍 현재 URL: %s", self.driver.current_url)
                 
                 # 페이지의 게시글 추출
                 posts = self._extract_posts_from_page(board_id, page)
                 all_posts.extend(posts)
-                
-                print(f"✅ 페이지 {page}에서 {len(posts)}개 게시글 수집")
+                self.metrics.inc('posts', len(posts))
+                log_page_done(logger, board_id, page, len(posts), page_started)
                 
         except Exception as e:
-            print(f"❌ 게시판 크롤링 중 오류 발생: {e}")
+            logger.error("❌ 게시판 크롤링 중 오류 발생: %s", e, extra=event('board_error', board=board_id))
+            self.metrics.inc('errors')
             self._save_debug_info(board_id)
         
-        print(f"🎉 총 {len(all_posts)}개 게시글 수집 완료!")
+        logger.info("🎉 총 %d개 게시글 수집 완료!", len(all_posts),
+                    extra=event('board_done', board=board_id, posts=len(all_posts),
+                                elapsed_ms=round((time.perf_counter() - started) * 1000, 1)))
         return all_posts
     
     def _extract_posts_from_page(self, board_id, page_num):
-        """현재 페이지에서 게시글 정보 추출"""
-        posts = []
-        
+        """현재 페이지에서 게시글 정보 추출 (page_source를 한 번만 가져와 lxml로 파싱)"""
         try:
             # 페이지 로딩 대기
             WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
             
-            # 에브리타임 게시판 구조 분석을 위한 다양한 셀렉터 시도
-            post_selectors = [
-                "article.list",           # 일반적인 게시글 구조
-                ".article",               # 기본 article 클래스
-                "tr.list",               # 테이블 형태 게시판
-                ".board-item",           # 커스텀 게시판 아이템
-                ".post-item",            # 포스트 아이템
-                ".content-wrapper a",    # 링크 형태 게시글
-                ".list-item"             # 리스트 아이템
-            ]
-            
-            post_elements = []
-            used_selector = None
-            
-            for selector in post_selectors:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    post_elements = elements
-                    used_selector = selector
-                    print(f"✅ '{selector}' 셀렉터로 {len(elements)}개 요소 발견")
-                    break
-            
-            if not post_elements:
-                print("⚠️ 게시글 요소를 찾을 수 없습니다.")
-                return posts
-            
-            # 각 게시글에서 정보 추출
-            for idx, element in enumerate(post_elements[:20]):  # 상위 20개만 처리
-                try:
-                    post_info = self._extract_post_info(element, used_selector)
-                    if post_info:
-                        post_info['board_id'] = board_id
-                        post_info['page'] = page_num
-                        post_info['collected_at'] = datetime.now().isoformat()
-                        posts.append(post_info)
-                
-                except Exception as e:
-                    print(f"⚠️ 게시글 {idx+1} 추출 중 오류: {e}")
-                    continue
+            # 게시글마다 outerHTML을 요청하지 않고 전체 HTML을 한 번에 파싱 (page_source 읽기까지 parse 단계 하나로 기록)
+            with self.metrics.stage('parse'):
+                html = self.driver.page_source
+                return self._parse_posts_html(html, board_id, page_num)
         
         except Exception as e:
-            print(f"❌ 페이지 파싱 중 오류: {e}")
+            logger.error("❌ 페이지 파싱 중 오류: %s", e, extra=event('page_error', board=board_id, page=page_num))
+            self.metrics.inc('errors')
+            return []
+    
+    def _parse_posts_html(self, html, board_id, page_num):
+        """목록 페이지 HTML에서 게시글 정보 추출"""
+        posts = []
+        soup = BeautifulSoup(html, 'lxml')
+        
+        # 에브리타임 게시판 구조 분석을 위한 다양한 셀렉터 시도
+        post_selectors = [
+            "article.list",           # 일반적인 게시글 구조
+            ".article",               # 기본 article 클래스
+            "tr.list",               # 테이블 형태 게시판
+            ".board-item",           # 커스텀 게시판 아이템
+            ".post-item",            # 포스트 아이템
+            ".content-wrapper a",    # 링크 형태 게시글
+            ".list-item"             # 리스트 아이템
+        ]
+        
+        # 게시판별로 이전에 성공한 셀렉터를 먼저 조회 (결과가 없을 때만 후보 전체를 다시 탐색)
+        used_selector, post_elements = self.selector_cache.find(('board_posts', board_id), post_selectors, soup.select)
+        if used_selector:
+            logger.debug("✅ '%s' 셀렉터로 %d개 요소 발견", used_selector, len(post_elements))
+        
+        if not post_elements:
+            logger.warning("⚠️ 게시글 요소를 찾을 수 없습니다.", extra=event('no_posts', board=board_id, page=page_num))
+            return posts
+        
+        # 각 게시글에서 정보 추출
+        for idx, element in enumerate(post_elements[:20]):  # 상위 20개만 처리
+            try:
+                post_info = self._parse_post_info(element, used_selector)
+                if post_info:
+                    post_info['board_id'] = board_id
+                    post_info['page'] = page_num
+                    post_info['collected_at'] = datetime.now().isoformat()
+                    posts.append(post_info)
+            
+            except Exception as e:
+                logger.warning("⚠️ 게시글 %d 추출 중 오류: %s", idx + 1, e,
+                               extra=event('post_error', board=board_id, page=page_num))
+                continue
+        
+        # 상대 시간("3분 전", "07/01")을 수집 시각 기준 절대 시각으로 한 번에 변환
+        add_created_at(posts)
         
         return posts
     
     def _extract_post_info(self, element, selector_used):
-        """개별 게시글에서 정보 추출"""
+        """개별 게시글(WebElement)에서 정보 추출"""
+        try:
+            soup = BeautifulSoup(element.get_attribute('outerHTML'), 'html.parser')
+            return self._parse_post_info(soup, selector_used)
+        except Exception as e:
+            logger.warning("⚠️ 게시글 정보 추출 중 오류: %s", e)
+        
+        return None
+    
+    def _parse_post_info(self, soup, selector_used):
+        """파싱된 게시글 노드(BeautifulSoup)에서 정보 추출"""
         post_info = {}
         
         try:
-            # BeautifulSoup으로 더 정확한 파싱
-            soup = BeautifulSoup(element.get_attribute('outerHTML'), 'html.parser')
-            
             # 제목 추출 - 다양한 패턴 시도
             title_selectors = [
                 '.title',
@@ -220,8 +252,8 @@ class BoardCrawler:
                         comment_count = numbers[0]
                         break
             
-            # 게시글 링크 추출
-            link_elem = soup.select_one('a[href]')
+            # 게시글 링크 추출 (셀렉터가 링크 자체를 가리키는 경우 포함)
+            link_elem = soup if soup.name == 'a' and soup.get('href') else soup.select_one('a[href]')
             post_link = None
             if link_elem:
                 href = link_elem.get('href')
@@ -259,13 +291,14 @@ class BoardCrawler:
                     'comment_count': comment_count,
                     'view_count': view_count,
                     'post_link': post_link,
+                    'article_id': extract_article_id(post_link),
                     'selector_used': selector_used
                 }
                 
                 return post_info
         
         except Exception as e:
-            print(f"⚠️ 게시글 정보 추출 중 오류: {e}")
+            logger.warning("⚠️ 게시글 정보 추출 중 오류: %s", e)
         
         return None
     
@@ -280,48 +313,54 @@ class BoardCrawler:
             dict: 게시글 상세 정보
         """
         try:
-            print(f"📖 게시글 상세 정보 크롤링: {post_url}")
-            
-            self.driver.get(post_url)
-            time.sleep(2)
-            
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            
-            # 게시글 내용 추출
-            content_selectors = [
-                '.content',
-                '.article-content',
-                '.post-content',
-                '.text',
-                '.body',
-                'p'
-            ]
-            
-            content = ""
-            for content_sel in content_selectors:
-                content_elem = soup.select_one(content_sel)
-                if content_elem:
-                    content = content_elem.get_text(strip=True)
-                    if content and len(content) > 10:
+            logger.debug("📖 게시글 상세 정보 크롤링: %s", post_url)
+            started = time.perf_counter()
+            
+            with self.metrics.stage('navigation'):
+                self.driver.get(post_url)
+            with self.metrics.stage('wait'):
+                self.waiter.for_any(POST_DETAIL_SELECTORS, "post_detail")
+            with self.metrics.stage('parse'):
+                html = self.driver.page_source
+                soup = BeautifulSoup(html, 'html.parser')
+            
+                # 게시글 내용 추출
+                content_selectors = [
+                    '.content',
+                    '.article-content',
+                    '.post-content',
+                    '.text',
+                    '.body',
+                    'p'
+                ]
+            
+                content = ""
+                for content_sel in content_selectors:
+                    content_elem = soup.select_one(content_sel)
+                    if content_elem:
+                        content = content_elem.get_text(strip=True)
+                        if content and len(content) > 10:
+                            break
+            
+                # 댓글 추출
+                comments = []
+                comment_selectors = [
+                    '.comment',
+                    '.reply', 
+                    '.comment-item',
+                    '.reply-item'
+                ]
+            
+                for comment_sel in comment_selectors:
+                    comment_elems = soup.select(comment_sel)
+                    if comment_elems:
+                        for comment_elem in comment_elems:
+                            comment_text = comment_elem.get_text(strip=True)
+                            if comment_text and len(comment_text) > 2:
+                                comments.append(comment_text)
                         break
             
-            # 댓글 추출
-            comments = []
-            comment_selectors = [
-                '.comment',
-                '.reply', 
-                '.comment-item',
-                '.reply-item'
-            ]
-            
-            for comment_sel in comment_selectors:
-                comment_elems = soup.select(comment_sel)
-                if comment_elems:
-                    for comment_elem in comment_elems:
-                        comment_text = comment_elem.get_text(strip=True)
-                        if comment_text and len(comment_text) > 2:
-                            comments.append(comment_text)
-                    break
+            self.metrics.inc('comments', len(comments))
             
             detail_info = {
                 'url': post_url,
@@ -331,11 +370,13 @@ class BoardCrawler:
                 'collected_at': datetime.now().isoformat()
             }
             
-            print(f"✅ 게시글 상세 정보 수집 완료 (댓글 {len(comments)}개)")
+            log_post_done(logger, extract_article_id(post_url), len(comments), started)
             return detail_info
             
         except Exception as e:
-            print(f"❌ 게시글 상세 정보 크롤링 중 오류: {e}")
+            logger.error("❌ 게시글 상세 정보 크롤링 중 오류: %s (%s)", post_url, e,
+                         extra=event('post_error', post_id=extract_article_id(post_url)))
+            self.metrics.inc('errors')
             return None
     
     def save_posts_to_csv(self, posts, filename=None):
@@ -351,12 +392,14 @@ class BoardCrawler:
         
         try:
             import pandas as pd
-            df = pd.DataFrame(posts)
-            df.to_csv(filename, index=False, encoding='utf-8-sig')
+            with self.metrics.stage('persist'):
+                df = pd.DataFrame(posts)
+                df.to_csv(filename, index=False, encoding='utf-8-sig')
             print(f"💾 게시글 {len(posts)}개가 '{filename}'에 저장되었습니다.")
             
         except Exception as e:
             print(f"❌ CSV 저장 중 오류: {e}")
+            self.metrics.inc('errors')
     
     def save_posts_to_json(self, posts, filename=None):
         """게시글 목록을 JSON 파일로 저장"""
@@ -370,12 +413,13 @@ class BoardCrawler:
             filename = f"data/board_{board_id}_{timestamp}.json"
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
+            with self.metrics.stage('persist'), open(filename, 'w', encoding='utf-8') as f:
                 json.dump(posts, f, ensure_ascii=False, indent=2)
             print(f"💾 게시글 {len(posts)}개가 '{filename}'에 저장되었습니다.")
             
         except Exception as e:
             print(f"❌ JSON 저장 중 오류: {e}")
+            self.metrics.inc('errors')
     
     def _save_debug_info(self, board_id):
         """디버깅을 위한 페이지 정보 저장"""
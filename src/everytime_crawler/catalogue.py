@@ -0,0 +1,225 @@
+"""
+수강편람(강의 목록) 크롤러
+
+시간표 화면의 "수업 목록에서 검색"은 api.everytime.kr/find/timetable/subject/list에
+POST 요청을 보내 강의 목록을 XML로 받습니다. 브라우저로 시간표 페이지를 여는 대신
+로그인 쿠키를 복사한 requests 세션으로 이 목록을 startNum부터 limitNum개씩 넘겨 가며 받습니다.
+
+    <response>
+      <subject id="1520300" code="CSE2000-01" name="자료구조" professor="김민수" credit="3" place="IT관 301">
+        <time value="월09:00-10:30(IT관 301)">
+          <data day="0" starttime="108" endtime="126" place="IT관 301"/>
+        </time>
+      </subject>
+    </response>
+
+data의 day는 0=월요일, starttime/endtime은 자정부터 5분 단위 칸 번호입니다 (108 = 09:00).
+로그인이 풀리면 <response>-1</response>가 돌아옵니다.
+
+    crawler.login()
+    crawler.sync_session_cookies()
+    with SQLiteStore("data/everytime.db") as store:
+        stats = CatalogueCrawler(crawler).refresh(store, 2025, 1)
+"""
+
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+
+from .rate_limiter import RateLimiter
+from .timeslots import DAYS, make_slot
+from .log import get_logger, event, log_page_done
+
+logger = get_logger(__name__)
+
+API_URL = "https://api.everytime.kr"
+CATALOGUE_PATH = "/find/timetable/subject/list"
+
+SLOT_MINUTES = 5  # starttime/endtime 한 칸
+
+
+def _to_number(value):
+    """'3' -> 3, '1.5' -> 1.5 (없거나 숫자가 아니면 None)"""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return int(number) if number.is_integer() else number
+
+
+def parse_course(subject, year, semester, collected_at):
+    """
+    <subject> 요소 하나를 강의 dict로 변환
+
+    Returns:
+        dict: {'subject_id', 'code', 'subject_name', 'professor', 'room', 'credit', 'time',
+               'time_slots', 'year', 'semester', 'collected_at'}
+    """
+    slots, places = [], []
+    for data in subject.iter('data'):
+        day = _to_number(data.get('day'))
+        start, end = _to_number(data.get('starttime')), _to_number(data.get('endtime'))
+        if day is None or start is None or end is None or not 0 <= day < len(DAYS) or end <= start:
+            continue
+        slots.append(make_slot(DAYS[day], start * SLOT_MINUTES, end * SLOT_MINUTES))
+        if data.get('place') and data.get('place') not in places:
+            places.append(data.get('place'))
+
+    time_elem = subject.find('time')
+    return {
+        'subject_id': subject.get('id'),
+        'code': subject.get('code'),
+        'subject_name': subject.get('name'),
+        'professor': subject.get('professor'),
+        'room': subject.get('place') or ', '.join(places),
+        'credit': _to_number(subject.get('credit')),
+        'time': time_elem.get('value') if time_elem is not None else subject.get('time'),
+        'time_slots': slots,
+        'year': year,
+        'semester': semester,
+        'collected_at': collected_at,
+    }
+
+
+def parse_catalogue_xml(content, year, semester, collected_at=None):
+    """
+    수강편람 응답 XML을 강의 리스트로 변환
+
+    Returns:
+        list: 강의 dict 리스트, 로그인이 풀린 응답(-1)이면 None
+    """
+    root = ET.fromstring(content)
+    subjects = root.findall('subject')
+    if not subjects and (root.text or '').strip() == '-1':
+        return None
+
+    collected_at = collected_at or datetime.now().isoformat()
+    return [parse_course(subject, year, semester, collected_at) for subject in subjects]
+
+
+class CatalogueCrawler:
+    """수강편람 강의 목록을 페이지 단위로 받아 오는 크롤러 (EverytimeCrawler의 HTTP 세션 사용)"""
+
+    def __init__(self, crawler_instance, page_size=100, delay=0.5, api_url=API_URL, extra_params=None):
+        """
+        CatalogueCrawler 초기화
+
+        Args:
+            crawler_instance: sync_session_cookies()를 호출한 EverytimeCrawler 인스턴스
+            page_size (int): 요청 한 번에 받을 강의 수 (limitNum)
+            delay (float): 요청 간 최소 간격(초, 속도 제한 전용)
+            api_url (str): 수강편람 API 주소
+            extra_params (dict): 모든 요청에 함께 보낼 폼 값 (campusId, orderBy 등)
+        """
+        self.crawler = crawler_instance
+        self.session = crawler_instance.session
+        self.metrics = crawler_instance.metrics
+        self.http_timeout = crawler_instance.http_timeout
+        self.page_size = page_size
+        self.api_url = api_url.rstrip('/')
+        self.extra_params = dict(extra_params or {})
+        self.limiter = RateLimiter.from_delay(delay)
+
+    def fetch_page(self, year, semester, start=0, keyword=''):
+        """
+        startNum부터 page_size개 강의 요청
+
+        Returns:
+            list: 강의 리스트 (로그인이 풀린 경우 None)
+        """
+        form = {
+            **self.extra_params,
+            'year': year,
+            'semester': semester,
+            'startNum': start,
+            'limitNum': self.page_size,
+        }
+        if keyword:
+            form['keyword'] = keyword
+
+        self.metrics.observe('throttle', self.limiter.acquire())
+        with self.metrics.stage('navigation'):
+            response = self.session.post(f"{self.api_url}{CATALOGUE_PATH}", data=form, timeout=self.http_timeout)
+            response.raise_for_status()
+
+        with self.metrics.stage('parse'):
+            courses = parse_catalogue_xml(response.content, year, semester)
+
+        if courses is None:
+            logger.warning("⚠️ 수강편람 요청이 거부되었습니다 (login() 후 sync_session_cookies()를 먼저 호출해주세요.)",
+                           extra=event('logged_out', url=response.url))
+        return courses
+
+    def iter_pages(self, year, semester, keyword='', max_pages=None):
+        """
+        강의 목록을 페이지 단위로 반환하는 제너레이터 (빈 페이지를 받으면 끝)
+
+        서버가 limitNum보다 적게 돌려줄 수 있으므로 짧은 페이지를 마지막으로 보지 않고,
+        다음 startNum은 실제로 받은 강의 수만큼 넘깁니다.
+
+        Yields:
+            list: 페이지 하나의 강의 리스트
+        """
+        page = start = 0
+        while max_pages is None or page < max_pages:
+            started = time.perf_counter()
+            courses = self.fetch_page(year, semester, start, keyword)
+            if courses is None:
+                raise PermissionError("수강편람 요청이 거부되었습니다. 로그인 상태를 확인해주세요.")
+            if not courses:
+                return
+
+            page += 1
+            start += len(courses)
+            log_page_done(logger, f"catalogue_{year}_{semester}", page, len(courses), started,
+                          message="✅ 수강편람 %d페이지에서 %d개 강의 수집")
+            yield courses
+
+    def get_courses(self, year, semester, keyword='', max_pages=None):
+        """학기 강의 전체를 리스트로 수집"""
+        return [course for courses in self.iter_pages(year, semester, keyword, max_pages) for course in courses]
+
+    def refresh(self, store, year, semester, keyword='', max_pages=None):
+        """
+        강의 목록을 받는 대로 페이지마다 store에 저장 (바뀐 강의만 다시 기록)
+
+        검색어 없이 빈 페이지를 받을 때까지(max_pages 안에서) 끝까지 받은 경우에만
+        이번 스캔에서 보이지 않은 강의(폐강 등)를 삭제합니다. 강의를 하나도 받지 못한 스캔은 삭제하지 않습니다.
+
+        Args:
+            store (SQLiteStore): 저장소
+
+        Returns:
+            dict: {'pages', 'courses', 'inserted', 'updated', 'unchanged', 'removed', 'elapsed_ms', 'error'}
+        """
+        started = time.perf_counter()
+        scan_started = datetime.now().isoformat()
+        stats = {'pages': 0, 'courses': 0, 'inserted': 0, 'updated': 0, 'unchanged': 0, 'removed': 0,
+                 'error': None}
+        pages = self.iter_pages(year, semester, keyword, max_pages)
+
+        try:
+            for courses in pages:
+                with self.metrics.stage('persist'):
+                    saved = store.upsert_courses(courses)
+                stats['pages'] += 1
+                stats['courses'] += len(courses)
+                for key, count in saved.items():
+                    stats[key] += count
+        except Exception as e:
+            stats['error'] = str(e)
+            self.metrics.inc('errors')
+            logger.error("❌ 수강편람 수집 중단: %s", e, extra=event('catalogue_error', year=year, semester=semester))
+
+        # iter_pages는 빈 페이지에서만 일찍 끝나므로 max_pages보다 적게 받았다면 끝까지 받은 것
+        complete = (stats['error'] is None and not keyword and stats['courses'] > 0
+                    and (max_pages is None or stats['pages'] < max_pages))
+        if complete:
+            stats['removed'] = store.remove_unseen_courses(year, semester, scan_started)
+
+        stats['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        logger.info("📚 수강편람 %d년 %d학기: 강의 %d개 (신규 %d, 변경 %d, 삭제 %d)",
+                    year, semester, stats['courses'], stats['inserted'], stats['updated'], stats['removed'],
+                    extra=event('catalogue_done', year=year, semester=semester,
+                                **{key: value for key, value in stats.items() if key != 'error'}))
+        return stats
@@ -0,0 +1,309 @@
+"""
+Parquet 컬럼 저장소 (pyarrow 필요: pip install pyarrow)
+
+게시글과 댓글을 타입이 있는 별도 테이블로 저장하고 글 번호(article_id / post_id)로 연결합니다.
+파일은 게시판과 날짜로 나눈 Hive 형식 디렉토리에 저장됩니다.
+
+    {root}/posts/board_id=free/date=2025-07-02/part-{run_id}.parquet
+    {root}/comments/board_id=free/date=2025-07-02/part-{run_id}.parquet
+
+댓글은 수집 날짜가 아니라 부모 게시글의 작성 날짜(created_at) 파티션에 저장됩니다.
+
+크롤링 중에는 파티션별로 row_group_size개씩 모아 row group 단위로 기록합니다.
+모아 둔 행이 전체 max_buffered_rows개를 넘으면 가장 큰 파티션부터 기록합니다.
+Parquet 파일은 닫아야 읽을 수 있으므로 기본적으로는 close() 전에 프로세스가 죽으면 기록한 행도 읽을 수 없습니다.
+flush_interval(초)을 지정하면 그 간격마다 남은 행을 기록하고 열린 파일을 닫아 완성합니다 (이후 행은 새 part 파일).
+간격마다 파티션별 파일이 하나씩 늘어나므로 몇 시간짜리 크롤링에서는 10-15분(600-900초) 정도로 둡니다.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from contextlib import ExitStack
+from datetime import datetime
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # 선택 의존성
+    pa = ds = pq = None
+
+from .crawl_state import extract_article_id
+
+POSTS_TABLE = 'posts'
+COMMENTS_TABLE = 'comments'
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("Parquet 저장에는 pyarrow가 필요합니다. pip install pyarrow 로 설치하세요.")
+
+
+def _schemas():
+    """테이블별 파일 스키마 (board_id, date는 디렉토리 파티션)"""
+    return {
+        POSTS_TABLE: pa.schema([
+            ('article_id', pa.int64()),
+            ('title', pa.string()),
+            ('content', pa.string()),
+            ('full_content', pa.string()),
+            ('author', pa.string()),
+            ('created_time', pa.string()),
+            ('created_at', pa.timestamp('us')),
+            ('comment_count', pa.int32()),
+            ('view_count', pa.int32()),
+            ('post_link', pa.string()),
+            ('page', pa.int32()),
+            ('collected_at', pa.timestamp('us')),
+        ]),
+        COMMENTS_TABLE: pa.schema([
+            ('post_id', pa.int64()),
+            ('comment_index', pa.int32()),
+            ('comment_id', pa.int64()),
+            ('parent_id', pa.int64()),
+            ('depth', pa.int32()),
+            ('author', pa.string()),
+            ('content', pa.string()),
+            ('created_time', pa.string()),
+            ('collected_at', pa.timestamp('us')),
+        ]),
+    }
+
+
+def _partitioning():
+    return ds.partitioning(pa.schema([('board_id', pa.string()), ('date', pa.string())]), flavor='hive')
+
+
+def _to_int(value):
+    """'12' 같은 문자열 숫자를 정수로 변환 (없거나 숫자가 아니면 None)"""
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_datetime(value):
+    """ISO 형식 문자열/datetime을 datetime으로 변환"""
+    if isinstance(value, datetime):
+        return value
+    if value:
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return None
+
+
+class ParquetSink:
+    """게시판/날짜별 Parquet 파일에 row group 단위로 기록 (스레드 안전)"""
+
+    def __init__(self, root_dir, row_group_size=10000, max_buffered_rows=50000, flush_interval=None):
+        """
+        ParquetSink 초기화
+
+        Args:
+            root_dir (str): 저장 루트 디렉토리
+            row_group_size (int): 파티션별로 모아서 한 번에 기록할 행 수
+            max_buffered_rows (int): 모든 파티션에 걸쳐 메모리에 모아 둘 최대 행 수
+            flush_interval (float): 남은 행을 기록하고 파일을 닫아 완성하는 간격(초, None이면 close() 때만)
+        """
+        _require_pyarrow()
+        self.root_dir = root_dir
+        self.row_group_size = row_group_size
+        self.max_buffered_rows = max_buffered_rows
+        self.flush_interval = flush_interval
+        self.run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+        self.files = []
+
+        self._schemas = _schemas()
+        self._buffers = defaultdict(list)  # (table, board_id, date) -> 행 목록
+        self._buffered_rows = 0
+        self._writers = {}                 # (table, board_id, date) -> ParquetWriter
+        self._file_counts = defaultdict(int)  # (table, board_id, date) -> 만든 part 파일 수
+        self._post_dates = OrderedDict()   # article_id -> 게시글 파티션 날짜 (댓글 파티션용, 최근 max_buffered_rows개)
+        self._last_checkpoint = time.monotonic()
+        self._lock = threading.Lock()
+
+    def write_posts(self, posts, board_id=None):
+        """
+        게시글 목록 추가 (get_board_posts 결과 형식)
+
+        Args:
+            posts (list): 게시글 리스트 (full_content가 있으면 함께 저장)
+            board_id (str): 게시글에 board_id가 없을 때 사용할 게시판 ID
+        """
+        for post in posts:
+            collected_at = _to_datetime(post.get('collected_at')) or datetime.now()
+            row = {
+                'article_id': post.get('article_id') or extract_article_id(post.get('post_link')),
+                'title': post.get('title'),
+                'content': post.get('content'),
+                'full_content': post.get('full_content'),
+                'author': post.get('author'),
+                'created_time': post.get('created_time'),
+                'created_at': _to_datetime(post.get('created_at')),
+                'comment_count': _to_int(post.get('comment_count')),
+                'view_count': _to_int(post.get('view_count')),
+                'post_link': post.get('post_link'),
+                'page': _to_int(post.get('page')),
+                'collected_at': collected_at,
+            }
+            date = self._partition_date(post, collected_at)
+            if row['article_id'] is not None:
+                self._remember_post_date(row['article_id'], date)
+            self._append(POSTS_TABLE, post.get('board_id') or board_id or 'unknown', date, row)
+        self._maybe_checkpoint()
+
+    def write_comments(self, post_id, board_id, comments, collected_at=None, date=None):
+        """
+        한 게시글의 댓글 목록 추가
+
+        Args:
+            post_id (int): 게시글 글 번호 (posts.article_id와 연결)
+            board_id (str): 게시판 ID
+            comments (list): 댓글 리스트 (get_post_detail의 comments 형식)
+            collected_at: 수집 시각
+            date (str): 파티션 날짜 (YYYY-MM-DD, 없으면 최근 max_buffered_rows개 안에서 write_posts로 기록한
+                부모 게시글의 날짜, 그것도 없으면 수집 날짜. 오래전에 기록한 게시글의 댓글은 직접 지정)
+        """
+        collected_at = _to_datetime(collected_at) or datetime.now()
+        with self._lock:
+            date = date or self._post_dates.get(post_id) or collected_at.strftime('%Y-%m-%d')
+        for idx, comment in enumerate(comments):
+            row = {
+                'post_id': post_id,
+                'comment_index': idx,
+                'comment_id': _to_int(comment.get('comment_id')),
+                'parent_id': _to_int(comment.get('parent_id')),
+                'depth': _to_int(comment.get('depth')),
+                'author': comment.get('author'),
+                'content': comment.get('content'),
+                'created_time': comment.get('created_time'),
+                'collected_at': collected_at,
+            }
+            self._append(COMMENTS_TABLE, board_id, date, row)
+        self._maybe_checkpoint()
+
+    def write_post_detail(self, detail, board_id='unknown'):
+        """
+        get_post_detail / fetch_post_details 결과의 댓글을 추가
+
+        detail에 게시글 작성 시각(created_at)이 있으면 그 날짜 파티션에 저장합니다.
+        """
+        created_at = _to_datetime(detail.get('created_at'))
+        self.write_comments(
+            extract_article_id(detail.get('url') or detail.get('post_link')),
+            board_id,
+            detail.get('comments', []),
+            collected_at=detail.get('collected_at'),
+            date=created_at.strftime('%Y-%m-%d') if created_at else None
+        )
+
+    def _remember_post_date(self, article_id, date):
+        """댓글 파티션용 게시글 날짜 기록 (가장 오래된 것부터 버려 max_buffered_rows개 유지)"""
+        with self._lock:
+            self._post_dates[article_id] = date
+            self._post_dates.move_to_end(article_id)
+            while len(self._post_dates) > self.max_buffered_rows:
+                self._post_dates.popitem(last=False)
+
+    @staticmethod
+    def _partition_date(post, collected_at):
+        """게시글 작성 시각(created_at)이 있으면 그 날짜, 없으면 수집 날짜"""
+        created_at = _to_datetime(post.get('created_at'))
+        return (created_at or collected_at).strftime('%Y-%m-%d')
+
+    def _append(self, table, board_id, date, row):
+        key = (table, board_id, date)
+        with self._lock:
+            self._buffers[key].append(row)
+            self._buffered_rows += 1
+            if len(self._buffers[key]) >= self.row_group_size:
+                self._flush_key(key)
+            elif self._buffered_rows >= self.max_buffered_rows:
+                self._flush_key(max(self._buffers, key=lambda k: len(self._buffers[k])))
+
+    def _flush_key(self, key):
+        rows = self._buffers.pop(key, None)
+        if not rows:
+            return
+        self._buffered_rows -= len(rows)
+
+        table, board_id, date = key
+        schema = self._schemas[table]
+        writer = self._writers.get(key)
+        if writer is None:
+            directory = os.path.join(self.root_dir, table, f"board_id={board_id}", f"date={date}")
+            os.makedirs(directory, exist_ok=True)
+            count = self._file_counts[key]
+            suffix = f"-{count}" if count else ""
+            path = os.path.join(directory, f"part-{self.run_id}{suffix}.parquet")
+            writer = pq.ParquetWriter(path, schema)
+            self._writers[key] = writer
+            self._file_counts[key] += 1
+            self.files.append(path)
+
+        writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+
+    def _close_writers(self):
+        """열린 파일을 모두 닫기 (하나가 실패해도 나머지는 닫음)"""
+        writers, self._writers = list(self._writers.values()), {}
+        with ExitStack() as stack:
+            for writer in writers:
+                stack.callback(writer.close)
+
+    def _maybe_checkpoint(self):
+        """flush_interval이 지났으면 남은 행을 기록하고 파일을 닫아 완성"""
+        if self.flush_interval is None:
+            return
+        with self._lock:
+            if time.monotonic() - self._last_checkpoint < self.flush_interval:
+                return
+            self._last_checkpoint = time.monotonic()
+            try:
+                for key in list(self._buffers):
+                    self._flush_key(key)
+            finally:
+                self._close_writers()
+
+    def flush(self):
+        """모아 둔 행을 모두 row group으로 기록"""
+        with self._lock:
+            for key in list(self._buffers):
+                self._flush_key(key)
+
+    def close(self):
+        """남은 행을 기록하고 파일 닫기 (닫아야 Parquet 파일이 완성됨, 기록에 실패해도 파일은 닫음)"""
+        try:
+            self.flush()
+        finally:
+            with self._lock:
+                self._close_writers()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def read_table(root_dir, table=POSTS_TABLE, columns=None, filter=None):
+    """
+    저장된 테이블을 pandas DataFrame으로 로드
+
+    Args:
+        root_dir (str): ParquetSink의 저장 루트 디렉토리
+        table (str): 'posts' 또는 'comments'
+        columns (list): 읽을 컬럼 (board_id, date 파티션 컬럼 포함 가능, None이면 전체)
+        filter: pyarrow.dataset 필터 식 (예: ds.field('board_id') == 'free')
+
+    Returns:
+        pandas.DataFrame
+    """
+    _require_pyarrow()
+    dataset = ds.dataset(os.path.join(root_dir, table), format='parquet', partitioning=_partitioning())
+    return dataset.to_table(columns=columns, filter=filter).to_pandas()
@@ -0,0 +1,227 @@
+"""
+게시글 상세 페이지 댓글 파서
+
+에브리타임 댓글 목록은 <ul class="comments"> 아래의 <li>로 구성됩니다.
+
+    <li id="comment-3845086000" class="parent">...</li>   댓글
+    <li id="comment-3845086001" class="child">...</li>    바로 앞 댓글의 대댓글
+
+대댓글이 <li> 안의 <ul>로 중첩된 경우도 깊이를 계산합니다. 이미 파싱된 트리를
+한 번만 순회하며, 댓글 노드를 문자열로 바꿔 다시 파싱하지 않습니다.
+"""
+
+import re
+
+from bs4 import Tag
+
+_COMMENT_ID_PATTERN = re.compile(r'(\d+)')
+_ID_ATTRS = ('data-comment-id', 'data-id', 'id')
+_NESTED_TAGS = ('ul', 'ol', 'li')
+
+# 필드별 후보 (앞에 있을수록 우선)
+CONTENT_CLASSES = ('large', 'text', 'content')
+AUTHOR_CLASSES = ('small', 'author', 'writer', 'nickname')
+TIME_CLASSES = ('time', 'date', 'timestamp')
+REPLY_CLASSES = ('child', 'reply')
+
+# 댓글 목록이 없을 때 시도할 셀렉터
+FALLBACK_SELECTORS = ['.comment', '.reply', '.comment-item', '.reply-item', '[class*="comment"]']
+
+
+def _own_tags(node):
+    """노드 안의 태그를 문서 순서로 순회 (중첩된 대댓글 목록은 제외)"""
+    stack = [child for child in reversed(node.contents) if isinstance(child, Tag)]
+    while stack:
+        tag = stack.pop()
+        if tag.name in _NESTED_TAGS:
+            continue
+        yield tag
+        stack.extend(child for child in reversed(tag.contents) if isinstance(child, Tag))
+
+
+def _is_author_text(text):
+    # 작성자 후보에서 댓글 수, "3분 전", "07/01 10:00" 같은 값 제외
+    return text and not text.isdigit() and '분' not in text and ':' not in text
+
+
+def parse_comment_id(node):
+    """댓글 노드의 글 번호 (id="comment-3845086000" 등, 없으면 None)"""
+    for attr in _ID_ATTRS:
+        value = node.get(attr)
+        if value:
+            match = _COMMENT_ID_PATTERN.search(value)
+            if match:
+                return int(match.group(1))
+    return None
+
+
+def extract_comment_fields(node):
+    """
+    댓글 노드 하나에서 내용, 작성자, 작성시간 추출 (한 번의 순회)
+
+    Returns:
+        dict: {'content', 'author', 'created_time'} (내용이 없으면 None)
+    """
+    content_by_rank = {}
+    author_by_rank = {}
+    created_time = ""
+    first_p = None
+
+    for tag in _own_tags(node):
+        classes = tag.get('class') or ()
+        text = None
+
+        for rank, cls in enumerate(CONTENT_CLASSES):
+            if cls in classes and rank not in content_by_rank:
+                text = tag.get_text(strip=True)
+                if text:
+                    content_by_rank[rank] = text
+                break
+
+        if tag.name == 'p' and first_p is None:
+            text = tag.get_text(strip=True) if text is None else text
+            if text:
+                first_p = text
+
+        for rank, cls in enumerate(AUTHOR_CLASSES):
+            if cls in classes and rank not in author_by_rank:
+                text = tag.get_text(strip=True) if text is None else text
+                if _is_author_text(text):
+                    author_by_rank[rank] = text
+                break
+
+        if not created_time and (tag.name == 'time' or any(cls in classes for cls in TIME_CLASSES)):
+            created_time = tag.get_text(strip=True) if text is None else text
+
+    # 기존 셀렉터 우선순위: .large > p > .text > .content
+    content = content_by_rank.get(0) or first_p or content_by_rank.get(1) or content_by_rank.get(2) or ""
+    author = author_by_rank[min(author_by_rank)] if author_by_rank else "익명"
+
+    if len(content) <= 1:
+        return None
+
+    return {
+        'content': content,
+        'author': author,
+        'created_time': created_time
+    }
+
+
+def parse_comment_list(comment_list):
+    """
+    <ul class="comments">를 한 번 순회하며 댓글 트리를 평탄화
+
+    Returns:
+        list: 문서 순서의 댓글 리스트. 각 댓글은 extract_comment_fields 결과에
+            comment_id, parent_id, depth(0: 댓글, 1 이상: 대댓글)가 추가됨.
+            같은 comment_id는 한 번만 포함
+    """
+    comments = []
+    seen_ids = set()
+    ids_by_node = {}       # 중첩된 <li>의 부모 댓글 id 조회용
+    last_top_level_id = None
+
+    for item in comment_list.find_all('li'):
+        # 중첩 깊이와 부모 댓글
+        depth = 0
+        parent_id = None
+        ancestor = item.parent
+        while ancestor is not None and ancestor is not comment_list:
+            if ancestor.name == 'li':
+                if depth == 0:
+                    parent_id = ids_by_node.get(id(ancestor))
+                depth += 1
+            ancestor = ancestor.parent
+
+        classes = item.get('class') or ()
+        if depth == 0 and any(cls in classes for cls in REPLY_CLASSES):
+            # 평탄한 목록의 대댓글: 바로 앞 댓글에 연결
+            depth = 1
+            parent_id = last_top_level_id
+
+        comment_id = parse_comment_id(item)
+        ids_by_node[id(item)] = comment_id
+        if depth == 0:
+            last_top_level_id = comment_id
+
+        if comment_id is not None:
+            if comment_id in seen_ids:
+                continue
+            seen_ids.add(comment_id)
+
+        fields = extract_comment_fields(item)
+        if fields is None:
+            continue
+
+        fields.update({'comment_id': comment_id, 'parent_id': parent_id, 'depth': depth})
+        comments.append(fields)
+
+    return comments
+
+
+def parse_comments(soup):
+    """
+    상세 페이지 트리에서 댓글 추출
+
+    ul.comments가 없으면 FALLBACK_SELECTORS를 차례로 시도합니다. 넓은 셀렉터는 댓글을 감싸는
+    요소와 댓글 요소를 함께 선택하므로, 안쪽 댓글의 내용을 자기 내용으로 읽은 요소(감싸는 요소)는
+    제외하고 남은 요소끼리의 포함 관계로 부모 댓글과 깊이를 정합니다.
+    """
+    comment_list = soup.select_one('ul.comments')
+    if comment_list is not None:
+        comments = parse_comment_list(comment_list)
+        if comments:
+            return comments
+
+    for selector in FALLBACK_SELECTORS:
+        candidates = []
+        for elem in soup.select(selector):
+            fields = extract_comment_fields(elem)
+            if fields is not None:
+                candidates.append((elem, fields))
+
+        # 안쪽 후보의 내용을 바깥 후보별로 모음
+        candidate_ids = {id(elem) for elem, _ in candidates}
+        inner_contents = {}
+        for elem, fields in candidates:
+            for parent in elem.parents:
+                if id(parent) in candidate_ids:
+                    inner_contents.setdefault(id(parent), set()).add(fields['content'])
+
+        comments = []
+        kept = {}  # id(요소) -> comment_id
+        seen_ids = set()
+        last_top_level_id = None
+        for elem, fields in candidates:
+            if fields['content'] in inner_contents.get(id(elem), ()):
+                continue
+
+            comment_id = parse_comment_id(elem)
+            if comment_id is not None:
+                if comment_id in seen_ids:
+                    continue
+                seen_ids.add(comment_id)
+
+            kept_parents = [kept[id(parent)] for parent in elem.parents if id(parent) in kept]
+            kept[id(elem)] = comment_id
+
+            classes = elem.get('class') or ()
+            depth = len(kept_parents)
+            parent_id = kept_parents[0] if kept_parents else None
+            if depth == 0 and any(cls in classes for cls in REPLY_CLASSES):
+                # 평탄한 목록의 대댓글: 바로 앞 댓글에 연결
+                depth = 1
+                parent_id = last_top_level_id
+            if depth == 0:
+                last_top_level_id = comment_id
+            fields.update({
+                'comment_id': comment_id,
+                'parent_id': parent_id,
+                'depth': depth
+            })
+            comments.append(fields)
+
+        if comments:
+            return comments
+
+    return []
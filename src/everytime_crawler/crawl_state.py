@@ -0,0 +1,184 @@
+"""
+증분/재개 크롤링 상태 관리
+
+게시글 링크(/387605/v/384508581)의 글 번호는 새 글일수록 커집니다.
+게시판별로 지금까지 수집한 가장 큰 글 번호(high-water mark)를 저장해 두면
+다음 실행에서는 그 번호에 도달하는 순간 페이지 이동을 멈출 수 있습니다.
+
+CrawlCheckpoint는 긴 크롤링이 중간에 중단되었을 때 이어서 진행할 수 있도록
+게시판별 진행 상황을 기록합니다.
+"""
+
+import os
+import re
+import json
+import threading
+
+_ARTICLE_ID_PATTERN = re.compile(r'/v/(\d+)')
+
+
+def extract_article_id(post_link):
+    """게시글 링크에서 글 번호 추출 (없으면 None)"""
+    if not post_link:
+        return None
+    match = _ARTICLE_ID_PATTERN.search(post_link)
+    return int(match.group(1)) if match else None
+
+
+def split_new_posts(posts, since_id):
+    """
+    이미 수집한 글(since_id 이하)을 제외
+
+    Args:
+        posts (list): 한 페이지의 게시글 리스트
+        since_id (int): 이전 실행의 high-water mark (None이면 모두 새 글)
+
+    Returns:
+        tuple: (새 게시글 리스트, 이미 수집한 글에 도달했는지 여부)
+    """
+    if since_id is None:
+        return posts, False
+
+    new_posts = []
+    reached = False
+    for post in posts:
+        article_id = post.get('article_id')
+        if article_id is not None and article_id <= since_id:
+            reached = True
+        else:
+            new_posts.append(post)
+
+    return new_posts, reached
+
+
+class HighWaterMarks:
+    """게시판별 최대 글 번호 저장소 (JSON 파일, 스레드 안전)"""
+
+    def __init__(self, path):
+        """
+        HighWaterMarks 초기화
+
+        Args:
+            path (str): 상태 파일 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._marks = None
+
+    def _load(self):
+        if self._marks is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._marks = {k: int(v) for k, v in json.load(f).items()}
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._marks = {}
+        return self._marks
+
+    def get(self, board_id):
+        """게시판의 high-water mark (없으면 None)"""
+        with self._lock:
+            return self._load().get(board_id)
+
+    def update(self, board_id, posts):
+        """
+        수집한 게시글 중 가장 큰 글 번호로 mark를 올리고 저장
+
+        Returns:
+            int: 갱신 후 mark (게시글에 글 번호가 없으면 기존 값)
+        """
+        ids = [p['article_id'] for p in posts if p.get('article_id') is not None]
+        return self.advance(board_id, max(ids) if ids else None)
+
+    def advance(self, board_id, article_id):
+        """mark를 article_id로 올리고 저장 (기존 값보다 작으면 유지)"""
+        with self._lock:
+            marks = self._load()
+            if article_id is not None and article_id > marks.get(board_id, 0):
+                marks[board_id] = article_id
+                self._save(marks)
+            return marks.get(board_id)
+
+    def reset(self, board_id=None):
+        """mark 삭제 (board_id가 없으면 전체)"""
+        with self._lock:
+            marks = self._load()
+            if board_id is None:
+                marks.clear()
+            else:
+                marks.pop(board_id, None)
+            self._save(marks)
+
+    def _save(self, marks):
+        _write_json_atomic(self.path, marks)
+
+
+class CrawlCheckpoint:
+    """
+    대량 크롤링 체크포인트 (JSON 파일, 스레드 안전)
+
+    게시판별로 다음 값을 기록합니다.
+    - last_page: 마지막으로 처리한 페이지
+    - post_count: 지금까지 기록한 게시글 수
+    - max_article_id / since_id: 이번 실행의 최대 글 번호와 시작 시점의 high-water mark
+    - output_file / output_offset: 출력 파일과 마지막 페이지까지 기록한 바이트 위치
+    - status: 'in_progress' 또는 'completed'
+    """
+
+    def __init__(self, path):
+        """
+        CrawlCheckpoint 초기화
+
+        Args:
+            path (str): 체크포인트 파일 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._boards = None
+
+    def _load(self):
+        if self._boards is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._boards = json.load(f).get('boards', {})
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._boards = {}
+        return self._boards
+
+    def get(self, board_id):
+        """게시판 진행 상황 (없으면 None)"""
+        with self._lock:
+            state = self._load().get(board_id)
+            return dict(state) if state else None
+
+    def update(self, board_id, **fields):
+        """게시판 진행 상황을 갱신하고 즉시 저장"""
+        with self._lock:
+            boards = self._load()
+            boards.setdefault(board_id, {}).update(fields)
+            self._save(boards)
+
+    def boards(self):
+        """전체 게시판 진행 상황"""
+        with self._lock:
+            return {board_id: dict(state) for board_id, state in self._load().items()}
+
+    def reset(self):
+        """체크포인트 초기화 (새 크롤링 시작)"""
+        with self._lock:
+            self._boards = {}
+            self._save(self._boards)
+
+    def _save(self, boards):
+        _write_json_atomic(self.path, {'boards': boards})
+
+
+def _write_json_atomic(path, data):
+    """임시 파일에 쓴 뒤 교체 (쓰는 도중 중단되어도 기존 파일 유지)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
@@ -5,6 +5,8 @@
 import os
 import time
 import json
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from datetime import datetime
 from selenium import webdriver
@@ -17,29 +19,129 @@ from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
+from .rate_limiter import RateLimiter
+from .session_store import SessionStore
+from .crawl_state import HighWaterMarks, extract_article_id, split_new_posts
+from .sinks import JsonlWriter
+from .timeparse import add_created_at
+from .page_cache import PageCache
+from .selector_cache import SelectorCache
+from .metrics import Metrics
+from .log import get_logger, event, log_page_done, log_post_done
+from .comments import extract_comment_fields, parse_comment_id, parse_comments
+from .timetable import (
+    UNKNOWN_SUBJECT, TimeGrid, extract_subject_fields, read_day_columns, subject_day, format_time_range
+)
+from .timeslots import make_slot
+from .waits import (
+    PageWaiter, BOARD_READY_SELECTORS, POST_DETAIL_SELECTORS,
+    TIMETABLE_SELECTORS, LOGIN_FORM_SELECTORS
+)
 
 # 환경변수 로드
 load_dotenv()
 
+logger = get_logger(__name__)
+
 class EverytimeCrawler:
-    def __init__(self):
-        """에브리타임 크롤러 초기화"""
+    # 실제 에브리타임 게시판 URL 매핑 (성남캠 기준)
+    BOARD_URL_MAP = {
+        "free": "387605",        # 성남캠 자유게시판
+        "secret": "375151",      # 비밀게시판
+        "graduate": "387612",    # 졸업생게시판
+        "freshman": "387615",    # 새내기게시판
+    }
+    
+    BOARD_NAME_MAP = {
+        "free": "자유게시판",
+        "secret": "비밀게시판", 
+        "freshman": "새내기게시판",
+        "graduate": "졸업생게시판",
+    }
+    
+    # 에브리타임 게시판 구조 분석을 위한 다양한 셀렉터 (우선순위 순)
+    POST_SELECTORS = [
+        "article.list",           # 일반적인 게시글 구조
+        ".article",               # 기본 article 클래스
+        "tr.list",               # 테이블 형태 게시판
+        ".board-item",           # 커스텀 게시판 아이템
+        ".post-item",            # 포스트 아이템
+        ".content-wrapper a",    # 링크 형태 게시글
+        ".list-item"             # 리스트 아이템
+    ]
+    
+    # HTTP 세션 커넥션 풀 크기 (fetch_post_details의 concurrency 최대값으로 충분한 크기)
+    HTTP_POOL_SIZE = 16
+    
+    # 시간표 과목 요소 셀렉터 (우선순위 순)
+    TIMETABLE_SUBJECT_SELECTORS = [
+        ".subject",
+        ".course", 
+        ".lecture",
+        ".timetable-subject",
+        ".class",
+        "tr.course",
+        ".schedule-item",
+        ".timetable .subject",
+        "[class*='subject']",
+        "[class*='course']"
+    ]
+    
+    def __init__(self, session_file=None):
+        """
+        에브리타임 크롤러 초기화
+
+        Args:
+            session_file (str): 로그인 쿠키 저장 경로 (없으면 EVERYTIME_SESSION_FILE 환경변수, 둘 다 없으면 저장 안 함)
+        """
         # 환경변수 다시 로드 (확실하게)
         load_dotenv(override=True)
         
         self.base_url = "https://everytime.kr"
         self.session = requests.Session()
+        # 동시 요청(fetch_post_details)이 커넥션을 재사용하도록 풀 크기를 한 번만 설정
+        adapter = HTTPAdapter(pool_connections=self.HTTP_POOL_SIZE, pool_maxsize=self.HTTP_POOL_SIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._detail_loop = None
         self.driver = None
+        self._restored_cookies = None  # 드라이버 없이 복원한 세션 쿠키 (드라이버를 처음 쓸 때 설정)
+        self.http_timeout = 10
+        self.typing_delay = 0.1  # 로그인 시 글자 간 입력 간격(초)
+        self._waiter = PageWaiter()
         
         # 환경변수에서 계정 정보 로드
         self.user_id = os.getenv('EVERYTIME_ID')
         self.password = os.getenv('EVERYTIME_PASSWORD')
         
+        # 로그인 쿠키 저장소 (설정된 경우 다음 실행에서 브라우저 로그인 생략)
+        session_file = session_file or os.getenv('EVERYTIME_SESSION_FILE')
+        self.session_store = SessionStore(session_file) if session_file else None
+        
+        # 증분 크롤링용 게시판별 최대 글 번호 (incremental=True일 때만 사용)
+        self.high_water_marks = HighWaterMarks(os.path.join(os.getenv('DATA_DIR', 'data'), 'high_water_marks.json'))
+        
+        # 목록 페이지 캐시 (같은 URL을 다시 수집할 때 바뀐 게시글 블록만 파싱, None이면 사용 안 함)
+        self.page_cache = PageCache()
+        
+        # 게시판/페이지 종류별로 처음 성공한 셀렉터 (결과가 없을 때만 후보 전체를 다시 탐색)
+        self.selector_cache = SelectorCache()
+        
+        # 단계별 소요 시간/처리 건수 (EVERYTIME_METRICS=1이면 기록, 기본은 비활성화)
+        self.metrics = Metrics.from_env()
+        
         # 디버그: 환경변수 확인
         print(f"🔍 크롤러 초기화 - 계정 정보:")
         print(f"   - user_id: {self.user_id}")
         print(f"   - password: {'*' * len(self.password) if self.password else 'None'}")
+    
+    @property
+    def waiter(self):
+        """현재 드라이버에 연결된 조건 기반 대기 도구 (대기 시간은 waiter.summary()로 확인)"""
+        self._waiter.driver = self.driver
+        return self._waiter
         
     def setup_driver(self, headless=True):
         """Selenium WebDriver 설정"""
@@ -95,17 +197,28 @@ class EverytimeCrawler:
             raise
     
     def login(self):
-        """에브리타임 로그인"""
+        """
+        에브리타임 로그인
+
+        session_store가 설정되어 있으면 저장된 쿠키를 먼저 확인하고,
+        유효하지 않을 때만 브라우저로 로그인합니다.
+        """
         if not self.user_id or not self.password:
             raise ValueError("환경변수에 EVERYTIME_ID와 EVERYTIME_PASSWORD를 설정해주세요.")
+        
+        if self.restore_session():
+            return True
+        
+        if self.driver is None:
+            self.setup_driver()
             
         try:
             print("에브리타임 로그인 시도 중...")
             
             # 메인 페이지에서 시작 (더 자연스러운 접근)
             self.driver.get("https://everytime.kr")
+            self.waiter.for_document_ready("login_main")
             print("메인 페이지 로드 완료")
-            time.sleep(3)
             
             # 로그인 링크 찾기 및 클릭
             try:
@@ -131,23 +244,18 @@ class EverytimeCrawler:
                 if login_link:
                     self.driver.execute_script("arguments[0].click();", login_link)
                     print("로그인 링크 클릭 완료")
-                    time.sleep(3)
                 else:
                     # 직접 로그인 페이지로 이동
                     self.driver.get("https://account.everytime.kr/login")
-                    time.sleep(3)
                     
             except:
                 # 직접 로그인 페이지로 이동
                 self.driver.get("https://account.everytime.kr/login")
-                time.sleep(3)
             
-            print(f"현재 URL: {self.driver.current_url}")
+            # 로그인 폼이 나타날 때까지 대기
+            self.waiter.for_any(LOGIN_FORM_SELECTORS, "login_form", required=True)
             
-            # 페이지가 완전히 로드될 때까지 대기
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.NAME, "id"))
-            )
+            print(f"현재 URL: {self.driver.current_url}")
             
             # 로그인 폼 입력 필드 찾기
             userid_input = self.driver.find_element(By.NAME, "id")
@@ -155,23 +263,19 @@ class EverytimeCrawler:
             
             print("로그인 폼 찾기 성공")
             
-            # 입력 필드 클리어 및 천천히 입력 (사람처럼)
+            # 입력 필드 클리어 및 천천히 입력 (사람처럼, 간격은 typing_delay)
             userid_input.clear()
-            time.sleep(0.5)
             for char in self.user_id:
                 userid_input.send_keys(char)
-                time.sleep(0.1)  # 천천히 타이핑
-            
-            time.sleep(1)
+                time.sleep(self.typing_delay)
             
             password_input.clear()
-            time.sleep(0.5)
             for char in self.password:
                 password_input.send_keys(char)
-                time.sleep(0.1)  # 천천히 타이핑
+                time.sleep(self.typing_delay)
             
-            time.sleep(2)
             print("로그인 정보 입력 완료")
+            login_url = self.driver.current_url
             
             # 로그인 버튼 찾기 및 클릭
             login_button = None
@@ -202,30 +306,26 @@ class EverytimeCrawler:
                 password_input.send_keys(Keys.RETURN)
                 print("Enter 키로 로그인 시도")
             
-            # 로그인 결과 확인
-            time.sleep(3)
+            # 로그인 결과 확인: 실패 Alert 또는 로그인 페이지를 벗어날 때까지 대기
+            result = self.waiter.until(
+                lambda d: EC.alert_is_present()(d) or (d.current_url != login_url and "login" not in d.current_url),
+                "login_result"
+            )
             
             # Alert 확인
-            try:
-                # Alert가 나타날 때까지 대기 (짧은 시간)
-                WebDriverWait(self.driver, 2).until(EC.alert_is_present())
-                alert = self.driver.switch_to.alert
-                alert_text = alert.text
+            if result and not isinstance(result, bool):
+                alert_text = result.text
                 print(f"로그인 실패: Alert Text: {alert_text}")
-                alert.accept()  # Alert 닫기
+                result.accept()  # Alert 닫기
                 return False
-            except:
-                # Alert가 없으면 로그인 성공 가능성
-                pass
             
-            # 추가 대기 후 URL 확인
-            time.sleep(2)
             current_url = self.driver.current_url
             print(f"로그인 후 URL: {current_url}")
             
             # 로그인 성공 확인 - 메인 페이지로 리다이렉트되면 성공
             if current_url == "https://everytime.kr/" or ("everytime.kr" in current_url and "login" not in current_url and "account" not in current_url):
                 print("로그인에 성공했습니다.")
+                self._save_session()
                 return True
             else:
                 print("로그인에 실패했습니다.")
@@ -240,14 +340,136 @@ class EverytimeCrawler:
             except:
                 pass
             return False
-    
+
+    def sync_session_cookies(self):
+        """
+        WebDriver의 로그인 쿠키를 requests 세션으로 복사
+
+        login() 이후 한 번 호출하면 fetch_mode='http'로 브라우저 없이 페이지를 가져올 수 있습니다.
+
+        Returns:
+            int: 복사한 쿠키 수
+        """
+        if not self.driver:
+            raise ValueError("WebDriver가 설정되지 않았습니다. setup_driver()와 login()을 먼저 호출해주세요.")
+
+        cookies = self.driver.get_cookies()
+        self._set_session_cookies(cookies)
+
+        # 브라우저와 같은 User-Agent로 요청
+        try:
+            user_agent = self.driver.execute_script("return navigator.userAgent")
+            if user_agent:
+                self.session.headers['User-Agent'] = user_agent
+        except Exception:
+            pass
+
+        print(f"🍪 WebDriver 쿠키 {len(cookies)}개를 HTTP 세션으로 복사했습니다.")
+        return len(cookies)
+
+    def _set_session_cookies(self, cookies):
+        """Selenium 형식 쿠키 목록을 requests 세션에 설정"""
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain', ''),
+                path=cookie.get('path', '/')
+            )
+
+    def _save_session(self):
+        """로그인 직후 쿠키를 HTTP 세션에 복사하고 session_store에 저장"""
+        if not self.session_store:
+            return
+
+        try:
+            self.sync_session_cookies()
+            self.session_store.save(
+                self.driver.get_cookies(),
+                user_id=self.user_id,
+                user_agent=self.session.headers.get('User-Agent')
+            )
+            print(f"💾 로그인 세션을 저장했습니다: {self.session_store.path}")
+        except Exception as e:
+            print(f"⚠️ 로그인 세션 저장 실패: {e}")
+
+    def _probe_session(self):
+        """로그인이 필요한 페이지를 한 번 요청해 세션 유효성 확인"""
+        probe_url = f"{self.base_url}/{self.BOARD_URL_MAP['free']}"
+        try:
+            response = self.session.get(probe_url, timeout=self.http_timeout)
+        except requests.RequestException:
+            return False
+
+        return response.ok and "login" not in response.url and "account" not in response.url
+
+    def restore_session(self):
+        """
+        저장된 쿠키로 로그인 상태 복원
+
+        HTTP 요청 한 번으로 유효성을 확인하므로 브라우저 로그인보다 훨씬 빠릅니다.
+        드라이버가 있으면 같은 쿠키를 드라이버에도 넣고, 없으면 드라이버가 필요한 작업을
+        처음 호출할 때 _ensure_driver()가 드라이버를 띄운 뒤 넣습니다.
+
+        Returns:
+            bool: 복원 성공 여부 (저장소가 없거나 세션이 만료되면 False)
+        """
+        if not self.session_store:
+            return False
+
+        saved = self.session_store.load(user_id=self.user_id)
+        if not saved:
+            return False
+
+        if saved.get('user_agent'):
+            self.session.headers['User-Agent'] = saved['user_agent']
+        self._set_session_cookies(saved['cookies'])
+
+        if not self._probe_session():
+            print("⚠️ 저장된 세션이 만료되었습니다. 다시 로그인합니다.")
+            self.session.cookies.clear()
+            self.session_store.clear()
+            return False
+
+        if self.driver:
+            self._load_cookies_into_driver(saved['cookies'])
+        else:
+            self._restored_cookies = saved['cookies']
+
+        print("🍪 저장된 세션으로 로그인했습니다.")
+        return True
+
+    def _ensure_driver(self):
+        """드라이버가 필요한 작업 전에 호출 (없으면 setup_driver(), 복원한 세션 쿠키가 있으면 드라이버에 설정)"""
+        if self.driver is None:
+            self.setup_driver()
+        if self._restored_cookies:
+            cookies, self._restored_cookies = self._restored_cookies, None
+            self._load_cookies_into_driver(cookies)
+
+    def _load_cookies_into_driver(self, cookies):
+        """쿠키를 WebDriver에 설정 (쿠키 도메인 페이지에 먼저 접속해야 함)"""
+        self.driver.get(self.base_url)
+        for cookie in cookies:
+            driver_cookie = {
+                key: cookie[key]
+                for key in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'expiry')
+                if key in cookie
+            }
+            try:
+                self.driver.add_cookie(driver_cookie)
+            except Exception:
+                # 다른 하위 도메인(account.everytime.kr 등) 쿠키는 건너뜀
+                continue
+
     def get_timetable(self, year=2025, semester=1, save_to_file=True):
         """시간표 정보 수집"""
+        self._ensure_driver()
         try:
             print("시간표 페이지로 이동 중...")
             # 시간표 페이지로 이동
             self.driver.get(f"{self.base_url}/timetable")
-            time.sleep(3)
+            self.waiter.for_any(TIMETABLE_SELECTORS, "timetable")
             
             print(f"시간표 페이지 URL: {self.driver.current_url}")
             print(f"시간표 페이지 제목: {self.driver.title}")
@@ -257,92 +479,26 @@ class EverytimeCrawler:
                 semester_text = f"{year}년 {semester}학기"
                 print(f"'{semester_text}' 선택 시도 중...")
                 
-                # 학기 선택을 위한 다양한 선택자 시도
-                semester_selectors = [
-                    f"//a[contains(text(), '{semester_text}')]",
-                    f"//div[contains(text(), '{semester_text}')]",
-                    f"//span[contains(text(), '{semester_text}')]",
-                    f"//li[contains(text(), '{semester_text}')]",
-                    f"//button[contains(text(), '{semester_text}')]",
-                    f"//option[contains(text(), '{semester_text}')]"
-                ]
-                
-                semester_element = None
-                for selector in semester_selectors:
-                    try:
-                        elements = self.driver.find_elements(By.XPATH, selector)
-                        if elements:
-                            semester_element = elements[0]
-                            print(f"학기 선택 요소 발견: {selector}")
-                            break
-                    except:
-                        continue
-                
-                if semester_element:
-                    # 클릭 가능할 때까지 대기
-                    try:
-                        WebDriverWait(self.driver, 5).until(
-                            EC.element_to_be_clickable(semester_element)
-                        )
-                        semester_element.click()
-                        print(f"'{semester_text}' 선택 완료")
-                        time.sleep(3)  # 페이지 로딩 대기
-                    except Exception as click_error:
-                        print(f"학기 선택 클릭 오류: {click_error}")
-                        # JavaScript로 클릭 시도
-                        try:
-                            self.driver.execute_script("arguments[0].click();", semester_element)
-                            print(f"JavaScript로 '{semester_text}' 선택 완료")
-                            time.sleep(3)
-                        except:
-                            print("JavaScript 클릭도 실패")
-                else:
+                # #semesters 드롭다운이 있으면 그 자리에서 전환, 없으면 텍스트로 학기 링크 탐색
+                selected = self._select_semester(year, semester)
+                if selected is None:
+                    self._click_semester_link(semester_text)
+                elif not selected:
                     print(f"'{semester_text}' 선택 요소를 찾을 수 없습니다.")
-                    
-                    # 현재 페이지의 시간표 관련 링크들 출력
-                    print("사용 가능한 학기/시간표 관련 링크들:")
-                    time_links = self.driver.find_elements(By.XPATH, "//a[contains(@href, 'timetable') or contains(text(), '학기') or contains(text(), '년')]")
-                    for i, link in enumerate(time_links[:10]):  # 처음 10개만
-                        try:
-                            print(f"  {i+1}. {link.text.strip()} - {link.get_attribute('href')}")
-                        except:
-                            pass
                             
             except Exception as e:
                 print(f"학기 선택 중 오류: {e}")
                 print("기본 시간표를 사용합니다.")
             
             # 시간표 데이터 추출
-            timetable_data = []
-            
-            # 다양한 시간표 셀렉터 시도
-            selectors = [
-                ".subject",
-                ".course", 
-                ".lecture",
-                ".timetable-subject",
-                ".class",
-                "tr.course",
-                ".schedule-item",
-                ".timetable .subject",
-                "[class*='subject']",
-                "[class*='course']"
-            ]
+            html, timetable_data = self._extract_timetable(year, semester)
             
-            timetable_elements = []
-            for selector in selectors:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    print(f"시간표 요소를 '{selector}' 셀렉터로 {len(elements)}개 발견")
-                    timetable_elements = elements
-                    break
-            
-            if not timetable_elements:
+            if timetable_data is None:
                 print("시간표 요소를 찾을 수 없습니다. 페이지 구조를 분석합니다...")
                 
                 # 페이지 소스 저장
                 with open("timetable_debug.html", "w", encoding="utf-8") as f:
-                    f.write(self.driver.page_source)
+                    f.write(html)
                 print("시간표 페이지가 timetable_debug.html에 저장되었습니다.")
                 
                 # 스크린샷 저장
@@ -365,70 +521,7 @@ class EverytimeCrawler:
                                 if cell_texts:
                                     print(f"    행 {j+1}: {cell_texts}")
                 
-                return timetable_data
-            
-            # 시간표 데이터 파싱
-            for element in timetable_elements:
-                try:
-                    # 과목 정보 추출
-                    subject_info = {}
-                    
-                    # 과목명 추출 (h3 태그)
-                    try:
-                        subject_name_elem = element.find_element(By.TAG_NAME, "h3")
-                        subject_info['subject_name'] = subject_name_elem.text.strip()
-                    except:
-                        subject_info['subject_name'] = "알 수 없음"
-                    
-                    # p 태그 내에서 교수명과 강의실 추출
-                    try:
-                        p_elem = element.find_element(By.TAG_NAME, "p")
-                        
-                        # 교수명 (em 태그)
-                        try:
-                            professor_elem = p_elem.find_element(By.TAG_NAME, "em")
-                            subject_info['professor'] = professor_elem.text.strip()
-                        except:
-                            subject_info['professor'] = "교수 정보 없음"
-                        
-                        # 강의실 (span 태그)
-                        try:
-                            room_elem = p_elem.find_element(By.TAG_NAME, "span")
-                            subject_info['room'] = room_elem.text.strip() if room_elem.text.strip() else "강의실 정보 없음"
-                        except:
-                            subject_info['room'] = "강의실 정보 없음"
-                            
-                    except:
-                        subject_info['professor'] = "교수 정보 없음"
-                        subject_info['room'] = "강의실 정보 없음"
-                    
-                    # 시간 정보 추출 (style 속성에서)
-                    try:
-                        style_attr = element.get_attribute("style")
-                        time_info = self.parse_time_from_style(style_attr)
-                        subject_info['time'] = time_info
-                    except:
-                        subject_info['time'] = "시간 정보 없음"
-                    
-                    # 기본값 설정
-                    subject_data = {
-                        'subject_name': subject_info.get('subject_name', '알 수 없음'),
-                        'time': subject_info.get('time', '시간 정보 없음'),
-                        'room': subject_info.get('room', '강의실 정보 없음'),
-                        'professor': subject_info.get('professor', '교수 정보 없음'),
-                        'year': year,
-                        'semester': semester,
-                        'collected_at': datetime.now().isoformat()
-                    }
-                    
-                    # 유효한 데이터만 추가
-                    if subject_data['subject_name'] != '알 수 없음':
-                        timetable_data.append(subject_data)
-                        print(f"과목 추가: {subject_data['subject_name']} - {subject_data['professor']} - {subject_data['room']} - {subject_data['time']}")
-                    
-                except Exception as e:
-                    print(f"시간표 항목 파싱 오류: {e}")
-                    continue
+                return []
             
             if save_to_file and timetable_data:
                 # DataFrame으로 변환 후 CSV 저장
@@ -437,6 +530,8 @@ class EverytimeCrawler:
                 df.to_csv(filename, index=False, encoding='utf-8-sig')
                 print(f"시간표 데이터가 {filename}에 저장되었습니다.")
             
+            logger.info("시간표 %d개 과목 수집", len(timetable_data),
+                        extra=event('timetable_done', year=year, semester=semester, subjects=len(timetable_data)))
             return timetable_data
             
         except Exception as e:
@@ -447,116 +542,579 @@ class EverytimeCrawler:
             print(f"시간표 수집 오류: {e}")
             return []
     
-    def get_board_posts(self, board_id="free", pages=3, delay=2):
+    def get_timetables(self, semesters, save_to_file=False):
+        """
+        여러 학기 시간표를 한 번에 수집
+
+        시간표 페이지는 한 번만 열고 #semesters 드롭다운으로 학기를 그 자리에서 전환합니다.
+        드롭다운이 없는 레이아웃에서는 학기마다 get_timetable()로 대신 수집합니다.
+
+        Args:
+            semesters (list): (year, semester) 튜플 리스트 (예: [(2022, 1), (2022, 2), ...])
+            save_to_file (bool): True이면 모든 학기 과목을 CSV 파일 하나로 저장
+
+        Returns:
+            dict: {
+                'semesters': 학기별 결과 리스트
+                    [{'year', 'semester', 'subjects', 'subject_count', 'elapsed_ms', 'error'}, ...],
+                'subjects': 모든 학기 과목 리스트 (요청한 학기 순서),
+                'navigation_ms': 시간표 페이지 로딩 시간(ms),
+                'total_ms': 전체 소요 시간(ms)
+            }
+        """
+        self._ensure_driver()
+        started = time.perf_counter()
+        self.driver.get(f"{self.base_url}/timetable")
+        self.waiter.for_any(TIMETABLE_SELECTORS, "timetable")
+        navigation_ms = round((time.perf_counter() - started) * 1000, 1)
+        
+        results = []
+        for year, semester in semesters:
+            semester_started = time.perf_counter()
+            subjects, error = [], None
+            try:
+                selected = self._select_semester(year, semester)
+                if selected is None:
+                    subjects = self.get_timetable(year, semester, save_to_file=False)
+                elif not selected:
+                    error = f"{year}년 {semester}학기를 찾을 수 없습니다."
+                else:
+                    # 과목이 없는 학기는 빈 리스트
+                    subjects = self._extract_timetable(year, semester)[1] or []
+            except Exception as e:
+                error = str(e)
+            
+            elapsed_ms = round((time.perf_counter() - semester_started) * 1000, 1)
+            results.append({
+                'year': year,
+                'semester': semester,
+                'subjects': subjects,
+                'subject_count': len(subjects),
+                'elapsed_ms': elapsed_ms,
+                'error': error
+            })
+            if error:
+                logger.warning("❌ %d년 %d학기 시간표 수집 실패: %s", year, semester, error)
+            else:
+                logger.info("✅ %d년 %d학기 시간표 %d개 과목 수집", year, semester, len(subjects),
+                            extra=event('timetable_done', year=year, semester=semester,
+                                        subjects=len(subjects), elapsed_ms=elapsed_ms))
+        
+        all_subjects = [subject for result in results for subject in result['subjects']]
+        if save_to_file and all_subjects:
+            df = pd.DataFrame(all_subjects)
+            filename = f"timetable_batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            df.to_csv(filename, index=False, encoding='utf-8-sig')
+            print(f"시간표 데이터가 {filename}에 저장되었습니다.")
+        
+        return {
+            'semesters': results,
+            'subjects': all_subjects,
+            'navigation_ms': navigation_ms,
+            'total_ms': round((time.perf_counter() - started) * 1000, 1)
+        }
+    
+    def _click_semester_link(self, semester_text):
+        """학기 텍스트가 들어 있는 링크/버튼을 찾아 클릭 (#semesters 드롭다운이 없는 레이아웃용)"""
+        # 학기 선택을 위한 다양한 선택자 시도
+        semester_selectors = [
+            f"//a[contains(text(), '{semester_text}')]",
+            f"//div[contains(text(), '{semester_text}')]",
+            f"//span[contains(text(), '{semester_text}')]",
+            f"//li[contains(text(), '{semester_text}')]",
+            f"//button[contains(text(), '{semester_text}')]",
+            f"//option[contains(text(), '{semester_text}')]"
+        ]
+        
+        semester_element = None
+        for selector in semester_selectors:
+            try:
+                elements = self.driver.find_elements(By.XPATH, selector)
+                if elements:
+                    semester_element = elements[0]
+                    print(f"학기 선택 요소 발견: {selector}")
+                    break
+            except:
+                continue
+        
+        if semester_element:
+            old_subjects = self.driver.find_elements(By.CSS_SELECTOR, ".subject")
+            # 클릭 가능할 때까지 대기
+            try:
+                WebDriverWait(self.driver, 5).until(
+                    EC.element_to_be_clickable(semester_element)
+                )
+                semester_element.click()
+                print(f"'{semester_text}' 선택 완료")
+                self.waiter.for_refresh(old_subjects, [".subject"], "timetable_semester")
+            except Exception as click_error:
+                print(f"학기 선택 클릭 오류: {click_error}")
+                # JavaScript로 클릭 시도
+                try:
+                    self.driver.execute_script("arguments[0].click();", semester_element)
+                    print(f"JavaScript로 '{semester_text}' 선택 완료")
+                    self.waiter.for_refresh(old_subjects, [".subject"], "timetable_semester")
+                except:
+                    print("JavaScript 클릭도 실패")
+        else:
+            print(f"'{semester_text}' 선택 요소를 찾을 수 없습니다.")
+            
+            # 현재 페이지의 시간표 관련 링크들 출력
+            print("사용 가능한 학기/시간표 관련 링크들:")
+            time_links = self.driver.find_elements(By.XPATH, "//a[contains(@href, 'timetable') or contains(text(), '학기') or contains(text(), '년')]")
+            for i, link in enumerate(time_links[:10]):  # 처음 10개만
+                try:
+                    print(f"  {i+1}. {link.text.strip()} - {link.get_attribute('href')}")
+                except:
+                    pass
+
+    def _select_semester(self, year, semester):
+        """
+        #semesters 드롭다운에서 학기 선택 (페이지를 다시 불러오지 않고 그 자리에서 전환)
+
+        Returns:
+            bool | None: 선택했거나 이미 선택된 학기이면 True, 목록에 없는 학기이면 False,
+                #semesters 드롭다운이 없으면 None
+        """
+        selects = self.driver.find_elements(By.ID, "semesters")
+        if not selects:
+            return None
+
+        # option마다 value/text를 묻지 않고 드롭다운 HTML을 한 번 파싱해 위치를 찾음
+        options = selects[0].find_elements(By.TAG_NAME, "option")
+        parsed = BeautifulSoup(selects[0].get_attribute('outerHTML'), 'lxml').find_all('option')
+        value, text = f"{year}-{semester}", f"{year}년 {semester}학기"
+        for option, tag in zip(options, parsed):
+            if tag.get('value') != value and ' '.join(tag.get_text().split()) != text:
+                continue
+            if option.is_selected():
+                return True
+            old_subjects = self.driver.find_elements(By.CSS_SELECTOR, ".subject")
+            option.click()
+            self.waiter.for_refresh(old_subjects, [".subject"], "timetable_semester")
+            return True
+        return False
+
+    def _extract_timetable(self, year, semester):
+        """
+        현재 시간표 화면의 과목을 page_source 한 번으로 추출
+
+        Returns:
+            tuple: (페이지 HTML, 과목 리스트), 과목 요소를 찾지 못하면 과목 리스트는 None
+        """
+        timetable_data = []
+        
+        # 페이지 HTML을 한 번만 가져와 모든 과목을 같은 트리에서 추출 (과목마다 WebDriver 왕복 없음)
+        html = self.driver.page_source
+        soup = BeautifulSoup(html, 'lxml')
+        
+        # 시간표 셀렉터 탐색 (이전에 성공한 셀렉터를 먼저 조회)
+        selector, timetable_elements = self.selector_cache.find(
+            ('timetable',), self.TIMETABLE_SUBJECT_SELECTORS, soup.select
+        )
+        if not timetable_elements:
+            return html, None
+        logger.debug("시간표 요소를 '%s' 셀렉터로 %d개 발견", selector, len(timetable_elements))
+        
+        # 시간표 데이터 파싱
+        collected_at = datetime.now().isoformat()
+        days = read_day_columns(soup)
+        # 격자 기준은 페이지당 한 번 읽고 모든 과목의 top/height를 한 번에 분으로 변환
+        grid = TimeGrid.from_soup(soup)
+        subject_infos = [extract_subject_fields(element) for element in timetable_elements]
+        time_ranges = grid.time_ranges([info['style'] for info in subject_infos])
+        for element, subject_info, time_range in zip(timetable_elements, subject_infos, time_ranges):
+            try:
+                day = subject_day(element, days)
+                subject_data = {
+                    'subject_name': subject_info['subject_name'],
+                    'time': format_time_range(time_range),
+                    'time_slots': [make_slot(day, *time_range)] if day and time_range else [],
+                    'room': subject_info['room'],
+                    'professor': subject_info['professor'],
+                    'year': year,
+                    'semester': semester,
+                    'collected_at': collected_at
+                }
+                
+                # 유효한 데이터만 추가
+                if subject_data['subject_name'] != UNKNOWN_SUBJECT:
+                    timetable_data.append(subject_data)
+                    logger.debug("과목 추가: %s - %s - %s - %s", subject_data['subject_name'],
+                                 subject_data['professor'], subject_data['room'], subject_data['time'])
+                
+            except Exception as e:
+                logger.warning("시간표 항목 파싱 오류: %s", e)
+                continue
+        
+        return html, timetable_data
+
+    def get_board_posts(self, board_id="free", pages=3, delay=2, fetch_mode="driver", start_page=1,
+                        incremental=False, since=None, until=None):
         """
         게시판 글 목록 크롤링 (개선된 버전)
         
         Args:
             board_id (str): 게시판 ID (free, secret, freshman 등)
             pages (int): 크롤링할 페이지 수
-            delay (int): 페이지 간 대기 시간(초)
+            delay (int): 페이지 요청 간 최소 간격(초, 속도 제한 전용)
+            fetch_mode (str): 'driver'는 브라우저로, 'http'는 로그인 쿠키를 복사한
+                requests 세션으로 목록 페이지를 가져옴
+            start_page (int): 크롤링을 시작할 페이지 번호
+            incremental (bool): True이면 이전 실행에서 수집한 글 번호에 도달하는 즉시 중단하고
+                새 글만 반환 (high_water_marks에 게시판별로 저장)
+            since (datetime | str): 이 시각 이후(포함)에 작성된 글만 수집
+            until (datetime | str): 이 시각 이전(미포함)에 작성된 글만 수집.
+                since/until을 지정하면 until 직전 글이 있는 페이지를 탐색으로 찾은 뒤
+                그 페이지부터 최대 pages개 페이지를 since에 도달할 때까지 수집
             
         Returns:
             list: 게시글 정보 리스트
         """
-        # 실제 에브리타임 게시판 URL 매핑 (성남캠 기준)
-        board_url_map = {
-            "free": "387605",        # 성남캠 자유게시판
-            "secret": "375151",      # 비밀게시판
-            "graduate": "387612",    # 졸업생게시판
-            "freshman": "387615",    # 새내기게시판
-        }
+        if fetch_mode not in ("driver", "http"):
+            raise ValueError(f"지원하지 않는 fetch_mode: {fetch_mode}")
         
-        board_name_map = {
-            "free": "자유게시판",
-            "secret": "비밀게시판", 
-            "freshman": "새내기게시판",
-            "graduate": "졸업생게시판",
-        }
+        date_range = since is not None or until is not None
+        if date_range and incremental:
+            raise ValueError("since/until과 incremental은 함께 사용할 수 없습니다.")
         
-        if board_id not in board_url_map:
-            print(f"❌ 지원하지 않는 게시판: {board_id}")
-            print(f"📝 지원하는 게시판: {list(board_url_map.keys())}")
+        if board_id not in self.BOARD_URL_MAP:
+            logger.error("❌ 지원하지 않는 게시판: %s (지원: %s)", board_id, list(self.BOARD_URL_MAP),
+                         extra=event('board_unsupported', board=board_id))
             return []
         
-        board_name = board_name_map.get(board_id, board_id)
-        board_number = board_url_map[board_id]
+        if fetch_mode == "driver":
+            self._ensure_driver()
+        
+        board_name = self.BOARD_NAME_MAP.get(board_id, board_id)
+        board_number = self.BOARD_URL_MAP[board_id]
         
-        print(f"🔍 '{board_name}' 게시판 크롤링 시작...")
-        print(f"🌐 게시판 URL: https://everytime.kr/{board_number}")
+        logger.info("🔍 '%s' 게시판 크롤링 시작 (https://everytime.kr/%s)", board_name, board_number,
+                    extra=event('board_start', board=board_id, start_page=start_page, pages=pages))
+        started = time.perf_counter()
         
+        since_id = self.high_water_marks.get(board_id) if incremental else None
+        if since_id is not None:
+            logger.info("🔖 증분 모드: 글 번호 %s 이후의 새 글만 수집", since_id,
+                        extra=event('incremental', board=board_id, since_id=since_id))
+        
+        if date_range:
+            all_posts = self._get_board_posts_by_date(
+                board_id, board_number, pages, delay, fetch_mode, start_page,
+                self._to_datetime(since), self._to_datetime(until)
+            )
+            reached = False
+        elif fetch_mode == "http":
+            all_posts, reached = self._get_board_posts_http(board_id, board_number, pages, delay, start_page, since_id)
+        else:
+            all_posts, reached = self._get_board_posts_driver(board_id, board_number, pages, delay, start_page, since_id)
+        
+        # 이전 mark까지 빈틈없이 수집한 경우에만 mark를 올림 (중간에 끊기면 다음 실행에서 다시 수집)
+        if incremental and (reached or since_id is None):
+            self.high_water_marks.update(board_id, all_posts)
+        
+        logger.info("🎉 총 %d개 게시글 수집 완료!", len(all_posts),
+                    extra=event('board_done', board=board_id, posts=len(all_posts),
+                                elapsed_ms=round((time.perf_counter() - started) * 1000, 1)))
+        return all_posts
+    
+    def _get_board_posts_driver(self, board_id, board_number, pages, delay, start_page=1, since_id=None):
+        """WebDriver로 게시판 목록 페이지를 이동하며 파싱"""
         all_posts = []
+        reached = False
+        limiter = RateLimiter.from_delay(delay)
         
         try:
-            # 게시판 페이지로 이동
             board_url = f"{self.base_url}/{board_number}"
-            self.driver.get(board_url)
-            time.sleep(3)
-            
-            print(f"📍 현재 URL: {self.driver.current_url}")
+            last_page = start_page + pages - 1
             
-            for page in range(1, pages + 1):
-                print(f"📄 페이지 {page}/{pages} 크롤링 중...")
+            for page in range(start_page, last_page + 1):
+                logger.debug("📄 페이지 %d/%d 크롤링 중...", page, last_page)
                 
-                # 페이지 이동 (첫 페이지가 아닌 경우)
-                if page > 1:
-                    page_url = f"{board_url}?page={page}"
+                # 페이지 이동 (delay는 페이지 간 최소 간격으로만 사용)
+                self.metrics.observe('throttle', limiter.acquire())
+                page_started = time.perf_counter()
+                page_url = board_url if page == 1 else f"{board_url}?page={page}"
+                with self.metrics.stage('navigation'):
                     self.driver.get(page_url)
-                    time.sleep(delay)
+                with self.metrics.stage('wait'):
+                    self.waiter.for_any(BOARD_READY_SELECTORS, "board_list")
+                
+                if page == start_page:
+                    logger.debug("📍 현재 URL: %s", self.driver.current_url)
                 
                 # 페이지의 게시글 추출
-                posts = self._extract_posts_from_current_page(board_id, page)
+                posts, reached = split_new_posts(self._extract_posts_from_current_page(board_id, page), since_id)
                 all_posts.extend(posts)
+                self.metrics.inc('posts', len(posts))
+                log_page_done(logger, board_id, page, len(posts), page_started)
                 
-                print(f"✅ 페이지 {page}에서 {len(posts)}개 게시글 수집")
+                if reached:
+                    logger.info("🔖 이미 수집한 글에 도달하여 중단합니다.", extra=event('reached_mark', board=board_id, page=page))
+                    break
                 
         except Exception as e:
-            print(f"❌ 게시판 크롤링 중 오류 발생: {e}")
+            logger.error("❌ 게시판 크롤링 중 오류 발생: %s", e, extra=event('board_error', board=board_id))
+            self.metrics.inc('errors')
             self._save_board_debug_info(board_id)
         
-        print(f"🎉 총 {len(all_posts)}개 게시글 수집 완료!")
+        return all_posts, reached
+    
+    def _get_board_posts_http(self, board_id, board_number, pages, delay, start_page=1, since_id=None):
+        """requests 세션으로 게시판 목록 페이지를 가져와 파싱 (브라우저 렌더링 없음)"""
+        all_posts = []
+        reached = False
+        board_url = f"{self.base_url}/{board_number}"
+        limiter = RateLimiter.from_delay(delay)
+        last_page = start_page + pages - 1
+        
+        for page in range(start_page, last_page + 1):
+            logger.debug("📄 페이지 %d/%d 크롤링 중 (HTTP)...", page, last_page)
+            self.metrics.observe('throttle', limiter.acquire())
+            page_started = time.perf_counter()
+            
+            try:
+                with self.metrics.stage('navigation'):
+                    html = self._fetch_board_page_html(board_url, page)
+            except requests.RequestException as e:
+                logger.error("❌ 페이지 %d 요청 실패: %s", page, e, extra=event('page_error', board=board_id, page=page))
+                self.metrics.inc('errors')
+                break
+            
+            if html is None:
+                break
+            
+            page_url = board_url if page == 1 else f"{board_url}?page={page}"
+            posts, reached = split_new_posts(self._extract_posts_cached(page_url, html, board_id, page), since_id)
+            all_posts.extend(posts)
+            self.metrics.inc('posts', len(posts))
+            log_page_done(logger, board_id, page, len(posts), page_started)
+            
+            if reached:
+                logger.info("🔖 이미 수집한 글에 도달하여 중단합니다.", extra=event('reached_mark', board=board_id, page=page))
+                break
+        
+        return all_posts, reached
+    
+    def _get_board_posts_by_date(self, board_id, board_number, pages, delay, fetch_mode, start_page,
+                                 since, until):
+        """
+        작성 시각 범위 [since, until)의 게시글 수집
+        
+        목록은 최신 글부터 정렬되어 있으므로 start_page부터 1, 2, 4, 8...칸씩 건너뛰며(gallop)
+        until 이전 글이 처음 나오는 페이지를 지나친 뒤 그 구간을 이진 탐색합니다.
+        찾은 페이지부터는 since보다 오래된 글이 나올 때까지만 순서대로 수집하므로
+        과거 구간 수집에 필요한 페이지 로드가 O(log 페이지 수) + 범위 페이지 수로 줄어듭니다.
+        """
+        limiter = RateLimiter.from_delay(delay)
+        loaded = {}
+        
+        def load(page):
+            if page not in loaded:
+                self.metrics.observe('throttle', limiter.acquire())
+                loaded[page] = self._load_board_page(board_id, board_number, page, fetch_mode)
+            return loaded[page]
+        
+        def newer_than_until(page):
+            # 페이지의 모든 글이 until 이후이면 True (빈 페이지는 마지막 페이지 뒤로 간주)
+            times = self._created_datetimes(load(page))
+            return until is not None and bool(times) and min(times) >= until
+        
+        first_page = start_page
+        if newer_than_until(start_page):
+            low, step = start_page, 1
+            high = low + step
+            while newer_than_until(high):
+                low, step = high, step * 2
+                high = low + step
+            
+            # low는 until 이후 글만 있는 페이지, high는 until 이전 글이 있는(또는 빈) 페이지
+            while high - low > 1:
+                middle = (low + high) // 2
+                if newer_than_until(middle):
+                    low = middle
+                else:
+                    high = middle
+            first_page = high
+        
+        logger.info("🔎 범위 시작 페이지: %d (탐색 중 페이지 로드 %d회)", first_page, len(loaded),
+                    extra=event('range_start', board=board_id, page=first_page, loads=len(loaded)))
+        
+        all_posts = []
+        for page in range(first_page, first_page + pages):
+            page_started = time.perf_counter()
+            posts = load(page)
+            if not posts:
+                break
+            
+            in_range = []
+            for post in posts:
+                created = self._to_datetime(post.get('created_at'))
+                if (created is not None and (since is None or created >= since)
+                        and (until is None or created < until)):
+                    in_range.append(post)
+            all_posts.extend(in_range)
+            self.metrics.inc('posts', len(in_range))
+            log_page_done(logger, board_id, page, len(in_range), page_started,
+                                message="✅ 페이지 %d에서 범위 내 게시글 %d개 수집")
+            
+            times = self._created_datetimes(posts)
+            if since is not None and times and min(times) < since:
+                break
+        
+        logger.info("📄 총 페이지 로드 %d회", len(loaded), extra=event('range_done', board=board_id, loads=len(loaded)))
         return all_posts
     
+    def _load_board_page(self, board_id, board_number, page, fetch_mode):
+        """게시판 목록 한 페이지를 가져와 파싱 (실패하거나 로그인이 풀리면 빈 리스트)"""
+        board_url = f"{self.base_url}/{board_number}"
+        page_url = board_url if page == 1 else f"{board_url}?page={page}"
+        
+        if fetch_mode == "http":
+            try:
+                with self.metrics.stage('navigation'):
+                    html = self._fetch_board_page_html(board_url, page)
+            except requests.RequestException as e:
+                logger.error("❌ 페이지 %d 요청 실패: %s", page, e, extra=event('page_error', board=board_id, page=page))
+                self.metrics.inc('errors')
+                return []
+            return self._extract_posts_cached(page_url, html, board_id, page) if html else []
+        
+        try:
+            with self.metrics.stage('navigation'):
+                self.driver.get(page_url)
+            with self.metrics.stage('wait'):
+                self.waiter.for_any(BOARD_READY_SELECTORS, "board_list")
+        except Exception as e:
+            logger.error("❌ 페이지 %d 이동 실패: %s", page, e, extra=event('page_error', board=board_id, page=page))
+            self.metrics.inc('errors')
+            return []
+        return self._extract_posts_from_current_page(board_id, page)
+    
+    @staticmethod
+    def _to_datetime(value):
+        """datetime 또는 ISO 형식 문자열을 datetime으로 변환 (None은 그대로)"""
+        if value is None or isinstance(value, datetime):
+            return value
+        return datetime.fromisoformat(value)
+    
+    @classmethod
+    def _created_datetimes(cls, posts):
+        """게시글들의 created_at 중 해석 가능한 값 목록"""
+        return [cls._to_datetime(p['created_at']) for p in posts if p.get('created_at')]
+    
+    def _fetch_board_page_html(self, board_url, page):
+        """게시판 목록 페이지 HTML 요청 (로그인이 풀린 경우 None)"""
+        params = {'page': page} if page > 1 else None
+        response = self.session.get(board_url, params=params, timeout=self.http_timeout)
+        response.raise_for_status()
+        
+        if "login" in response.url or "account" in response.url:
+            logger.warning("⚠️ 로그인 페이지로 이동되었습니다: %s (login() 후 sync_session_cookies()를 먼저 호출해주세요.)",
+                           response.url, extra=event('logged_out', url=response.url))
+            return None
+        
+        return response.text
+    
     def _extract_posts_from_current_page(self, board_id, page_num):
-        """현재 페이지에서 게시글 정보 추출"""
-        posts = []
+        """
+        현재 페이지에서 게시글 정보 추출 (page_source를 한 번만 가져와 lxml로 파싱)
         
+        page_source 읽기와 추출을 parse 단계 하나로 기록해 HTTP 모드와 같이 페이지당 한 번만 기록됩니다.
+        """
         try:
             # 페이지 로딩 대기
             WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
+        except Exception as e:
+            logger.error("❌ 페이지 파싱 중 오류: %s", e, extra=event('page_error', board=board_id, page=page_num))
+            self.metrics.inc('errors')
+            return []
+        
+        with self.metrics.stage('parse'):
+            try:
+                # 게시글마다 outerHTML을 요청하는 대신 WebDriver 왕복 1회로 전체 HTML 확보
+                html = self.driver.page_source
+                page_url = self.driver.current_url
+            except Exception as e:
+                logger.error("❌ 페이지 파싱 중 오류: %s", e, extra=event('page_error', board=board_id, page=page_num))
+                self.metrics.inc('errors')
+                return []
             
-            # 에브리타임 게시판 구조 분석을 위한 다양한 셀렉터 시도
-            post_selectors = [
-                "article.list",           # 일반적인 게시글 구조
-                ".article",               # 기본 article 클래스
-                "tr.list",               # 테이블 형태 게시판
-                ".board-item",           # 커스텀 게시판 아이템
-                ".post-item",            # 포스트 아이템
-                ".content-wrapper a",    # 링크 형태 게시글
-                ".list-item"             # 리스트 아이템
-            ]
-            
-            post_elements = []
-            used_selector = None
+            return self._extract_posts_with_cache(page_url, html, board_id, page_num)
+    
+    def _extract_posts_cached(self, page_url, html, board_id, page_num):
+        """page_cache를 거쳐 게시글 추출 (이전과 같은 게시글 블록은 다시 파싱하지 않음, parse 단계로 기록)"""
+        with self.metrics.stage('parse'):
+            return self._extract_posts_with_cache(page_url, html, board_id, page_num)
+    
+    def _extract_posts_with_cache(self, page_url, html, board_id, page_num):
+        """_extract_posts_cached의 본체 (호출자가 parse 단계를 기록)"""
+        if self.page_cache is None:
+            return self._extract_posts_from_html(html, board_id, page_num)
+        
+        return self.page_cache.extract(
+            page_url, html,
+            parse_blocks=lambda blocks: self._parse_post_blocks(blocks, board_id, page_num),
+            parse_page=lambda: self._extract_posts_from_html(html, board_id, page_num)
+        )
+    
+    def _parse_post_blocks(self, blocks, board_id, page_num, parser='lxml'):
+        """
+        <article class="list"> 블록 문자열들을 파싱 (_extract_posts_from_html과 같은 결과 형식)
+        
+        Returns:
+            list: 블록과 같은 길이의 게시글 리스트 (추출 실패한 블록은 None)
+        """
+        selector = self.POST_SELECTORS[0]  # 'article.list'
+        elements = BeautifulSoup(''.join(blocks), parser).select(selector)
+        if len(elements) != len(blocks):
+            # 블록을 합쳐 파싱한 결과가 어긋나면 블록마다 따로 파싱
+            elements = [BeautifulSoup(block, parser).select_one(selector) for block in blocks]
+        
+        collected_at = datetime.now().isoformat()
+        posts = []
+        for element in elements:
+            post_info = None
+            if element is not None:
+                try:
+                    post_info = self._parse_post_element(element, selector)
+                except Exception as e:
+                    logger.warning("⚠️ 게시글 블록 추출 중 오류: %s", e, extra=event('post_error', board=board_id, page=page_num))
+            if post_info:
+                post_info['board_id'] = board_id
+                post_info['page'] = page_num
+                post_info['collected_at'] = collected_at
+            posts.append(post_info)
+        
+        add_created_at([post for post in posts if post])
+        return posts
+    
+    def _extract_posts_from_html(self, html, board_id, page_num, parser='lxml'):
+        """게시판 목록 HTML에서 게시글 정보 추출 (_extract_single_post_info와 같은 셀렉터 사용)
+
+        전체 페이지를 한 번만 파싱하고 모든 게시글을 같은 트리에서 추출합니다.
+        """
+        posts = []
+        
+        try:
+            soup = BeautifulSoup(html, parser)
             
-            for selector in post_selectors:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    post_elements = elements
-                    used_selector = selector
-                    print(f"✅ '{selector}' 셀렉터로 {len(elements)}개 요소 발견")
-                    break
+            # 게시판별로 이전에 성공한 셀렉터를 먼저 조회
+            used_selector, post_elements = self.selector_cache.find(
+                ('posts', board_id), self.POST_SELECTORS, soup.select
+            )
+            if used_selector:
+                logger.debug("✅ '%s' 셀렉터로 %d개 요소 발견", used_selector, len(post_elements))
             
             if not post_elements:
-                print("⚠️ 게시글 요소를 찾을 수 없습니다.")
+                logger.warning("⚠️ 게시글 요소를 찾을 수 없습니다.", extra=event('no_posts', board=board_id, page=page_num))
                 return posts
             
-            # 각 게시글에서 정보 추출
             for idx, element in enumerate(post_elements[:20]):  # 상위 20개만 처리
                 try:
-                    post_info = self._extract_single_post_info(element, used_selector)
+                    post_info = self._parse_post_element(element, used_selector)
                     if post_info:
                         post_info['board_id'] = board_id
                         post_info['page'] = page_num
@@ -564,141 +1122,112 @@ class EverytimeCrawler:
                         posts.append(post_info)
                 
                 except Exception as e:
-                    print(f"⚠️ 게시글 {idx+1} 추출 중 오류: {e}")
+                    logger.warning("⚠️ 게시글 %d 추출 중 오류: %s", idx + 1, e,
+                                   extra=event('post_error', board=board_id, page=page_num))
                     continue
+            
+            # 상대 시간("3분 전", "07/01")을 수집 시각 기준 절대 시각으로 한 번에 변환
+            add_created_at(posts)
         
         except Exception as e:
-            print(f"❌ 페이지 파싱 중 오류: {e}")
+            logger.error("❌ 페이지 파싱 중 오류: %s", e, extra=event('page_error', board=board_id, page=page_num))
         
         return posts
     
     def _extract_single_post_info(self, element, selector_used):
         """개별 게시글에서 정보 추출 (에브리타임 최신 구조에 최적화)"""
-        post_info = {}
-        
         try:
             # BeautifulSoup으로 더 정확한 파싱
             soup = BeautifulSoup(element.get_attribute('outerHTML'), 'html.parser')
-            
-            # 에브리타임 실제 구조에 맞는 제목 추출
-            # <h2 class="medium bold">제목</h2>
-            title = "제목 없음"
-            title_elem = soup.select_one('h2.medium.bold')
-            if title_elem:
-                title = title_elem.get_text(strip=True)
-            
-            # 대체 제목 셀렉터 시도
-            if not title or title == "제목 없음":
-                alt_selectors = ['.title', '.subject', 'h3', 'h4', '.article-title']
-                for sel in alt_selectors:
-                    elem = soup.select_one(sel)
-                    if elem and elem.get_text(strip=True):
-                        title = elem.get_text(strip=True)
-                        break
-            
-            # 내용 추출
-            # <p class="medium">내용</p>
-            content = ""
-            content_elem = soup.select_one('p.medium')
-            if content_elem:
-                content = content_elem.get_text(strip=True)
-                # <br> 태그를 공백으로 변환
-                content = content.replace('\n', ' ').replace('\r', '')
-            
-            # 작성자 추출  
-            # <h3 class="small">익명</h3>
-            author = "익명"
-            author_elem = soup.select_one('h3.small')
-            if author_elem:
-                author = author_elem.get_text(strip=True)
-            
-            # 작성시간 추출
-            # <time class="small">3분 전</time>
-            created_time = ""
-            time_elem = soup.select_one('time.small')
-            if time_elem:
-                created_time = time_elem.get_text(strip=True)
-            
-            # 댓글 수 추출
-            # <li title="댓글" class="comment">2</li>
-            comment_count = "0"
-            comment_elem = soup.select_one('li.comment')
-            if comment_elem:
-                comment_count = comment_elem.get_text(strip=True)
-            
-            # 조회수 추출 (있는 경우)
-            view_count = None
-            view_elem = soup.select_one('li.view')
-            if view_elem:
-                view_count = view_elem.get_text(strip=True)
-            
-            # 게시글 링크 추출
-            # <a class="article" href="/387605/v/384508581">
-            post_link = None
-            link_elem = soup.select_one('a.article[href]')
-            if link_elem:
-                href = link_elem.get('href')
-                if href:
-                    if href.startswith('/'):
-                        post_link = f"{self.base_url}{href}"
-                    else:
-                        post_link = href
-            
-            # 게시글 정보 구성
-            post_info = {
-                'title': title,
-                'content': content,
-                'author': author,
-                'created_time': created_time,
-                'comment_count': comment_count,
-                'view_count': view_count,
-                'post_link': post_link,
-                'selector_used': selector_used
-            }
-            
-            return post_info
+            return self._parse_post_element(soup, selector_used)
             
         except Exception as e:
-            print(f"⚠️ 게시글 파싱 중 오류: {e}")
+            logger.warning("⚠️ 게시글 파싱 중 오류: %s", e)
             return None
-            
-            # 조회수 추출 (있는 경우)
-            view_selectors = [
-                '.view',
-                '.views',
-                '.hit',
-                '.read-count'
-            ]
-            
-            view_count = None
-            for view_sel in view_selectors:
-                view_elem = soup.select_one(view_sel)
-                if view_elem:
-                    view_text = view_elem.get_text(strip=True)
-                    import re
-                    numbers = re.findall(r'\d+', view_text)
-                    if numbers:
-                        view_count = numbers[0]
-                        break
-            
-            # 최소한 제목이 있는 경우만 반환
-            if title and len(title) > 1:
-                post_info = {
-                    'title': title,
-                    'author': author,
-                    'created_time': created_time,
-                    'comment_count': comment_count,
-                    'view_count': view_count,
-                    'post_link': post_link,
-                    'selector_used': selector_used
-                }
-                
-                return post_info
+    
+    def _parse_post_element(self, soup, selector_used):
+        """파싱된 게시글 노드(BeautifulSoup)에서 정보 추출"""
+        # 에브리타임 실제 구조에 맞는 제목 추출
+        # <h2 class="medium bold">제목</h2>
+        title = "제목 없음"
+        title_elem = soup.select_one('h2.medium.bold')
+        if title_elem:
+            title = title_elem.get_text(strip=True)
         
-        except Exception as e:
-            print(f"⚠️ 게시글 정보 추출 중 오류: {e}")
+        # 대체 제목 셀렉터 시도
+        if not title or title == "제목 없음":
+            alt_selectors = ['.title', '.subject', 'h3', 'h4', '.article-title']
+            for sel in alt_selectors:
+                elem = soup.select_one(sel)
+                if elem and elem.get_text(strip=True):
+                    title = elem.get_text(strip=True)
+                    break
         
-        return None
+        # 내용 추출
+        # <p class="medium">내용</p>
+        content = ""
+        content_elem = soup.select_one('p.medium')
+        if content_elem:
+            content = content_elem.get_text(strip=True)
+            # <br> 태그를 공백으로 변환
+            content = content.replace('\n', ' ').replace('\r', '')
+        
+        # 작성자 추출  
+        # <h3 class="small">익명</h3>
+        author = "익명"
+        author_elem = soup.select_one('h3.small')
+        if author_elem:
+            author = author_elem.get_text(strip=True)
+        
+        # 작성시간 추출
+        # <time class="small">3분 전</time>
+        created_time = ""
+        time_elem = soup.select_one('time.small')
+        if time_elem:
+            created_time = time_elem.get_text(strip=True)
+        
+        # 댓글 수 추출
+        # <li title="댓글" class="comment">2</li>
+        comment_count = "0"
+        comment_elem = soup.select_one('li.comment')
+        if comment_elem:
+            comment_count = comment_elem.get_text(strip=True)
+        
+        # 조회수 추출 (있는 경우)
+        view_count = None
+        view_elem = soup.select_one('li.view')
+        if view_elem:
+            view_count = view_elem.get_text(strip=True)
+        
+        # 게시글 링크 추출
+        # <a class="article" href="/387605/v/384508581">
+        post_link = None
+        link_elem = soup.select_one('a.article[href]')
+        if link_elem is None and soup.name == 'a' and 'article' in soup.get('class', []):
+            # 셀렉터가 a.article 자체를 가리키는 경우
+            link_elem = soup
+        if link_elem:
+            href = link_elem.get('href')
+            if href:
+                if href.startswith('/'):
+                    post_link = f"{self.base_url}{href}"
+                else:
+                    post_link = href
+        
+        # 게시글 정보 구성
+        post_info = {
+            'title': title,
+            'content': content,
+            'author': author,
+            'created_time': created_time,
+            'comment_count': comment_count,
+            'view_count': view_count,
+            'post_link': post_link,
+            'article_id': extract_article_id(post_link),
+            'selector_used': selector_used
+        }
+        
+        return post_info
     
     def get_post_detail(self, post_url):
         """
@@ -710,135 +1239,174 @@ class EverytimeCrawler:
         Returns:
             dict: 게시글 상세 정보
         """
+        self._ensure_driver()
         try:
-            print(f"📖 게시글 상세 정보 크롤링: {post_url}")
-            
-            self.driver.get(post_url)
-            time.sleep(3)  # 페이지 로딩 대기
-            
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            logger.debug("📖 게시글 상세 정보 크롤링: %s", post_url)
+            started = time.perf_counter()
+            
+            with self.metrics.stage('navigation'):
+                self.driver.get(post_url)
+            with self.metrics.stage('wait'):
+                self.waiter.for_any(POST_DETAIL_SELECTORS, "post_detail")
+            with self.metrics.stage('parse'):
+                html = self.driver.page_source
+                detail_info = self._parse_post_detail(html, post_url)
+            self.metrics.inc('comments', detail_info['comment_count'])
+            log_post_done(logger, extract_article_id(post_url), detail_info['comment_count'], started)
+            return detail_info
             
-            # 게시글 제목 추출
-            title = ""
-            title_selectors = ['h1', 'h2.large', '.title', '.subject']
-            for title_sel in title_selectors:
-                title_elem = soup.select_one(title_sel)
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    if title:
-                        break
+        except Exception as e:
+            logger.error("❌ 게시글 상세 정보 크롤링 실패: %s (%s)", post_url, e,
+                         extra=event('post_error', post_id=extract_article_id(post_url)))
+            self.metrics.inc('errors')
+            return None
+    
+    def _parse_post_detail(self, html, post_url):
+        """게시글 상세 페이지 HTML을 get_post_detail과 같은 형태의 dict로 변환"""
+        soup = BeautifulSoup(html, 'lxml')
+        
+        # 게시글 제목 추출
+        title = ""
+        title_selectors = ['h1', 'h2.large', '.title', '.subject']
+        for title_sel in title_selectors:
+            title_elem = soup.select_one(title_sel)
+            if title_elem:
+                title = title_elem.get_text(strip=True)
+                if title:
+                    break
+        
+        # 게시글 내용 추출 (에브리타임 구조에 맞게)
+        content = ""
+        content_selectors = [
+            'p.large',  # 에브리타임 게시글 본문 (h2.large는 제목)
+            '.content',
+            '.article-content', 
+            '.post-content',
+            '.text',
+            '.body'
+        ]
+        
+        for content_sel in content_selectors:
+            content_elem = soup.select_one(content_sel)
+            if content_elem:
+                content = content_elem.get_text(strip=True)
+                if content and len(content) > 5:
+                    break
+        
+        # 댓글 추출: ul.comments를 한 번 순회하며 댓글 id, 부모 댓글 id, 대댓글 깊이까지 추출
+        comments = parse_comments(soup)
+        
+        return {
+            'url': post_url,
+            'title': title,
+            'content': content,
+            'comments': comments,
+            'comment_count': len(comments),
+            'collected_at': datetime.now().isoformat()
+        }
+    
+    def fetch_post_details(self, urls, concurrency=4, rate=2.0):
+        """
+        여러 게시글의 상세 정보를 동시에 수집 (로그인 쿠키를 복사한 HTTP 세션 사용)
+        
+        Args:
+            urls (list): 게시글 URL 리스트
+            concurrency (int): 동시에 진행할 최대 요청 수
+            rate (float): 초당 최대 요청 수 (None이면 제한 없음)
             
-            # 게시글 내용 추출 (에브리타임 구조에 맞게)
-            content = ""
-            content_selectors = [
-                '.large',  # 에브리타임 게시글 본문
-                '.content',
-                '.article-content', 
-                '.post-content',
-                '.text',
-                '.body'
-            ]
+        Returns:
+            list: get_post_detail과 같은 형태의 상세 정보 리스트 (입력 순서 유지, 실패한 URL 제외)
+        
+        이미 이벤트 루프 안에서 실행 중이면 `async for detail in crawler.iter_post_details(urls)`를 사용하세요.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError("실행 중인 이벤트 루프 안에서는 iter_post_details()를 사용해주세요.")
+        
+        async def collect():
+            return [detail async for detail in self.iter_post_details(urls, concurrency, rate)]
+        
+        # 호출마다 새 루프를 만들지 않고 크롤러의 루프를 재사용 (close()에서 종료)
+        if self._detail_loop is None or self._detail_loop.is_closed():
+            self._detail_loop = asyncio.new_event_loop()
+        details = self._detail_loop.run_until_complete(collect())
+        order = {url: idx for idx, url in enumerate(urls)}
+        details.sort(key=lambda detail: order[detail['url']])
+        return details
+    
+    async def iter_post_details(self, urls, concurrency=4, rate=2.0):
+        """
+        게시글 상세 정보를 완료되는 순서대로 yield하는 비동기 제너레이터
+        
+        세마포어로 동시 요청 수를 제한하고, 토큰 버킷으로 요청 시작 속도를 제한합니다.
+        네트워크 대기와 파싱은 스레드 풀에서 실행되어 서로 겹칩니다.
+        
+        Args:
+            urls (list): 게시글 URL 리스트
+            concurrency (int): 동시에 진행할 최대 요청 수 (최대 HTTP_POOL_SIZE)
+            rate (float): 초당 최대 요청 수 (None이면 제한 없음)
+        """
+        concurrency = max(1, min(int(concurrency), self.HTTP_POOL_SIZE))
+        limiter = RateLimiter(rate)
+        semaphore = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_running_loop()
+        
+        logger.info("📖 게시글 %d개 상세 정보 수집 시작 (동시 %d개, 초당 %s회)", len(urls), concurrency, rate or '무제한',
+                    extra=event('details_start', posts=len(urls), concurrency=concurrency))
+        
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            async def fetch(url):
+                async with semaphore:
+                    self.metrics.observe('throttle', await limiter.acquire_async())
+                    return await loop.run_in_executor(executor, self._fetch_post_detail_http, url)
             
-            for content_sel in content_selectors:
-                content_elem = soup.select_one(content_sel)
-                if content_elem:
-                    content = content_elem.get_text(strip=True)
-                    if content and len(content) > 5:
-                        break
+            tasks = [asyncio.ensure_future(fetch(url)) for url in urls]
+            try:
+                for task in asyncio.as_completed(tasks):
+                    detail = await task
+                    if detail:
+                        yield detail
+            finally:
+                for task in tasks:
+                    task.cancel()
+    
+    def _fetch_post_detail_http(self, post_url):
+        """HTTP 세션으로 게시글 상세 페이지를 가져와 파싱 (실패 시 None)"""
+        try:
+            started = time.perf_counter()
+            with self.metrics.stage('navigation'):
+                response = self.session.get(post_url, timeout=self.http_timeout)
+            response.raise_for_status()
             
-            # 댓글 추출 (에브리타임 구조 분석)
-            comments = []
-            
-            # 에브리타임 댓글 구조: <ul class="comments"> 내의 <li> 요소들
-            comment_list = soup.select_one('ul.comments')
-            if comment_list:
-                comment_items = comment_list.select('li')
-                for item in comment_items:
-                    comment_data = self._extract_comment_info(item)
-                    if comment_data:
-                        comments.append(comment_data)
-            
-            # 대체 댓글 셀렉터
-            if not comments:
-                alt_selectors = [
-                    '.comment',
-                    '.reply',
-                    '.comment-item',
-                    '.reply-item',
-                    '[class*="comment"]'
-                ]
-                
-                for selector in alt_selectors:
-                    comment_elems = soup.select(selector)
-                    if comment_elems:
-                        for elem in comment_elems:
-                            comment_data = self._extract_comment_info(elem)
-                            if comment_data:
-                                comments.append(comment_data)
-                        if comments:
-                            break
-            
-            detail_info = {
-                'url': post_url,
-                'title': title,
-                'content': content,
-                'comments': comments,
-                'comment_count': len(comments),
-                'collected_at': datetime.now().isoformat()
-            }
+            if "login" in response.url or "account" in response.url:
+                logger.warning("⚠️ 로그인 페이지로 이동되었습니다: %s", post_url, extra=event('logged_out', url=post_url))
+                return None
             
-            print(f"✅ 게시글 상세 정보 수집 완료 (댓글 {len(comments)}개)")
-            return detail_info
+            with self.metrics.stage('parse'):
+                detail = self._parse_post_detail(response.text, post_url)
+            self.metrics.inc('comments', detail['comment_count'])
+            log_post_done(logger, extract_article_id(post_url), detail['comment_count'], started)
+            return detail
             
         except Exception as e:
-            print(f"❌ 게시글 상세 정보 크롤링 실패: {e}")
+            logger.error("❌ 게시글 상세 정보 크롤링 실패: %s (%s)", post_url, e,
+                         extra=event('post_error', post_id=extract_article_id(post_url)))
+            self.metrics.inc('errors')
             return None
     
     def _extract_comment_info(self, comment_element):
-        """댓글 정보 추출"""
+        """댓글 정보 추출 (이미 파싱된 노드를 그대로 순회, 중첩된 대댓글은 제외)"""
         try:
-            soup = BeautifulSoup(str(comment_element), 'html.parser')
-            
-            # 댓글 내용
-            content = ""
-            content_selectors = ['.large', 'p', '.text', '.content']
-            for sel in content_selectors:
-                elem = soup.select_one(sel)
-                if elem:
-                    content = elem.get_text(strip=True)
-                    if content:
-                        break
-            
-            # 작성자
-            author = "익명"
-            author_selectors = ['.small', '.author', '.writer', '.nickname']
-            for sel in author_selectors:
-                elem = soup.select_one(sel)
-                if elem:
-                    text = elem.get_text(strip=True)
-                    if text and not text.isdigit() and '분' not in text and ':' not in text:
-                        author = text
-                        break
-            
-            # 작성시간
-            created_time = ""
-            time_selectors = ['time', '.time', '.date', '.timestamp']
-            for sel in time_selectors:
-                elem = soup.select_one(sel)
-                if elem:
-                    created_time = elem.get_text(strip=True)
-                    if created_time:
-                        break
-            
-            if content and len(content) > 1:
-                return {
-                    'content': content,
-                    'author': author,
-                    'created_time': created_time
-                }
+            comment = extract_comment_fields(comment_element)
+            if comment:
+                comment['comment_id'] = parse_comment_id(comment_element)
+            return comment
             
         except Exception as e:
-            print(f"⚠️ 댓글 파싱 오류: {e}")
+            logger.warning("⚠️ 댓글 파싱 오류: %s", e)
         
         return None
     
@@ -854,15 +1422,26 @@ class EverytimeCrawler:
             filename = f"data/board_{board_id}_{timestamp}.csv"
         
         try:
-            df = pd.DataFrame(posts)
-            df.to_csv(filename, index=False, encoding='utf-8-sig')
+            with self.metrics.stage('persist'):
+                df = pd.DataFrame(posts)
+                df.to_csv(filename, index=False, encoding='utf-8-sig')
             print(f"💾 게시글 {len(posts)}개가 '{filename}'에 저장되었습니다.")
             
         except Exception as e:
             print(f"❌ CSV 저장 중 오류: {e}")
+            self.metrics.inc('errors')
     
-    def save_board_posts_to_json(self, posts, filename=None):
-        """게시글 목록을 JSON 파일로 저장"""
+    def save_board_posts_to_json(self, posts, filename=None, append=False):
+        """
+        게시글 목록을 JSON Lines 파일로 저장 (한 줄에 게시글 하나)
+        
+        파일명이 .json으로 끝나면 기존과 같은 JSON 배열 형식으로 저장합니다.
+        
+        Args:
+            posts (list): 게시글 리스트
+            filename (str): 저장할 파일명 (없으면 data/board_{board_id}_{timestamp}.jsonl)
+            append (bool): True이면 기존 .jsonl 파일 뒤에 이어 씀
+        """
         if not posts:
             print("⚠️ 저장할 게시글이 없습니다.")
             return
@@ -870,15 +1449,21 @@ class EverytimeCrawler:
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             board_id = posts[0].get('board_id', 'unknown')
-            filename = f"data/board_{board_id}_{timestamp}.json"
+            filename = f"data/board_{board_id}_{timestamp}.jsonl"
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(posts, f, ensure_ascii=False, indent=2)
+            with self.metrics.stage('persist'):
+                if filename.endswith('.json'):
+                    with open(filename, 'w', encoding='utf-8') as f:
+                        json.dump(posts, f, ensure_ascii=False, indent=2)
+                else:
+                    with JsonlWriter(filename, mode='a' if append else 'w') as writer:
+                        writer.write_many(posts)
             print(f"💾 게시글 {len(posts)}개가 '{filename}'에 저장되었습니다.")
             
         except Exception as e:
             print(f"❌ JSON 저장 중 오류: {e}")
+            self.metrics.inc('errors')
     
     def _save_board_debug_info(self, board_id):
         """디버깅을 위한 페이지 정보 저장"""
@@ -898,6 +1483,8 @@ class EverytimeCrawler:
         """드라이버 종료"""
         if self.driver:
             self.driver.quit()
+        if self._detail_loop is not None and not self._detail_loop.is_closed():
+            self._detail_loop.close()
     
     def quit(self):
         """드라이버 종료 (close와 동일)"""
@@ -910,48 +1497,12 @@ class EverytimeCrawler:
         self.close()
     
     def parse_time_from_style(self, style_attr):
-        """CSS style 속성에서 시간 정보 파싱"""
-        try:
-            # style="height: 181px; top: 540px;" 형태에서 top 값 추출
-            import re
-            
-            top_match = re.search(r'top:\s*(\d+)px', style_attr)
-            height_match = re.search(r'height:\s*(\d+)px', style_attr)
-            
-            if not top_match or not height_match:
-                return "시간 정보 없음"
-            
-            top_px = int(top_match.group(1))
-            height_px = int(height_match.group(1))
-            
-            # 에브리타임 시간표에서 1시간 = 약 60px (추정)
-            # top 값을 기준으로 시작 시간 계산
-            # 일반적으로 오전 8시부터 시작한다고 가정 (top=480 정도가 오전 8시)
-            
-            # 시간 계산 (대략적인 값)
-            base_top = 480  # 오전 8시 기준
-            hour_height = 60  # 1시간당 픽셀
-            
-            start_hour = 8 + ((top_px - base_top) // hour_height)
-            duration_hours = height_px // hour_height
-            end_hour = start_hour + duration_hours
-            
-            # 시간 포맷팅
-            def format_hour(hour):
-                if hour < 12:
-                    return f"오전 {hour}시"
-                elif hour == 12:
-                    return "오후 12시"
-                else:
-                    return f"오후 {hour-12}시"
-            
-            if start_hour >= 0 and end_hour >= start_hour:
-                return f"{format_hour(start_hour)} - {format_hour(end_hour)}"
-            else:
-                return f"위치 기반 시간 (top: {top_px}px, height: {height_px}px)"
-                
-        except Exception as e:
-            return f"시간 파싱 오류: {e}"
+        """
+        CSS style 속성에서 시간 정보 파싱 (기본 격자 기준, 예: '오전 9시 - 오전 10시 30분')
+
+        페이지의 시간 열로 보정한 값은 get_timetable 결과의 'time_slots'를 사용하세요.
+        """
+        return format_time_range(TimeGrid.default().time_range(style_attr))
 
 
 def main():
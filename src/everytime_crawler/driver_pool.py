@@ -0,0 +1,140 @@
+"""
+로그인된 WebDriver 풀
+
+여러 게시판을 병렬로 크롤링할 때 드라이버를 한 번만 만들고 재사용합니다.
+드라이버는 빌려줄 때 상태를 확인하고, 일정 페이지 수를 처리하면 새로 만들어
+장시간 실행 시 Chrome 메모리 증가를 제한합니다.
+"""
+
+import queue
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+from .crawler import EverytimeCrawler
+
+
+class DriverPool:
+    """로그인된 헤드리스 EverytimeCrawler 풀"""
+
+    def __init__(self, size=2, headless=True, max_pages_per_driver=200,
+                 crawler_factory=EverytimeCrawler, metrics=None):
+        """
+        DriverPool 초기화
+
+        Args:
+            size (int): 풀에 유지할 드라이버 수
+            headless (bool): 헤드리스 모드 사용 여부
+            max_pages_per_driver (int): 드라이버를 재생성하기 전 처리할 최대 페이지 수
+            crawler_factory (callable): EverytimeCrawler 인스턴스를 만드는 함수
+            metrics (Metrics): 설정하면 풀의 모든 크롤러가 함께 기록 (드라이버 재생성은 retries로 집계)
+        """
+        self.size = max(1, int(size))
+        self.headless = headless
+        self.max_pages_per_driver = max_pages_per_driver
+        self.crawler_factory = crawler_factory
+        self.metrics = metrics
+
+        self._idle = queue.Queue()
+        self._crawlers = []
+        self._page_counts = {}
+        self._lock = threading.Lock()
+        self.recycle_count = 0
+
+    def start(self):
+        """드라이버를 모두 만들고 로그인 (병렬로 진행)"""
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = [executor.submit(self._create) for _ in range(self.size)]
+
+        crawlers = [f.result() for f in futures if f.exception() is None]
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        if errors:
+            for crawler in crawlers:
+                crawler.close()
+            raise errors[0]
+
+        for crawler in crawlers:
+            self._crawlers.append(crawler)
+            self._idle.put(crawler)
+
+        print(f"🚗 WebDriver 풀 준비 완료 ({self.size}개)")
+        return self
+
+    def _create(self):
+        """새 크롤러를 만들어 로그인"""
+        crawler = self.crawler_factory()
+        if self.metrics is not None:
+            crawler.metrics = self.metrics
+        self._start_driver(crawler)
+        return crawler
+
+    def _start_driver(self, crawler):
+        """크롤러에 드라이버를 띄우고 로그인 (실패 시 RuntimeError)"""
+        crawler.setup_driver(headless=self.headless)
+        if not crawler.login():
+            crawler.close()
+            raise RuntimeError("드라이버 풀 로그인 실패")
+
+        with self._lock:
+            self._page_counts[id(crawler)] = 0
+
+    def is_healthy(self, crawler):
+        """드라이버가 응답하는지 확인"""
+        try:
+            return crawler.driver is not None and crawler.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def recycle(self, crawler):
+        """드라이버를 종료하고 같은 크롤러 인스턴스에 새로 띄움"""
+        try:
+            crawler.close()
+        except Exception:
+            pass
+
+        crawler.driver = None
+        self._start_driver(crawler)
+
+        with self._lock:
+            self.recycle_count += 1
+
+        print("♻️ WebDriver 재생성 완료")
+
+    def record_page(self, crawler, pages=1):
+        """처리한 페이지 수를 기록하고, 한도에 도달하면 드라이버를 재생성"""
+        with self._lock:
+            self._page_counts[id(crawler)] = self._page_counts.get(id(crawler), 0) + pages
+            exhausted = (self.max_pages_per_driver
+                         and self._page_counts[id(crawler)] >= self.max_pages_per_driver)
+
+        if exhausted:
+            self.recycle(crawler)
+
+    @contextmanager
+    def acquire(self):
+        """크롤러 하나를 빌림 (상태 확인 후 필요하면 재생성)"""
+        crawler = self._idle.get()
+        try:
+            if not self.is_healthy(crawler):
+                print("⚠️ 응답 없는 WebDriver 발견, 재생성합니다.")
+                if self.metrics is not None:
+                    self.metrics.inc('retries')
+                self.recycle(crawler)
+            yield crawler
+        finally:
+            self._idle.put(crawler)
+
+    def close(self):
+        """풀의 모든 드라이버 종료"""
+        for crawler in self._crawlers:
+            try:
+                crawler.close()
+            except Exception:
+                pass
+        self._crawlers = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
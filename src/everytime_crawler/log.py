@@ -0,0 +1,125 @@
+"""
+크롤러 로깅 설정
+
+크롤링 루프의 진행/오류 메시지는 print 대신 표준 logging의 "everytime_crawler" 로거로 남깁니다.
+메시지는 %-스타일 인자로 넘기므로 해당 레벨이 꺼져 있으면 문자열을 만들지 않습니다.
+진행 상황 메시지에는 extra=event(...)로 구조화 필드(board, page, post_id, elapsed_ms 등)를 붙입니다.
+
+    logger.info("✅ 페이지 %d에서 %d개 게시글 수집", page, len(posts),
+                extra=event('page_done', board=board_id, page=page, posts=len(posts), elapsed_ms=12.3))
+
+configure_logging()은 콘솔에 메시지만(기존 print와 같은 모양) 출력하고,
+json_output=True(또는 CRAWLING_GUI_MODE=1)이면 한 줄에 JSON 이벤트 하나씩 출력합니다.
+
+    {"ts": "...", "level": "INFO", "logger": "everytime_crawler.crawler", "event": "page_done",
+     "message": "✅ 페이지 3에서 20개 게시글 수집", "board": "free", "page": 3, "posts": 20, "elapsed_ms": 12.3}
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+from datetime import datetime
+
+LOGGER_NAME = "everytime_crawler"
+
+# 환경변수로 기본값 지정
+LOG_LEVEL_ENV = "EVERYTIME_LOG_LEVEL"
+GUI_MODE_ENV = "CRAWLING_GUI_MODE"
+
+_HANDLER_MARK = '_everytime_handler'
+
+# 라이브러리 기본값: 핸들러를 설정하지 않은 애플리케이션에서는 아무것도 출력하지 않음
+logging.getLogger(LOGGER_NAME).addHandler(logging.NullHandler())
+
+
+def get_logger(name=None):
+    """everytime_crawler 하위 로거 (name이 없으면 패키지 로거)"""
+    if not name or name == LOGGER_NAME:
+        return logging.getLogger(LOGGER_NAME)
+    if name.startswith(LOGGER_NAME + '.'):
+        return logging.getLogger(name)
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+
+def event(name, **fields):
+    """logging 호출의 extra 인자로 넘길 구조화 이벤트 (이벤트 이름 + 필드)"""
+    return {'event': name, 'fields': fields}
+
+
+def _elapsed_ms(started):
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+def log_page_done(logger, board_id, page, post_count, started, message="✅ 페이지 %d에서 %d개 게시글 수집"):
+    """
+    목록 페이지 하나를 처리한 뒤 page_done 이벤트 기록
+
+    Args:
+        started (float): 페이지 처리를 시작한 time.perf_counter() 값
+        message (str): 페이지 번호, 게시글 수를 인자로 받는 %-스타일 메시지
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(message, page, post_count,
+                    extra=event('page_done', board=board_id, page=page, posts=post_count,
+                                elapsed_ms=_elapsed_ms(started)))
+
+
+def log_post_done(logger, post_id, comment_count, started):
+    """게시글 상세 페이지 하나를 처리한 뒤 post_done 이벤트 기록"""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("✅ 게시글 상세 정보 수집 완료 (댓글 %d개)", comment_count,
+                    extra=event('post_done', post_id=post_id, comments=comment_count,
+                                elapsed_ms=_elapsed_ms(started)))
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 한 줄 JSON으로 변환 (구조화 필드는 최상위 키로 펼침)"""
+
+    def format(self, record):
+        payload = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'event': getattr(record, 'event', None),
+            'message': record.getMessage(),
+        }
+        payload.update(getattr(record, 'fields', None) or {})
+        if record.exc_info:
+            payload['exc'] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+def configure_logging(level=None, json_output=None, stream=None):
+    """
+    everytime_crawler 로거에 콘솔 핸들러 설정 (여러 번 호출해도 핸들러는 하나)
+
+    Args:
+        level (str | int): 로그 레벨 (없으면 EVERYTIME_LOG_LEVEL 환경변수, 기본 INFO)
+        json_output (bool): True이면 JSON Lines로 출력 (없으면 CRAWLING_GUI_MODE=1일 때 True)
+        stream: 출력 스트림 (기본 sys.stdout)
+
+    Returns:
+        logging.Logger: 패키지 로거
+    """
+    if level is None:
+        level = os.getenv(LOG_LEVEL_ENV, 'INFO')
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+    if json_output is None:
+        json_output = os.getenv(GUI_MODE_ENV) == '1'
+
+    logger = get_logger()
+    for handler in list(logger.handlers):
+        if getattr(handler, _HANDLER_MARK, False):
+            logger.removeHandler(handler)
+
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(JsonFormatter() if json_output else logging.Formatter('%(message)s'))
+    setattr(handler, _HANDLER_MARK, True)
+
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger
@@ -0,0 +1,259 @@
+"""
+크롤링 단계별 소요 시간과 처리 건수 수집
+
+페이지마다 어느 단계에서 시간이 걸리는지 구분해 기록합니다.
+
+- navigation: driver.get / HTTP 요청
+- throttle:   RateLimiter 대기 (페이지 간 고정 간격)
+- wait:       DOM 로딩 대기 (PageWaiter)
+- parse:      driver.page_source 읽기와 HTML 파싱
+- persist:    CSV/JSON/JSONL/Parquet/SQLite 저장
+
+단계별 시간은 히스토그램, 게시글/댓글/재시도/오류 수는 카운터로 모으고
+Prometheus 텍스트 형식(serve로 HTTP 엔드포인트 제공)이나 JSON 스냅샷으로 내보냅니다.
+비활성화 상태에서는 모든 기록 메서드가 바로 반환하므로 핫 루프에 남겨 두어도 비용이 거의 없습니다.
+
+    metrics = Metrics()
+    with metrics.stage('parse'):
+        posts = parse(html)
+    metrics.inc('posts', len(posts))
+    print(metrics.to_prometheus())
+"""
+
+import os
+import json
+import time
+import threading
+from contextlib import nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STAGES = ('navigation', 'throttle', 'wait', 'parse', 'persist')
+COUNTERS = ('posts', 'comments', 'retries', 'errors')
+
+# 히스토그램 버킷 상한(초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# 비활성화 상태에서 stage()가 돌려주는 재사용 가능한 빈 컨텍스트
+_NULL_STAGE = nullcontext()
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (Prometheus histogram과 같은 구조)"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def cumulative(self):
+        """(상한, 누적 개수) 리스트 (마지막은 +Inf)"""
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((bound, total))
+        result.append((float('inf'), self.count))
+        return result
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'avg': self.sum / self.count if self.count else 0.0,
+            'max': self.max,
+            'buckets': {_format_bound(bound): total for bound, total in self.cumulative()},
+        }
+
+
+class _StageTimer:
+    """with 블록의 소요 시간을 단계 히스토그램에 기록"""
+
+    __slots__ = ('_metrics', '_stage', '_start')
+
+    def __init__(self, metrics, stage):
+        self._metrics = metrics
+        self._stage = stage
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._metrics.observe(self._stage, time.perf_counter() - self._start)
+        return False
+
+
+class Metrics:
+    """단계별 시간 히스토그램 + 카운터 (스레드 안전)"""
+
+    def __init__(self, enabled=True, namespace="everytime", buckets=DEFAULT_BUCKETS):
+        """
+        Metrics 초기화
+
+        Args:
+            enabled (bool): False이면 아무것도 기록하지 않음
+            namespace (str): Prometheus 메트릭 이름 앞에 붙일 접두어
+            buckets (tuple): 단계 히스토그램 버킷 상한(초)
+        """
+        self.enabled = enabled
+        self.namespace = namespace
+        self.buckets = buckets
+        self.started_at = time.time()
+        self._histograms = {}
+        self._counters = dict.fromkeys(COUNTERS, 0)
+        self._lock = threading.Lock()
+        self._snapshot_thread = None
+        self._snapshot_stop = None
+
+    @classmethod
+    def from_env(cls):
+        """EVERYTIME_METRICS=1이면 활성화된 Metrics 생성"""
+        return cls(enabled=os.getenv('EVERYTIME_METRICS', '').lower() in ('1', 'true', 'yes'))
+
+    def stage(self, name):
+        """with 블록의 소요 시간을 name 단계로 기록하는 컨텍스트"""
+        if not self.enabled:
+            return _NULL_STAGE
+        return _StageTimer(self, name)
+
+    def observe(self, stage, seconds):
+        """단계 소요 시간(초) 기록"""
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def inc(self, counter, amount=1):
+        """카운터 증가"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[counter] = self._counters.get(counter, 0) + amount
+
+    def reset(self):
+        """기록 초기화"""
+        with self._lock:
+            self._histograms.clear()
+            self._counters = dict.fromkeys(COUNTERS, 0)
+            self.started_at = time.time()
+
+    def snapshot(self):
+        """현재 값을 JSON으로 직렬화 가능한 dict로 반환"""
+        with self._lock:
+            return {
+                'timestamp': time.time(),
+                'uptime_seconds': time.time() - self.started_at,
+                'stages': {name: h.to_dict() for name, h in self._histograms.items()},
+                'counters': dict(self._counters),
+            }
+
+    def to_prometheus(self):
+        """Prometheus 텍스트 노출 형식"""
+        ns = self.namespace
+        lines = [
+            f"# HELP {ns}_stage_seconds Time spent per crawl stage.",
+            f"# TYPE {ns}_stage_seconds histogram",
+        ]
+        with self._lock:
+            for stage, histogram in sorted(self._histograms.items()):
+                for bound, total in histogram.cumulative():
+                    lines.append(f'{ns}_stage_seconds_bucket{{stage="{stage}",le="{_format_bound(bound)}"}} {total}')
+                lines.append(f'{ns}_stage_seconds_sum{{stage="{stage}"}} {histogram.sum}')
+                lines.append(f'{ns}_stage_seconds_count{{stage="{stage}"}} {histogram.count}')
+
+            for name, value in self._counters.items():
+                lines.append(f"# TYPE {ns}_{name}_total counter")
+                lines.append(f"{ns}_{name}_total {value}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_snapshot(self, path):
+        """JSON 스냅샷을 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def start_snapshots(self, path, interval=60.0):
+        """interval초마다 path에 JSON 스냅샷을 저장하는 백그라운드 스레드 시작"""
+        if not self.enabled or self._snapshot_thread is not None:
+            return
+
+        stop = threading.Event()
+
+        def loop():
+            stopped = False
+            while not stopped:
+                stopped = stop.wait(interval)  # 종료 시에도 마지막 값을 한 번 저장
+                try:
+                    self.write_snapshot(path)
+                except OSError as e:
+                    print(f"⚠️ 메트릭 스냅샷 저장 실패: {e}")
+
+        self._snapshot_stop = stop
+        self._snapshot_thread = threading.Thread(target=loop, name="metrics-snapshot", daemon=True)
+        self._snapshot_thread.start()
+
+    def stop_snapshots(self):
+        """스냅샷 스레드를 멈추고 마지막 스냅샷 저장"""
+        if self._snapshot_thread is None:
+            return
+        self._snapshot_stop.set()
+        self._snapshot_thread.join()
+        self._snapshot_thread = None
+        self._snapshot_stop = None
+
+    def serve(self, port=9108, host="127.0.0.1"):
+        """
+        /metrics(Prometheus 텍스트)와 /metrics.json을 제공하는 HTTP 서버를 백그라운드로 시작
+
+        Returns:
+            ThreadingHTTPServer: 종료할 때 shutdown()과 server_close() 호출
+        """
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == '/metrics.json':
+                    body = json.dumps(metrics.snapshot(), ensure_ascii=False).encode('utf-8')
+                    content_type = 'application/json; charset=utf-8'
+                elif self.path in ('/', '/metrics'):
+                    body = metrics.to_prometheus().encode('utf-8')
+                    content_type = 'text/plain; version=0.0.4; charset=utf-8'
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+        return server
+
+
+def _format_bound(bound):
+    return '+Inf' if bound == float('inf') else repr(float(bound))
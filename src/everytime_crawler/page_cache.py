@@ -0,0 +1,122 @@
+"""
+게시판 목록 페이지 캐시
+
+같은 게시판 첫 몇 페이지를 몇 분 간격으로 반복 수집하면 HTML 대부분이 이전과 같습니다.
+URL별로 게시글 목록 영역(<article class="list"> 블록들)의 해시를 저장해 두고
+
+- 목록 영역 전체가 같으면 파싱을 완전히 건너뛰고 이전 결과를 반환 (hit)
+- 일부 블록만 바뀌었으면 바뀐 블록만 파싱하고 나머지는 재사용 (partial hit)
+- 처음 보는 URL이거나 재사용할 블록이 없으면 전부 파싱 (miss)
+
+합니다. 블록은 정규식으로 잘라내므로 hit일 때는 HTML 트리를 만들지 않습니다.
+"""
+
+import re
+import hashlib
+from collections import OrderedDict
+
+# <article class="list"> 블록 (POST_SELECTORS의 'article.list'와 같은 대상)
+ARTICLE_BLOCK_PATTERN = re.compile(
+    r'<article\b[^>]*\bclass\s*=\s*["\'](?:[^"\']*\s)?list(?:\s[^"\']*)?["\'][^>]*>.*?</article>',
+    re.DOTALL | re.IGNORECASE
+)
+
+
+def split_article_blocks(html):
+    """목록 HTML에서 게시글 블록 문자열을 순서대로 추출 (없으면 빈 리스트)"""
+    return ARTICLE_BLOCK_PATTERN.findall(html or '')
+
+
+def _digest(text):
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+class PageCache:
+    """URL별 목록 영역 해시와 블록별 파싱 결과 캐시"""
+
+    def __init__(self, max_pages=256, max_blocks=20):
+        """
+        PageCache 초기화
+
+        Args:
+            max_pages (int): 기억할 최대 URL 수 (오래 사용하지 않은 URL부터 제거)
+            max_blocks (int): 페이지당 처리할 최대 게시글 블록 수
+        """
+        self.max_pages = max_pages
+        self.max_blocks = max_blocks
+        self._entries = OrderedDict()  # url -> (목록 영역 해시, 블록 해시 리스트, 게시글 리스트)
+
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+        self.blocks_reused = 0
+        self.blocks_parsed = 0
+
+    def extract(self, url, html, parse_blocks, parse_page):
+        """
+        캐시를 거쳐 페이지의 게시글 목록 추출
+
+        Args:
+            url (str): 페이지 URL (캐시 키)
+            html (str): 페이지 HTML
+            parse_blocks: 블록 문자열 리스트를 받아 같은 길이의 게시글(dict 또는 None) 리스트를 반환하는 함수
+            parse_page: 게시글 블록을 찾지 못했을 때 전체 HTML을 파싱하는 함수 (인자 없음)
+
+        Returns:
+            list: 게시글 리스트 (캐시와 공유하지 않는 복사본)
+        """
+        blocks = split_article_blocks(html)[:self.max_blocks]
+        if not blocks:
+            # 다른 구조의 페이지는 캐시하지 않고 셀렉터 탐색으로 전체 파싱
+            self.misses += 1
+            self._entries.pop(url, None)
+            return parse_page()
+
+        page_digest = _digest(''.join(blocks))
+        entry = self._entries.get(url)
+        if entry is not None:
+            self._entries.move_to_end(url)
+            if entry[0] == page_digest:
+                self.hits += 1
+                self.blocks_reused += len(blocks)
+                return [dict(post) for post in entry[2] if post]
+
+        known = dict(zip(entry[1], entry[2])) if entry is not None else {}
+        block_digests = [_digest(block) for block in blocks]
+        missing = [i for i, d in enumerate(block_digests) if d not in known]
+
+        parsed = parse_blocks([blocks[i] for i in missing]) if missing else []
+        fresh = dict(zip((block_digests[i] for i in missing), parsed))
+
+        reused = len(blocks) - len(missing)
+        self.blocks_reused += reused
+        self.blocks_parsed += len(missing)
+        if reused:
+            self.partial_hits += 1
+        else:
+            self.misses += 1
+
+        # 블록 순서대로 (이번 페이지에 없는 블록은 버림)
+        posts = [fresh[d] if d in fresh else known[d] for d in block_digests]
+        self._entries[url] = (page_digest, block_digests, posts)
+        self._entries.move_to_end(url)
+        while len(self._entries) > self.max_pages:
+            self._entries.popitem(last=False)
+
+        return [dict(post) for post in posts if post]
+
+    def stats(self):
+        """캐시 통계 (hit/partial/miss 횟수, 재사용/파싱한 블록 수, 블록 재사용 비율)"""
+        total_blocks = self.blocks_reused + self.blocks_parsed
+        return {
+            'hits': self.hits,
+            'partial_hits': self.partial_hits,
+            'misses': self.misses,
+            'blocks_reused': self.blocks_reused,
+            'blocks_parsed': self.blocks_parsed,
+            'block_reuse_ratio': self.blocks_reused / total_blocks if total_blocks else 0.0,
+        }
+
+    def clear(self):
+        """캐시 비우기 (통계는 유지)"""
+        self._entries.clear()
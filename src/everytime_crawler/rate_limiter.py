@@ -0,0 +1,64 @@
+"""
+요청 속도 제한 유틸리티
+"""
+
+import time
+import asyncio
+import threading
+
+
+class RateLimiter:
+    """토큰 버킷 기반 요청 속도 제한기"""
+
+    def __init__(self, rate=None, burst=1):
+        """
+        RateLimiter 초기화
+
+        Args:
+            rate (float): 초당 허용 요청 수 (None 또는 0 이하이면 제한 없음)
+            burst (int): 한 번에 연속으로 허용할 최대 요청 수
+        """
+        self.rate = rate if rate and rate > 0 else None
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_delay(cls, delay):
+        """요청 간 최소 간격(초)으로 속도 제한기 생성"""
+        if not delay or delay <= 0:
+            return cls(None)
+        return cls(1.0 / delay)
+
+    def _refill(self, now):
+        """경과 시간만큼 토큰 보충"""
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+
+    def _reserve(self):
+        """토큰 하나를 예약하고 기다려야 할 시간(초)을 반환"""
+        if self.rate is None:
+            return 0.0
+
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """토큰을 얻을 때까지 대기 (대기한 시간(초) 반환)"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self):
+        """토큰을 얻을 때까지 이벤트 루프를 막지 않고 대기 (대기한 시간(초) 반환)"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
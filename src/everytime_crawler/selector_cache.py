@@ -0,0 +1,79 @@
+"""
+페이지 종류별 셀렉터 캐시
+
+게시판 목록(POST_SELECTORS 7개)이나 시간표 과목(10개)은 레이아웃에 맞는 셀렉터를 찾을 때까지
+후보를 순서대로 시도합니다. 같은 게시판/페이지 종류는 같은 레이아웃을 쓰므로 처음 성공한
+셀렉터를 키별로 기억해 두고 다음 페이지부터는 그 셀렉터만 조회합니다.
+기억한 셀렉터가 결과를 내지 못할 때만(레이아웃 변경 등) 후보 전체를 다시 탐색합니다.
+
+    cache = SelectorCache()
+    selector, elements = cache.find(('posts', 'free'), POST_SELECTORS, soup.select)
+"""
+
+import threading
+
+
+class SelectorCache:
+    """키(게시판/페이지 종류)별로 마지막에 성공한 셀렉터 기억"""
+
+    def __init__(self):
+        self._winners = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0       # 기억한 셀렉터로 바로 찾은 횟수
+        self.probes = 0     # 후보 전체를 탐색한 횟수
+        self.queries = 0    # query 호출 횟수 (WebDriver라면 왕복 횟수)
+
+    def get(self, key):
+        """키에 기억된 셀렉터 (없으면 None)"""
+        return self._winners.get(key)
+
+    def find(self, key, selectors, query):
+        """
+        기억한 셀렉터로 먼저 조회하고, 결과가 없으면 후보를 순서대로 탐색
+
+        Args:
+            key: 캐시 키 (예: ('posts', board_id), ('timetable',))
+            selectors (list): 우선순위 순 후보 셀렉터
+            query (callable): 셀렉터를 받아 결과 리스트를 반환하는 함수
+                (soup.select, lambda s: driver.find_elements(By.CSS_SELECTOR, s) 등)
+
+        Returns:
+            tuple: (찾은 셀렉터, 결과 리스트), 모든 후보가 실패하면 (None, [])
+        """
+        cached = self._winners.get(key)
+        if cached is not None:
+            self.queries += 1
+            results = query(cached)
+            if results:
+                self.hits += 1
+                return cached, results
+
+        self.probes += 1
+        for selector in selectors:
+            if selector == cached:
+                continue  # 방금 실패한 셀렉터
+            self.queries += 1
+            results = query(selector)
+            if results:
+                with self._lock:
+                    self._winners[key] = selector
+                return selector, results
+
+        with self._lock:
+            self._winners.pop(key, None)
+        return None, []
+
+    def stats(self):
+        """캐시 통계"""
+        return {
+            'hits': self.hits,
+            'probes': self.probes,
+            'queries': self.queries,
+            'selectors': dict(self._winners),
+        }
+
+    def clear(self):
+        """기억한 셀렉터 모두 삭제 (통계는 유지)"""
+        with self._lock:
+            self._winners.clear()
@@ -0,0 +1,78 @@
+"""
+로그인 세션 쿠키 저장소
+
+로그인 후 쿠키를 디스크에 저장해 두고 다음 실행에서 재사용합니다.
+파일은 소유자만 읽고 쓸 수 있도록(0600) 생성되며, 원자적으로 교체됩니다.
+"""
+
+import os
+import json
+import time
+
+
+class SessionStore:
+    """쿠키 파일 저장/복원"""
+
+    def __init__(self, path, max_age=7 * 24 * 3600):
+        """
+        SessionStore 초기화
+
+        Args:
+            path (str): 쿠키를 저장할 파일 경로
+            max_age (int): 저장된 세션을 재사용할 최대 기간(초)
+        """
+        self.path = os.path.expanduser(path)
+        self.max_age = max_age
+
+    def save(self, cookies, user_id=None, user_agent=None):
+        """쿠키 목록 저장 (Selenium get_cookies() 형식)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+
+        payload = {
+            'user_id': user_id,
+            'saved_at': time.time(),
+            'user_agent': user_agent,
+            'cookies': cookies
+        }
+
+        tmp_path = f"{self.path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False)
+        # umask나 기존 파일 권한과 관계없이 소유자 전용으로 고정
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, self.path)
+
+    def load(self, user_id=None):
+        """
+        저장된 세션 로드
+
+        Returns:
+            dict: {'cookies', 'user_agent', 'user_id', 'saved_at'}
+                  (파일이 없거나, 다른 계정이거나, 만료된 경우 None)
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        if user_id is not None and payload.get('user_id') != user_id:
+            return None
+
+        if self.max_age and time.time() - payload.get('saved_at', 0) > self.max_age:
+            return None
+
+        if not payload.get('cookies'):
+            return None
+
+        return payload
+
+    def clear(self):
+        """저장된 쿠키 삭제"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
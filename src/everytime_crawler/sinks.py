@@ -0,0 +1,118 @@
+"""
+스트리밍 저장소
+
+게시글을 모아 두었다가 한 번에 json.dump 하는 대신, 파싱되는 즉시 한 줄에 하나씩
+JSON Lines(.jsonl) 형식으로 추가합니다. 메모리 사용량이 크롤링 길이와 무관하고,
+중간에 프로세스가 죽어도 마지막으로 쓴 페이지까지는 파일에 남습니다.
+"""
+
+import os
+import json
+import time
+
+
+class JsonlWriter:
+    """추가 전용 JSON Lines 기록기 (주기적 fsync)"""
+
+    def __init__(self, path, fsync_every=100, fsync_interval=5.0, mode='a'):
+        """
+        JsonlWriter 초기화
+
+        Args:
+            path (str): 저장할 파일 경로
+            fsync_every (int): 이 개수만큼 기록할 때마다 fsync
+            fsync_interval (float): 마지막 fsync 이후 이 시간(초)이 지나면 다음 기록 시 fsync
+            mode (str): 'a'는 이어 쓰기, 'w'는 새로 쓰기
+        """
+        self.path = path
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.mode = mode
+        self.count = 0
+
+        self._file = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _open(self):
+        # 첫 기록 시점에 파일을 열어 빈 파일이 남지 않도록 함
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, self.mode, encoding='utf-8')
+        return self._file
+
+    @property
+    def offset(self):
+        """현재까지 기록한 파일 크기(바이트)"""
+        if self._file is None:
+            return os.path.getsize(self.path) if self.mode == 'a' and os.path.exists(self.path) else 0
+        return self._file.tell()
+
+    def write(self, record):
+        """레코드 하나 기록"""
+        return self.write_many([record])
+
+    def write_many(self, records):
+        """
+        레코드 여러 개를 기록하고 OS 버퍼까지 flush
+
+        Returns:
+            int: 기록한 레코드 수
+        """
+        f = self._open()
+        written = 0
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+            f.write('\n')
+            written += 1
+
+        f.flush()
+        self.count += written
+        self._unsynced += written
+
+        if (self._unsynced >= self.fsync_every
+                or time.monotonic() - self._last_sync >= self.fsync_interval):
+            self.sync()
+
+        return written
+
+    def sync(self):
+        """디스크까지 기록 (fsync)"""
+        if self._file is None:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        """fsync 후 파일 닫기"""
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def iter_jsonl(path):
+    """
+    JSON Lines 파일을 한 줄씩 읽음
+
+    비정상 종료로 마지막 줄이 잘린 경우 해당 줄은 건너뜁니다.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
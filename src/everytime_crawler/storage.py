@@ -0,0 +1,491 @@
+"""
+SQLite 저장소
+
+게시글은 글 번호(article_id)를 기본 키로 upsert 하므로 같은 게시판을 여러 번 크롤링해도
+중복 없이 최신 값(댓글 수 등)으로 갱신됩니다. 댓글은 posts를 참조하는 comments 테이블에
+댓글 번호(comment_id)를 키로 upsert 하고, 부모 댓글(parent_id)과 깊이(depth)를 함께 저장합니다.
+수강편람 강의는 (year, semester, subject_id)를 키로 courses 테이블에 저장하고,
+내용 해시가 바뀐 강의만 다시 기록합니다.
+한 번의 호출(보통 한 페이지)은 하나의 트랜잭션으로 기록됩니다.
+"""
+
+import os
+import json
+import hashlib
+import sqlite3
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+from .crawl_state import extract_article_id
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    article_id     INTEGER PRIMARY KEY,
+    board_id       TEXT NOT NULL,
+    title          TEXT,
+    content        TEXT,
+    full_content   TEXT,
+    author         TEXT,
+    created_time   TEXT,
+    created_at     TEXT,
+    comment_count  INTEGER,
+    view_count     INTEGER,
+    post_link      TEXT,
+    page           INTEGER,
+    first_seen_at  TEXT NOT NULL,
+    collected_at   TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_posts_board_id ON posts (board_id);
+CREATE INDEX IF NOT EXISTS idx_posts_created_at ON posts (created_at);
+CREATE INDEX IF NOT EXISTS idx_posts_comment_count ON posts (comment_count);
+
+CREATE TABLE IF NOT EXISTS comments (
+    post_id        INTEGER NOT NULL REFERENCES posts (article_id) ON DELETE CASCADE,
+    comment_index  INTEGER NOT NULL,
+    comment_id     INTEGER,
+    parent_id      INTEGER,
+    depth          INTEGER,
+    author         TEXT,
+    content        TEXT,
+    created_time   TEXT,
+    collected_at   TEXT NOT NULL,
+    PRIMARY KEY (post_id, comment_index)
+);
+
+CREATE TABLE IF NOT EXISTS courses (
+    year           INTEGER NOT NULL,
+    semester       INTEGER NOT NULL,
+    subject_id     TEXT NOT NULL,
+    code           TEXT,
+    subject_name   TEXT,
+    professor      TEXT,
+    room           TEXT,
+    credit         REAL,
+    time           TEXT,
+    time_slots     TEXT,
+    content_hash   TEXT NOT NULL,
+    first_seen_at  TEXT NOT NULL,
+    collected_at   TEXT NOT NULL,
+    last_seen_at   TEXT NOT NULL,
+    PRIMARY KEY (year, semester, subject_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_courses_code ON courses (code);
+"""
+
+# 예전 버전 DB의 comments 테이블에 없는 컬럼 (열 때 ALTER TABLE로 추가)
+COMMENT_MIGRATIONS = (
+    ('comment_id', 'INTEGER'),
+    ('parent_id', 'INTEGER'),
+    ('depth', 'INTEGER'),
+)
+
+# 컬럼 추가 후에 만드는 인덱스 (comment_id가 NULL인 댓글은 여러 개 가능)
+COMMENT_INDEXES = """
+CREATE UNIQUE INDEX IF NOT EXISTS idx_comments_comment_id ON comments (comment_id);
+"""
+
+UPSERT_COMMENT = """
+INSERT INTO comments (
+    post_id, comment_index, comment_id, parent_id, depth, author, content, created_time, collected_at
+) VALUES (
+    :post_id, :comment_index, :comment_id, :parent_id, :depth, :author, :content, :created_time, :collected_at
+)
+ON CONFLICT (comment_id) DO UPDATE SET
+    post_id        = excluded.post_id,
+    comment_index  = excluded.comment_index,
+    parent_id      = excluded.parent_id,
+    depth          = excluded.depth,
+    author         = excluded.author,
+    content        = excluded.content,
+    created_time   = excluded.created_time,
+    collected_at   = excluded.collected_at
+"""
+
+COURSE_FIELDS = ('code', 'subject_name', 'professor', 'room', 'credit', 'time', 'time_slots')
+
+UPSERT_COURSE = """
+INSERT INTO courses (
+    year, semester, subject_id, code, subject_name, professor, room, credit, time, time_slots,
+    content_hash, first_seen_at, collected_at, last_seen_at
+) VALUES (
+    :year, :semester, :subject_id, :code, :subject_name, :professor, :room, :credit, :time, :time_slots,
+    :content_hash, :collected_at, :collected_at, :collected_at
+)
+ON CONFLICT (year, semester, subject_id) DO UPDATE SET
+    code          = excluded.code,
+    subject_name  = excluded.subject_name,
+    professor     = excluded.professor,
+    room          = excluded.room,
+    credit        = excluded.credit,
+    time          = excluded.time,
+    time_slots    = excluded.time_slots,
+    content_hash  = excluded.content_hash,
+    collected_at  = excluded.collected_at,
+    last_seen_at  = excluded.last_seen_at
+"""
+
+UPSERT_POST = """
+INSERT INTO posts (
+    article_id, board_id, title, content, full_content, author, created_time, created_at,
+    comment_count, view_count, post_link, page, first_seen_at, collected_at
+) VALUES (
+    :article_id, :board_id, :title, :content, :full_content, :author, :created_time, :created_at,
+    :comment_count, :view_count, :post_link, :page, :collected_at, :collected_at
+)
+ON CONFLICT (article_id) DO UPDATE SET
+    board_id      = excluded.board_id,
+    title         = excluded.title,
+    content       = excluded.content,
+    full_content  = COALESCE(excluded.full_content, posts.full_content),
+    author        = excluded.author,
+    created_time  = excluded.created_time,
+    created_at    = COALESCE(excluded.created_at, posts.created_at),
+    comment_count = excluded.comment_count,
+    view_count    = COALESCE(excluded.view_count, posts.view_count),
+    post_link     = excluded.post_link,
+    page          = excluded.page,
+    collected_at  = excluded.collected_at
+"""
+
+
+def _to_int(value):
+    """'12' 같은 문자열 숫자를 정수로 변환 (없거나 숫자가 아니면 None)"""
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _course_row(course, collected_at):
+    """강의 dict를 courses 행으로 변환 (time_slots는 JSON 문자열, 내용 해시 포함)"""
+    row = {
+        'year': _to_int(course.get('year')),
+        'semester': _to_int(course.get('semester')),
+        'subject_id': str(course['subject_id']),
+        'code': course.get('code'),
+        'subject_name': course.get('subject_name'),
+        'professor': course.get('professor'),
+        'room': course.get('room'),
+        'credit': course.get('credit'),
+        'time': course.get('time'),
+        'time_slots': json.dumps(course.get('time_slots') or [], ensure_ascii=False, sort_keys=True),
+        'collected_at': course.get('collected_at') or collected_at,
+    }
+    content = json.dumps([row[field] for field in COURSE_FIELDS], ensure_ascii=False)
+    row['content_hash'] = hashlib.sha1(content.encode('utf-8')).hexdigest()
+    return row
+
+
+class SQLiteStore:
+    """게시글/댓글/수강편람 SQLite 저장소 (스레드 안전)"""
+
+    def __init__(self, path="data/everytime.db"):
+        """
+        SQLiteStore 초기화 (테이블과 인덱스가 없으면 생성)
+
+        Args:
+            path (str): 데이터베이스 파일 경로 (':memory:' 가능)
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        if path != ':memory:':
+            self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        """예전 버전 DB에 없는 comments 컬럼과 인덱스 추가"""
+        columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(comments)")}
+        with self.conn:
+            for name, column_type in COMMENT_MIGRATIONS:
+                if name not in columns:
+                    self.conn.execute(f"ALTER TABLE comments ADD COLUMN {name} {column_type}")
+        self.conn.executescript(COMMENT_INDEXES)
+
+    def upsert_posts(self, posts, board_id=None):
+        """
+        게시글 목록을 한 트랜잭션으로 upsert
+
+        Args:
+            posts (list): get_board_posts 결과 형식의 게시글 리스트
+            board_id (str): 게시글에 board_id가 없을 때 사용할 게시판 ID
+
+        Returns:
+            int: 저장한 게시글 수 (글 번호가 없는 게시글은 제외)
+        """
+        now = datetime.now().isoformat()
+        rows = []
+        for post in posts:
+            article_id = post.get('article_id') or extract_article_id(post.get('post_link'))
+            if article_id is None:
+                continue
+            rows.append({
+                'article_id': article_id,
+                'board_id': post.get('board_id') or board_id or 'unknown',
+                'title': post.get('title'),
+                'content': post.get('content'),
+                'full_content': post.get('full_content'),
+                'author': post.get('author'),
+                'created_time': post.get('created_time'),
+                'created_at': post.get('created_at'),
+                'comment_count': _to_int(post.get('comment_count')),
+                'view_count': _to_int(post.get('view_count')),
+                'post_link': post.get('post_link'),
+                'page': _to_int(post.get('page')),
+                'collected_at': post.get('collected_at') or now,
+            })
+
+        with self._lock, self.conn:
+            self.conn.executemany(UPSERT_POST, rows)
+
+        return len(rows)
+
+    def save_post_detail(self, detail, board_id=None):
+        """
+        게시글 상세 정보(본문, 댓글)를 한 트랜잭션으로 저장
+
+        목록에서 아직 저장되지 않은 게시글이면 상세 정보로 게시글 행을 만듭니다.
+        댓글은 comment_id를 키로 upsert 하고, 이번에 보이지 않은 기존 댓글(삭제된 댓글,
+        comment_id가 없는 댓글)은 지웁니다.
+
+        Returns:
+            int: 저장한 댓글 수 (글 번호를 알 수 없으면 0)
+        """
+        article_id = extract_article_id(detail.get('url'))
+        if article_id is None:
+            return 0
+
+        collected_at = detail.get('collected_at') or datetime.now().isoformat()
+        comments = detail.get('comments', [])
+
+        with self._lock, self.conn:
+            updated = self.conn.execute(
+                "UPDATE posts SET full_content = ?, comment_count = ? WHERE article_id = ?",
+                (detail.get('content'), len(comments), article_id)
+            ).rowcount
+            if not updated:
+                self.conn.execute(UPSERT_POST, {
+                    'article_id': article_id,
+                    'board_id': board_id or 'unknown',
+                    'title': detail.get('title'),
+                    'content': None,
+                    'full_content': detail.get('content'),
+                    'author': None,
+                    'created_time': None,
+                    'created_at': None,
+                    'comment_count': len(comments),
+                    'view_count': None,
+                    'post_link': detail.get('url'),
+                    'page': None,
+                    'collected_at': collected_at,
+                })
+
+            comment_ids = [c['comment_id'] for c in comments if c.get('comment_id') is not None]
+            self.conn.execute(
+                f"DELETE FROM comments WHERE post_id = ? AND "
+                f"(comment_id IS NULL OR comment_id NOT IN ({', '.join('?' * len(comment_ids))}))",
+                (article_id, *comment_ids)
+            )
+            # 대댓글이 중간에 추가되면 순서가 밀리므로 남은 댓글의 comment_index를 잠시 음수로 옮겨
+            # upsert 중 (post_id, comment_index) 키가 겹치지 않게 함
+            self.conn.execute(
+                "UPDATE comments SET comment_index = -1 - comment_index WHERE post_id = ?", (article_id,)
+            )
+            self.conn.executemany(UPSERT_COMMENT, [
+                {
+                    'post_id': article_id,
+                    'comment_index': idx,
+                    'comment_id': c.get('comment_id'),
+                    'parent_id': c.get('parent_id'),
+                    'depth': c.get('depth'),
+                    'author': c.get('author'),
+                    'content': c.get('content'),
+                    'created_time': c.get('created_time'),
+                    'collected_at': collected_at,
+                }
+                for idx, c in enumerate(comments)
+            ])
+
+        return len(comments)
+
+    def upsert_courses(self, courses):
+        """
+        강의 목록을 한 트랜잭션으로 저장 (내용이 바뀐 강의만 다시 기록)
+
+        Args:
+            courses (list): CatalogueCrawler 결과 형식의 강의 리스트 (year, semester, subject_id 필수)
+
+        Returns:
+            dict: {'inserted', 'updated', 'unchanged'} 강의 수
+        """
+        now = datetime.now().isoformat()
+        rows = [_course_row(course, now) for course in courses if course.get('subject_id') is not None]
+        stats = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        if not rows:
+            return stats
+
+        with self._lock, self.conn:
+            existing = {}
+            for (year, semester), ids in self._group_course_ids(rows).items():
+                # SQLite 바인드 변수 개수 제한을 넘지 않도록 나눠서 조회
+                for start in range(0, len(ids), 500):
+                    chunk = ids[start:start + 500]
+                    placeholders = ", ".join("?" * len(chunk))
+                    existing.update(
+                        ((year, semester, subject_id), content_hash)
+                        for subject_id, content_hash in self.conn.execute(
+                            f"SELECT subject_id, content_hash FROM courses "
+                            f"WHERE year = ? AND semester = ? AND subject_id IN ({placeholders})",
+                            (year, semester, *chunk)
+                        )
+                    )
+
+            changed, unchanged = [], []
+            for row in rows:
+                previous = existing.get((row['year'], row['semester'], row['subject_id']))
+                if previous is None:
+                    stats['inserted'] += 1
+                    changed.append(row)
+                elif previous != row['content_hash']:
+                    stats['updated'] += 1
+                    changed.append(row)
+                else:
+                    stats['unchanged'] += 1
+                    unchanged.append((row['collected_at'], row['year'], row['semester'], row['subject_id']))
+
+            self.conn.executemany(UPSERT_COURSE, changed)
+            self.conn.executemany(
+                "UPDATE courses SET last_seen_at = ? WHERE year = ? AND semester = ? AND subject_id = ?",
+                unchanged
+            )
+
+        return stats
+
+    @staticmethod
+    def _group_course_ids(rows):
+        groups = {}
+        for row in rows:
+            groups.setdefault((row['year'], row['semester']), []).append(row['subject_id'])
+        return groups
+
+    def remove_unseen_courses(self, year, semester, seen_since):
+        """
+        seen_since 이후 한 번도 보이지 않은 강의 삭제 (전체 스캔이 끝난 뒤 폐강된 강의 정리)
+
+        Returns:
+            int: 삭제한 강의 수
+        """
+        with self._lock, self.conn:
+            return self.conn.execute(
+                "DELETE FROM courses WHERE year = ? AND semester = ? AND last_seen_at < ?",
+                (year, semester, seen_since)
+            ).rowcount
+
+    def count_courses(self, year=None, semester=None):
+        """저장된 강의 수"""
+        if year is None:
+            sql, params = "SELECT COUNT(*) FROM courses", ()
+        else:
+            sql, params = "SELECT COUNT(*) FROM courses WHERE year = ? AND semester = ?", (year, semester)
+        with self._lock:
+            return self.conn.execute(sql, params).fetchone()[0]
+
+    def get_courses(self, year, semester):
+        """
+        학기의 강의 목록 (time_slots는 리스트로 복원)
+
+        Returns:
+            list: 강의 dict 리스트 (TimeSlotIndex/find_conflicts에 바로 사용 가능)
+        """
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT * FROM courses WHERE year = ? AND semester = ? ORDER BY code, subject_id",
+                (year, semester)
+            ).fetchall()
+        courses = []
+        for row in rows:
+            course = dict(row)
+            course['time_slots'] = json.loads(course['time_slots'] or '[]')
+            courses.append(course)
+        return courses
+
+    def count_posts(self, board_id=None):
+        """저장된 게시글 수"""
+        if board_id is None:
+            sql, params = "SELECT COUNT(*) FROM posts", ()
+        else:
+            sql, params = "SELECT COUNT(*) FROM posts WHERE board_id = ?", (board_id,)
+        with self._lock:
+            return self.conn.execute(sql, params).fetchone()[0]
+
+    def max_article_id(self, board_id):
+        """게시판에 저장된 가장 큰 글 번호 (없으면 None)"""
+        with self._lock:
+            return self.conn.execute(
+                "SELECT MAX(article_id) FROM posts WHERE board_id = ?", (board_id,)
+            ).fetchone()[0]
+
+    def query(self, sql, params=()):
+        """SQL 조회 결과를 pandas DataFrame으로 반환"""
+        with self._lock:
+            return pd.read_sql_query(sql, self.conn, params=params)
+
+    def get_posts(self, board_id=None, min_comments=None, limit=None):
+        """
+        게시글 조회 (인덱스를 사용하는 조건만 지원)
+
+        Args:
+            board_id (str): 게시판 ID
+            min_comments (int): 최소 댓글 수
+            limit (int): 최대 개수 (댓글 많은 순)
+
+        Returns:
+            pandas.DataFrame
+        """
+        conditions, params = [], []
+        if board_id is not None:
+            conditions.append("board_id = ?")
+            params.append(board_id)
+        if min_comments is not None:
+            conditions.append("comment_count >= ?")
+            params.append(min_comments)
+
+        sql = "SELECT * FROM posts"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY comment_count DESC, article_id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        return self.query(sql, params)
+
+    def get_comments(self, post_id):
+        """게시글의 댓글 조회 (작성 순서)"""
+        return self.query(
+            "SELECT * FROM comments WHERE post_id = ? ORDER BY comment_index", (post_id,)
+        )
+
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
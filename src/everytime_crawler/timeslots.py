@@ -0,0 +1,169 @@
+"""
+구조화된 강의 시간 (time slot)과 시간 충돌 검사
+
+강의 시간 하나는 요일과 자정 기준 분 단위 구간으로 표현합니다.
+
+    {'day': 'Monday', 'start_minute': 540, 'end_minute': 630}   # 월 09:00-10:30
+
+구간은 [start_minute, end_minute) 반열린 구간이라 10:30에 끝나는 강의와 10:30에 시작하는
+강의는 겹치지 않습니다. 충돌 검사는 요일별로 시작 시각 순으로 정렬한 뒤 한 번 훑는 방식(sort-and-sweep)이라
+과목 수 n, 충돌 수 k에 대해 O(n log n + k)입니다.
+수강편람 전체를 여러 후보 시간표와 비교할 때는 TimeSlotIndex로 시간표를 한 번 색인해 두고 조회합니다.
+"""
+
+import heapq
+from bisect import bisect_left
+from collections import defaultdict
+
+DAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# 교시만 있는 시간 문자열('월 3,4교시')의 기준: 1교시 = 오전 9시, 교시당 60분
+FIRST_PERIOD_MINUTE = 9 * 60
+PERIOD_MINUTES = 60
+
+
+def make_slot(day, start_minute, end_minute):
+    """time slot dict 생성"""
+    return {'day': day, 'start_minute': int(start_minute), 'end_minute': int(end_minute)}
+
+
+def period_slot(day, period):
+    """교시 번호를 time slot으로 변환 (FIRST_PERIOD_MINUTE/PERIOD_MINUTES 기준)"""
+    start = FIRST_PERIOD_MINUTE + (period - 1) * PERIOD_MINUTES
+    return make_slot(day, start, start + PERIOD_MINUTES)
+
+
+def overlapped_periods(start_minute, end_minute):
+    """분 구간과 겹치는 교시 번호 리스트"""
+    first = (start_minute - FIRST_PERIOD_MINUTE) // PERIOD_MINUTES + 1
+    last = (end_minute - 1 - FIRST_PERIOD_MINUTE) // PERIOD_MINUTES + 1
+    return [period for period in range(max(first, 1), last + 1)]
+
+
+def format_slot(slot):
+    """'Monday 09:00-10:30' 형태 문자열"""
+    start, end = slot['start_minute'], slot['end_minute']
+    return f"{slot['day']} {start // 60:02d}:{start % 60:02d}-{end // 60:02d}:{end % 60:02d}"
+
+
+def subject_slots(subject, parse_time_string=None):
+    """
+    과목의 time slot 리스트
+
+    get_timetable이 저장한 'time_slots'를 우선 사용하고,
+    없으면 'time' 문자열('월 3,4교시')을 parse_time_string으로 해석해 교시별 slot을 만듭니다.
+    """
+    slots = subject.get('time_slots')
+    if slots:
+        return [slot for slot in slots if slot.get('day') and slot['end_minute'] > slot['start_minute']]
+    if parse_time_string is None:
+        return []
+    time_info = parse_time_string(subject.get('time', '') or '')
+    if not time_info['day']:
+        return []
+    return [period_slot(time_info['day'], period) for period in time_info['periods']]
+
+
+def _subject_name(subject):
+    return subject.get('subject_name', '')
+
+
+def find_conflicts(subjects, parse_time_string=None):
+    """
+    시간이 겹치는 과목 쌍 찾기 (요일별 sort-and-sweep)
+
+    Args:
+        subjects (list): 과목 dict 리스트 ('time_slots' 또는 'time' 포함)
+        parse_time_string (callable): 'time' 문자열 해석 함수 (TimetableAnalyzer.parse_time_string)
+
+    Returns:
+        list: 과목 쌍·요일별 충돌 정보
+            [{'subject1', 'subject2', 'day', 'start_minute', 'end_minute', 'conflicted_periods'}, ...]
+            start_minute/end_minute는 겹치는 구간 전체의 처음과 끝
+    """
+    by_day = defaultdict(list)
+    for index, subject in enumerate(subjects):
+        for slot in subject_slots(subject, parse_time_string):
+            by_day[slot['day']].append((slot['start_minute'], slot['end_minute'], index))
+
+    overlaps = {}  # (앞 과목, 뒤 과목, 요일) -> [겹침 시작, 겹침 끝, 교시 집합]
+    for day, slots in by_day.items():
+        slots.sort()
+        active = []  # (end_minute, start_minute, index) 힙: 아직 끝나지 않은 slot
+        for start, end, index in slots:
+            while active and active[0][0] <= start:
+                heapq.heappop(active)
+            for other_end, _, other in active:
+                if other == index:
+                    continue  # 같은 과목의 slot끼리는 충돌이 아님
+                overlap_start, overlap_end = start, min(end, other_end)
+                key = (min(index, other), max(index, other), day)
+                record = overlaps.get(key)
+                if record is None:
+                    overlaps[key] = [overlap_start, overlap_end, set(overlapped_periods(overlap_start, overlap_end))]
+                else:
+                    record[0] = min(record[0], overlap_start)
+                    record[1] = max(record[1], overlap_end)
+                    record[2].update(overlapped_periods(overlap_start, overlap_end))
+            heapq.heappush(active, (end, start, index))
+
+    conflicts = []
+    for (first, second, day), (start, end, periods) in sorted(overlaps.items()):
+        conflicts.append({
+            'subject1': _subject_name(subjects[first]),
+            'subject2': _subject_name(subjects[second]),
+            'day': day,
+            'start_minute': start,
+            'end_minute': end,
+            'conflicted_periods': sorted(periods)
+        })
+    return conflicts
+
+
+class TimeSlotIndex:
+    """
+    시간표 하나의 요일별 구간 색인
+
+    수강편람의 과목 수천 개를 후보 시간표에 넣을 수 있는지 확인할 때 시간표마다 한 번 색인하고
+    과목마다 overlaps()를 호출합니다. 조회는 이분 탐색 + 겹치는 구간 수만큼만 걸립니다.
+
+        index = TimeSlotIndex(my_timetable)
+        available = [course for course in catalogue if not index.conflicts_with(course)]
+    """
+
+    def __init__(self, subjects=(), parse_time_string=None):
+        self._parse_time_string = parse_time_string
+        self._days = {}
+        entries = defaultdict(list)
+        for subject in subjects:
+            for slot in subject_slots(subject, parse_time_string):
+                entries[slot['day']].append((slot['start_minute'], slot['end_minute'], subject))
+        for day, items in entries.items():
+            items.sort(key=lambda item: (item[0], item[1]))
+            starts = [item[0] for item in items]
+            # 앞에서부터의 최대 종료 시각: 왼쪽으로 훑다가 이 값이 조회 시작 이하이면 멈춤
+            max_ends, running = [], None
+            for item in items:
+                running = item[1] if running is None else max(running, item[1])
+                max_ends.append(running)
+            self._days[day] = (starts, max_ends, items)
+
+    def overlaps(self, slot):
+        """slot과 겹치는 (start_minute, end_minute, 과목) 리스트"""
+        indexed = self._days.get(slot['day'])
+        if not indexed:
+            return []
+        starts, max_ends, items = indexed
+        found = []
+        position = bisect_left(starts, slot['end_minute']) - 1
+        while position >= 0 and max_ends[position] > slot['start_minute']:
+            start, end, subject = items[position]
+            if end > slot['start_minute']:
+                found.append(items[position])
+            position -= 1
+        found.reverse()
+        return found
+
+    def conflicts_with(self, subject):
+        """과목의 slot 중 하나라도 색인된 시간표와 겹치면 True"""
+        return any(self.overlaps(slot) for slot in subject_slots(subject, self._parse_time_string))
@@ -0,0 +1,207 @@
+"""
+시간표 페이지 파서
+
+시간표 과목은 아래 구조의 요소로 표시됩니다.
+
+    <div class="subject color1" style="height: 90px; top: 540px;">
+      <h3>자료구조</h3>
+      <p><em>김교수</em><span>공학관 301</span></p>
+    </div>
+
+WebElement마다 find_element/get_attribute를 호출하면 과목 하나에 WebDriver 왕복이 5번 생기므로
+page_source를 한 번 파싱한 트리에서 모든 과목을 추출합니다.
+
+과목이 놓인 요일 칸(td)과 style의 top/height로 구조화된 time slot도 함께 만듭니다.
+top/height를 분으로 바꾸는 기준(시간 행 위치)은 왼쪽 시간 열(.times .time)에서 페이지마다
+한 번 읽습니다(TimeGrid). 시간 열을 찾지 못하면 top 0px = 오전 0시, 1시간 = 60px로 가정합니다.
+"""
+
+import re
+from bisect import bisect_right
+
+from .timeslots import DAYS
+
+# 값이 없을 때 기본값 (get_timetable 결과와 동일)
+UNKNOWN_SUBJECT = "알 수 없음"
+NO_PROFESSOR = "교수 정보 없음"
+NO_ROOM = "강의실 정보 없음"
+
+KOREAN_DAYS = {'월': 'Monday', '화': 'Tuesday', '수': 'Wednesday',
+               '목': 'Thursday', '금': 'Friday', '토': 'Saturday', '일': 'Sunday'}
+
+# 시간 열이 없을 때의 격자: top 0px = 오전 0시, 1시간 = 60px (top 480px = 오전 8시)
+BASE_TOP_PX = 0
+BASE_MINUTE = 0
+HOUR_HEIGHT_PX = 60
+
+TIME_ROW_SELECTOR = '.times .time'
+
+_TOP_PATTERN = re.compile(r'top:\s*(-?\d+(?:\.\d+)?)px')
+_HEIGHT_PATTERN = re.compile(r'height:\s*(\d+(?:\.\d+)?)px')
+_HOUR_LABEL_PATTERN = re.compile(r'(오전|오후)?\s*(\d{1,2})')
+
+_DEFAULT_GRID = None
+
+
+def _text(tag):
+    """렌더링된 텍스트처럼 공백을 정리한 태그 텍스트 (WebElement.text.strip()과 같은 값)"""
+    return ' '.join(tag.get_text(' ', strip=True).split())
+
+
+def extract_subject_fields(node):
+    """
+    과목 노드 하나에서 과목명, 교수, 강의실, style 속성 추출
+
+    Returns:
+        dict: {'subject_name', 'professor', 'room', 'style'} (style 속성이 없으면 None)
+    """
+    name_elem = node.find('h3')
+    subject_name = _text(name_elem) if name_elem is not None else UNKNOWN_SUBJECT
+
+    professor, room = NO_PROFESSOR, NO_ROOM
+    info_elem = node.find('p')
+    if info_elem is not None:
+        professor_elem = info_elem.find('em')
+        if professor_elem is not None:
+            professor = _text(professor_elem)
+        room_elem = info_elem.find('span')
+        if room_elem is not None:
+            room = _text(room_elem) or NO_ROOM
+
+    return {
+        'subject_name': subject_name,
+        'professor': professor,
+        'room': room,
+        'style': node.get('style'),
+    }
+
+
+def read_day_columns(soup):
+    """
+    시간표 머리글(.tablehead)의 요일 순서
+
+    Returns:
+        list: 요일 칸 순서대로의 요일 이름 (머리글이 없으면 월~일)
+    """
+    days = [KOREAN_DAYS.get(_text(cell)[:1]) for cell in soup.select('table.tablehead td')]
+    if not days or not all(days):
+        return list(DAYS)
+    return days
+
+
+def subject_day(node, days):
+    """과목 노드가 들어 있는 요일 칸(td)의 요일 (알 수 없으면 None)"""
+    cell = node.find_parent('td')
+    if cell is None:
+        return None
+    index = len(cell.find_previous_siblings('td'))
+    return days[index] if index < len(days) else None
+
+
+def _label_hour(label, previous):
+    """시간 열 라벨('오전 9시', '오후 1시', '13')의 시각 (해석하지 못하면 앞 행 + 1)"""
+    match = _HOUR_LABEL_PATTERN.search(label)
+    if not match:
+        return None if previous is None else previous + 1
+    meridiem, hour = match.group(1), int(match.group(2))
+    if meridiem == '오전':
+        return hour % 12
+    if meridiem == '오후':
+        return hour % 12 + 12
+    if previous is not None and hour <= previous:
+        return hour + 12  # 숫자만 있는 라벨: 12 다음의 1은 13시
+    return hour
+
+
+class TimeGrid:
+    """
+    시간표 격자의 픽셀 -> 분 변환 기준
+
+    시간 행(.time)마다 시작 위치(px), 시각(분), 높이(px)를 기억하고
+    과목의 top/height를 행 사이 선형 보간으로 자정 기준 분으로 바꿉니다.
+
+        grid = TimeGrid.from_soup(soup)              # 페이지당 한 번
+        ranges = grid.time_ranges(styles)            # [(540, 630), None, ...]
+    """
+
+    def __init__(self, rows):
+        """
+        Args:
+            rows (list): (시작 px, 시작 분, 높이 px) 튜플 리스트 (위에서부터 순서대로)
+        """
+        self._offsets = [row[0] for row in rows]
+        self._minutes = [row[1] for row in rows]
+        self._scales = [60 / row[2] for row in rows]  # 분/px
+
+    @classmethod
+    def default(cls):
+        """시간 열이 없을 때의 기본 격자 (1시간 = HOUR_HEIGHT_PX, 인스턴스 하나를 재사용)"""
+        global _DEFAULT_GRID
+        if _DEFAULT_GRID is None:
+            _DEFAULT_GRID = cls([(BASE_TOP_PX, BASE_MINUTE, HOUR_HEIGHT_PX)])
+        return _DEFAULT_GRID
+
+    @classmethod
+    def from_soup(cls, soup):
+        """왼쪽 시간 열(.times .time)의 높이와 라벨로 격자 생성 (없으면 기본 격자)"""
+        rows, offset, hour = [], 0.0, None
+        for cell in soup.select(TIME_ROW_SELECTOR):
+            hour = _label_hour(_text(cell), hour)
+            if hour is None:
+                return cls.default()
+            height_match = _HEIGHT_PATTERN.search(cell.get('style') or '')
+            height = float(height_match.group(1)) if height_match else HOUR_HEIGHT_PX
+            if height <= 0:
+                continue
+            rows.append((offset, hour * 60, height))
+            offset += height
+        return cls(rows) if rows else cls.default()
+
+    def to_minute(self, px):
+        """격자 위치(px)를 자정 기준 분으로 변환 (격자 밖은 가장 가까운 행의 비율로 연장)"""
+        index = max(bisect_right(self._offsets, px) - 1, 0)
+        return self._minutes[index] + (px - self._offsets[index]) * self._scales[index]
+
+    def time_range(self, style):
+        """
+        style 속성의 top/height를 (시작 분, 종료 분)으로 변환
+
+        Returns:
+            tuple: (start_minute, end_minute), top/height가 없거나 범위가 잘못되면 None
+        """
+        if not style:
+            return None
+        top_match = _TOP_PATTERN.search(style)
+        height_match = _HEIGHT_PATTERN.search(style)
+        if not top_match or not height_match:
+            return None
+
+        top = float(top_match.group(1))
+        start = round(self.to_minute(top))
+        end = round(self.to_minute(top + float(height_match.group(1))))
+        if start < 0 or end <= start:
+            return None
+        return start, end
+
+    def time_ranges(self, styles):
+        """style 리스트를 한 번에 변환 (time_range와 같은 값의 리스트)"""
+        return [self.time_range(style) for style in styles]
+
+
+def format_minute(minute):
+    """자정 기준 분을 '오전 9시', '오후 1시 30분' 형태로"""
+    hour, rest = divmod(minute, 60)
+    if hour < 12:
+        text = f"오전 {hour}시"
+    elif hour == 12:
+        text = "오후 12시"
+    else:
+        text = f"오후 {hour - 12}시"
+    return f"{text} {rest}분" if rest else text
+
+
+def format_time_range(time_range):
+    """(시작 분, 종료 분)을 '오전 9시 - 오전 10시 30분' 형태로 (None이면 '시간 정보 없음')"""
+    if time_range is None:
+        return "시간 정보 없음"
+    return f"{format_minute(time_range[0])} - {format_minute(time_range[1])}"
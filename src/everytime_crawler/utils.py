@@ -2,12 +2,15 @@
 에브리타임 크롤러 유틸리티 함수들
 """
 
+import re
 import json
 import pandas as pd
 from datetime import datetime, timedelta
 import os
 import time
 
+from .timeslots import find_conflicts
+
 class DataManager:
     """데이터 관리 유틸리티 클래스"""
     
@@ -81,24 +84,25 @@ class DataManager:
         print(f"파일 {len(csv_files)}개를 {output_filename}으로 합쳤습니다.")
         return output_filename
 
+# 시간표 문자열 패턴 (호출마다 컴파일하지 않도록 모듈 로드 시 한 번만 컴파일)
+_DAY_PATTERN = re.compile(r'[월화수목금토일]')
+_PERIOD_PATTERN = re.compile(r'\d+')
+_DAY_NAMES = {'월': 'Monday', '화': 'Tuesday', '수': 'Wednesday',
+              '목': 'Thursday', '금': 'Friday', '토': 'Saturday', '일': 'Sunday'}
+
+
 class TimetableAnalyzer:
     """시간표 분석 유틸리티 클래스"""
     
     @staticmethod
     def parse_time_string(time_str):
         """시간 문자열 파싱 (예: '월 3,4교시' -> 요일과 교시 정보)"""
-        import re
-        
-        days = {'월': 'Monday', '화': 'Tuesday', '수': 'Wednesday', 
-                '목': 'Thursday', '금': 'Friday', '토': 'Saturday', '일': 'Sunday'}
-        
         # 요일 추출
-        day_match = re.search(r'[월화수목금토일]', time_str)
-        day = days.get(day_match.group()) if day_match else None
+        day_match = _DAY_PATTERN.search(time_str)
+        day = _DAY_NAMES.get(day_match.group()) if day_match else None
         
         # 교시 추출
-        period_match = re.findall(r'\d+', time_str)
-        periods = [int(p) for p in period_match] if period_match else []
+        periods = [int(p) for p in _PERIOD_PATTERN.findall(time_str)]
         
         return {
             'day': day,
@@ -108,38 +112,15 @@ class TimetableAnalyzer:
     
     @staticmethod
     def check_time_conflicts(timetable_data):
-        """시간표 충돌 확인"""
-        conflicts = []
-        parsed_schedule = []
-        
-        for subject in timetable_data:
-            time_info = TimetableAnalyzer.parse_time_string(subject.get('time', ''))
-            parsed_schedule.append({
-                'subject': subject,
-                'time_info': time_info
-            })
-        
-        # 충돌 확인
-        for i in range(len(parsed_schedule)):
-            for j in range(i + 1, len(parsed_schedule)):
-                schedule1 = parsed_schedule[i]
-                schedule2 = parsed_schedule[j]
-                
-                # 같은 요일인지 확인
-                if schedule1['time_info']['day'] == schedule2['time_info']['day']:
-                    # 교시 겹치는지 확인
-                    periods1 = set(schedule1['time_info']['periods'])
-                    periods2 = set(schedule2['time_info']['periods'])
-                    
-                    if periods1.intersection(periods2):
-                        conflicts.append({
-                            'subject1': schedule1['subject']['subject_name'],
-                            'subject2': schedule2['subject']['subject_name'],
-                            'day': schedule1['time_info']['day'],
-                            'conflicted_periods': list(periods1.intersection(periods2))
-                        })
-        
-        return conflicts
+        """
+        시간표 충돌 확인 (요일별 정렬 후 한 번 훑기, O(n log n))
+
+        과목의 'time_slots'(요일, 시작/종료 분)를 사용하고, 없으면 'time' 문자열의 교시로 비교합니다.
+
+        Returns:
+            list: [{'subject1', 'subject2', 'day', 'start_minute', 'end_minute', 'conflicted_periods'}, ...]
+        """
+        return find_conflicts(timetable_data, TimetableAnalyzer.parse_time_string)
     
     @staticmethod
     def generate_weekly_schedule(timetable_data):
@@ -245,12 +226,17 @@ class ScheduledCrawler:
         
         def job():
             try:
+                if not self._ensure_login():
+                    print(f"[{datetime.now()}] 로그인 실패로 작업을 건너뜁니다.")
+                    return
+                
                 if target_type == 'timetable':
                     data = self.crawler.get_timetable(**kwargs)
                     print(f"[{datetime.now()}] 시간표 {len(data)}개 수집 완료")
                 elif target_type == 'board':
-                    board_id = kwargs.get('board_id', 'free')
-                    data = self.crawler.get_board_posts(board_id, **kwargs)
+                    board_kwargs = dict(kwargs)
+                    board_id = board_kwargs.pop('board_id', 'free')
+                    data = self.crawler.get_board_posts(board_id, **board_kwargs)
                     print(f"[{datetime.now()}] 게시판 {len(data)}개 수집 완료")
             except Exception as e:
                 print(f"[{datetime.now()}] 크롤링 오류: {e}")
@@ -259,6 +245,17 @@ class ScheduledCrawler:
         self.jobs.append(job)
         print(f"매일 {time_str}에 {target_type} 크롤링 작업이 예약되었습니다.")
     
+    def _ensure_login(self):
+        """
+        작업 전 로그인 상태 확인
+        
+        크롤러에 session_store가 설정되어 있으면 저장된 쿠키를 HTTP 요청 한 번으로 확인하고,
+        만료된 경우에만 브라우저 로그인을 수행합니다. 설정이 없으면 기존처럼 호출자가 로그인을 관리합니다.
+        """
+        if not getattr(self.crawler, 'session_store', None):
+            return True
+        return self.crawler.login()
+    
     def run_scheduled_jobs(self):
         """예약된 작업들 실행"""
         import schedule
@@ -0,0 +1,112 @@
+"""
+조건 기반 페이지 대기 유틸리티
+
+고정된 time.sleep 대신 필요한 DOM이 나타나는 즉시 반환하고, 실제 대기 시간을 기록합니다.
+"""
+
+import time
+from collections import defaultdict
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+# 페이지 종류별 "로딩 완료" 판단 셀렉터
+BOARD_LIST_SELECTORS = ["article.list", "tr.list", ".board-item", ".post-item", ".list-item"]
+# 글이 없는 게시판/페이지의 "게시글 없음" 표시 (게시글 요소가 없어도 로딩 완료로 판단)
+BOARD_EMPTY_SELECTORS = ["article.dialog", ".articles .empty", ".wrap.articles .none"]
+BOARD_READY_SELECTORS = BOARD_LIST_SELECTORS + BOARD_EMPTY_SELECTORS
+POST_DETAIL_SELECTORS = ["ul.comments", "p.large", ".article-content", ".post-content"]
+TIMETABLE_SELECTORS = ["#semesters", ".tablebody", ".subject"]
+LOGIN_FORM_SELECTORS = ["input[name='id']"]
+
+
+class PageWaiter:
+    """조건 기반 대기 + 대기 시간 기록"""
+
+    def __init__(self, driver=None, timeout=10, poll_frequency=0.1):
+        """
+        PageWaiter 초기화
+
+        Args:
+            driver: Selenium WebDriver 인스턴스
+            timeout (float): 기본 최대 대기 시간(초)
+            poll_frequency (float): 조건 확인 간격(초)
+        """
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+        self.timings = defaultdict(list)
+
+    def until(self, condition, label, timeout=None, required=False):
+        """
+        condition(driver)이 참이 될 때까지 대기
+
+        Args:
+            condition (callable): driver를 받아 참/거짓(또는 값)을 반환하는 함수
+            label (str): 대기 시간 기록용 이름
+            timeout (float): 최대 대기 시간(초), None이면 기본값
+            required (bool): True이면 시간 초과 시 TimeoutException 발생
+
+        Returns:
+            condition의 반환값 (시간 초과 시 None)
+        """
+        timeout = self.timeout if timeout is None else timeout
+        start = time.monotonic()
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=self.poll_frequency).until(condition)
+        except TimeoutException:
+            if required:
+                raise
+            return None
+        finally:
+            self.timings[label].append(time.monotonic() - start)
+
+    def for_any(self, selectors, label, timeout=None, required=False):
+        """셀렉터 중 하나라도 나타날 때까지 대기 (find_elements 왕복은 확인 1회당 1번)"""
+        css = ", ".join(selectors)
+        return self.until(
+            lambda d: d.find_elements(By.CSS_SELECTOR, css),
+            label,
+            timeout=timeout,
+            required=required
+        )
+
+    def for_document_ready(self, label, timeout=None):
+        """document.readyState가 complete가 될 때까지 대기"""
+        return self.until(
+            lambda d: d.execute_script("return document.readyState") == "complete",
+            label,
+            timeout=timeout
+        )
+
+    def for_refresh(self, old_elements, selectors, label, timeout=None):
+        """기존 요소가 DOM에서 교체된 뒤 새 요소가 나타날 때까지 대기"""
+        first = old_elements[0] if old_elements else None
+
+        def refreshed(d):
+            if first is not None:
+                try:
+                    first.is_enabled()
+                    return False  # 아직 이전 DOM
+                except Exception:
+                    pass  # StaleElementReferenceException 등: 교체 완료
+            return d.find_elements(By.CSS_SELECTOR, ", ".join(selectors)) or first is not None
+
+        return self.until(refreshed, label, timeout=timeout)
+
+    def summary(self):
+        """라벨별 대기 시간 통계"""
+        return {
+            label: {
+                'count': len(values),
+                'total': sum(values),
+                'avg': sum(values) / len(values),
+                'max': max(values)
+            }
+            for label, values in self.timings.items() if values
+        }
+
+    def reset(self):
+        """기록된 대기 시간 초기화"""
+        self.timings.clear()
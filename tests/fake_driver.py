@@ -0,0 +1,179 @@
+"""
+저장된 HTML을 제공하는 가짜 WebDriver
+
+get_timetable처럼 WebElement를 직접 다루는 코드를 브라우저 없이 테스트/벤치마크하기 위해
+BeautifulSoup(lxml) 트리로 find_element(s), text, get_attribute를 흉내냅니다.
+XPath는 지원하지 않으며 빈 결과를 반환합니다.
+
+    driver = FakeDriver({'/timetable': 'timetable.html'})
+    crawler.driver = driver
+    crawler.get_timetable(save_to_file=False)
+
+selections에 <option> value별 HTML을 주면 그 option을 클릭했을 때 페이지가 교체됩니다
+(#semesters 드롭다운으로 학기를 바꾸는 동작). 페이지가 바뀌면 이전 요소는 stale이 됩니다.
+
+round_trips는 브라우저와의 왕복 횟수(명령 수)입니다.
+"""
+
+import os
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+class FakeElement:
+    """bs4 Tag를 감싼 WebElement"""
+
+    def __init__(self, tag, driver):
+        self._tag = tag
+        self._driver = driver
+        self._generation = driver._generation
+
+    def _check(self):
+        self._driver.round_trips += 1
+        if self._generation != self._driver._generation:
+            raise StaleElementReferenceException(self._tag.name)
+
+    @property
+    def text(self):
+        self._check()
+        return ' '.join(self._tag.get_text(' ', strip=True).split())
+
+    @property
+    def tag_name(self):
+        return self._tag.name
+
+    def get_attribute(self, name):
+        self._check()
+        if name == 'outerHTML':
+            return str(self._tag)
+        value = self._tag.get(name)
+        return ' '.join(value) if isinstance(value, list) else value
+
+    def find_elements(self, by, value):
+        return self._driver._find(self._tag, by, value)
+
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"{by}={value}")
+        return elements[0]
+
+    def is_enabled(self):
+        self._check()
+        return True
+
+    def is_displayed(self):
+        return True
+
+    def is_selected(self):
+        self._check()
+        return self._tag.has_attr('selected')
+
+    def click(self):
+        self._check()
+        if self._tag.name == 'option':
+            self._driver._select(self._tag.get('value'))
+
+
+class FakeDriver:
+    """경로별 fixture HTML을 제공하는 WebDriver"""
+
+    def __init__(self, pages, fixtures_dir=FIXTURES_DIR, base_url="https://everytime.kr", selections=None):
+        """
+        Args:
+            pages (dict): URL 경로 -> fixture 파일명 (또는 '<'로 시작하는 HTML 문자열)
+            selections (dict): <option> value -> 그 option을 선택했을 때의 HTML (fixture 파일명 또는 HTML)
+        """
+        self.base_url = base_url
+        self.round_trips = 0
+        self.current_url = base_url
+        self._fixtures_dir = fixtures_dir
+        self._pages = {path: self._load(source) for path, source in pages.items()}
+        self._selections = {value: self._load(source) for value, source in (selections or {}).items()}
+        self._generation = 0
+        self.cookies = []
+        self._html = ''
+        self._soup = BeautifulSoup('', 'lxml')
+
+    def _load(self, source):
+        if source.lstrip().startswith('<'):
+            return source
+        with open(os.path.join(self._fixtures_dir, source), encoding='utf-8') as f:
+            return f.read()
+
+    def _render(self, html):
+        self._generation += 1
+        self._html = html
+        self._soup = BeautifulSoup(html, 'lxml')
+
+    def get(self, url):
+        self.round_trips += 1
+        path = urlparse(url).path or '/'
+        self.current_url = url
+        self._render(self._pages.get(path, '<html><body></body></html>'))
+
+    def _select(self, value):
+        """option 클릭: 등록된 HTML로 페이지 교체 후 해당 option을 선택 상태로 표시"""
+        if value not in self._selections:
+            return
+        self._render(self._selections[value])
+        for option in self._soup.find_all('option'):
+            if option.get('value') == value:
+                option['selected'] = 'selected'
+            elif option.has_attr('selected'):
+                del option['selected']
+        self._html = str(self._soup)
+
+    @property
+    def page_source(self):
+        self.round_trips += 1
+        return self._html
+
+    @property
+    def title(self):
+        self.round_trips += 1
+        return self._soup.title.get_text(strip=True) if self._soup.title else ''
+
+    def find_elements(self, by, value):
+        return self._find(self._soup, by, value)
+
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"{by}={value}")
+        return elements[0]
+
+    def _find(self, root, by, value):
+        self.round_trips += 1
+        if by == By.CSS_SELECTOR:
+            tags = root.select(value)
+        elif by == By.TAG_NAME:
+            tags = root.find_all(value)
+        elif by == By.CLASS_NAME:
+            tags = root.find_all(class_=value)
+        elif by == By.ID:
+            tags = root.find_all(id=value)
+        else:
+            tags = []  # XPath 등은 지원하지 않음
+        return [FakeElement(tag, self) for tag in tags]
+
+    def execute_script(self, script, *args):
+        self.round_trips += 1
+        return None
+
+    def save_screenshot(self, filename):
+        return True
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+    def quit(self):
+        pass
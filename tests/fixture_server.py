@@ -0,0 +1,144 @@
+"""
+저장된 에브리타임 HTML을 제공하는 로컬 테스트 서버
+
+네트워크나 로그인 없이 HTTP 경로를 테스트하기 위해 사용합니다.
+
+경로 규칙:
+- /{board_number}?page=N -> fixtures/board_{board_number}_page{N}.html
+- /{board_number}/v/{article_id} -> fixtures/post_{article_id}.html
+- POST /find/timetable/subject/list (year, semester, startNum, limitNum)
+  -> fixtures/catalogue_{year}_{semester}.xml의 subject 중 startNum부터 limitNum개
+
+require_cookie가 설정되면 해당 쿠키가 없는 요청은 /login으로 리다이렉트합니다.
+"""
+
+import os
+import re
+import threading
+import xml.etree.ElementTree as ET
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+_BOARD_PATH = re.compile(r'^/(\d+)/?$')
+_POST_PATH = re.compile(r'^/(\d+)/v/(\d+)/?$')
+_CATALOGUE_PATH = '/find/timetable/subject/list'
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    """요청 경로를 fixture 파일에 매핑하는 핸들러"""
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        self.server.requests_log.append({
+            'path': self.path,
+            'cookie': self.headers.get('Cookie', ''),
+            'user_agent': self.headers.get('User-Agent', '')
+        })
+
+        if parsed.path == '/login':
+            self._send_body(b'<html><body><input name="id"></body></html>')
+            return
+
+        required = self.server.require_cookie
+        if required and required not in self.headers.get('Cookie', ''):
+            self.send_response(302)
+            self.send_header('Location', '/login')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        filename = None
+        board_match = _BOARD_PATH.match(parsed.path)
+        post_match = _POST_PATH.match(parsed.path)
+
+        if board_match:
+            page = parse_qs(parsed.query).get('page', ['1'])[0]
+            filename = f"board_{board_match.group(1)}_page{page}.html"
+        elif post_match:
+            filename = f"post_{post_match.group(2)}.html"
+
+        path = os.path.join(self.server.fixtures_dir, filename) if filename else None
+        if not path or not os.path.exists(path):
+            self.send_error(404)
+            return
+
+        with open(path, 'rb') as f:
+            self._send_body(f.read())
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        form = {key: values[0] for key, values in parse_qs(self.rfile.read(length).decode('utf-8')).items()}
+        self.server.requests_log.append({
+            'path': self.path,
+            'method': 'POST',
+            'form': form,
+            'cookie': self.headers.get('Cookie', '')
+        })
+
+        required = self.server.require_cookie
+        if required and required not in self.headers.get('Cookie', ''):
+            self._send_body(b'<response>-1</response>', 'application/xml')
+            return
+
+        path = os.path.join(self.server.fixtures_dir, f"catalogue_{form.get('year')}_{form.get('semester')}.xml")
+        if urlparse(self.path).path != _CATALOGUE_PATH or not os.path.exists(path):
+            self.send_error(404)
+            return
+
+        # 수강편람 페이지 나누기 흉내: startNum부터 limitNum개
+        root = ET.parse(path).getroot()
+        start, limit = int(form.get('startNum', 0)), int(form.get('limitNum', 50))
+        if self.server.max_limit:
+            limit = min(limit, self.server.max_limit)  # 서버가 limitNum 상한을 두는 경우
+        page = ET.Element('response')
+        page.extend(root.findall('subject')[start:start + limit])
+        self._send_body(ET.tostring(page, encoding='utf-8'), 'application/xml')
+
+    def _send_body(self, body, content_type='text/html'):
+        self.send_response(200)
+        self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 테스트 출력이 지저분해지지 않도록 접근 로그 생략
+        pass
+
+
+class FixtureServer:
+    """fixture 디렉토리를 제공하는 백그라운드 HTTP 서버"""
+
+    def __init__(self, fixtures_dir=FIXTURES_DIR, require_cookie=None):
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), _FixtureHandler)
+        self.httpd.fixtures_dir = fixtures_dir
+        self.httpd.require_cookie = require_cookie
+        self.httpd.max_limit = None
+        self.httpd.requests_log = []
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def requests_log(self):
+        return self.httpd.requests_log
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
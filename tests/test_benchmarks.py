@@ -0,0 +1,50 @@
+"""
+파서 벤치마크 스위트 테스트 (측정값이 아닌 동작만 확인)
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+import unittest
+import bench_parsers
+
+
+class TestBenchParsers(unittest.TestCase):
+    """bench_parsers.run / compare 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.results = bench_parsers.run(repeat=1)
+
+    def test_all_cases_run(self):
+        """모든 항목이 fixture에서 항목을 처리하고 메모리를 측정"""
+        self.assertEqual(set(self.results), set(bench_parsers.load_baseline()))
+        for name, result in self.results.items():
+            self.assertGreater(result['items_per_page'], 0, name)
+            self.assertGreater(result['items_per_sec'], 0, name)
+            self.assertGreater(result['peak_kib'], 0, name)
+
+        self.assertEqual(self.results['list_page']['items_per_page'], 20)
+        self.assertEqual(self.results['post_detail']['items_per_page'], 311)
+        self.assertEqual(self.results['timetable']['items_per_page'], 12)
+
+    def test_compare(self):
+        """처리량 감소와 메모리 증가를 회귀로 보고"""
+        baseline = {name: {'items_per_sec': r['items_per_sec'], 'peak_kib': r['peak_kib']}
+                    for name, r in self.results.items()}
+        self.assertEqual(bench_parsers.compare(self.results, baseline), [])
+
+        slower = dict(baseline, list_page={'items_per_sec': self.results['list_page']['items_per_sec'] * 2,
+                                           'peak_kib': self.results['list_page']['peak_kib']})
+        regressions = bench_parsers.compare(self.results, slower, tolerance=0.35)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith('list_page: 처리량'))
+
+        leaner = dict(baseline, post_detail={'items_per_sec': 0, 'peak_kib': 1.0})
+        regressions = bench_parsers.compare(self.results, leaner, tolerance=0.35)
+        self.assertTrue(regressions[0].startswith('post_detail: 메모리'))
+
+
+if __name__ == '__main__':
+    unittest.main()
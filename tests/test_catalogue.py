@@ -0,0 +1,118 @@
+"""
+수강편람 크롤러 테스트 (로컬 fixture 서버 사용)
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import shutil
+import tempfile
+import unittest
+from everytime_crawler import EverytimeCrawler, CatalogueCrawler, SQLiteStore, TimeSlotIndex
+from everytime_crawler.timeslots import make_slot
+from fixture_server import FixtureServer, FIXTURES_DIR
+
+
+class TestCatalogueCrawler(unittest.TestCase):
+    """수강편람 페이지 나누기 / 저장 테스트"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        shutil.copy(os.path.join(FIXTURES_DIR, 'catalogue_2025_1.xml'), self.tmp)
+        self.server = FixtureServer(fixtures_dir=self.tmp).start()
+        self.crawler = EverytimeCrawler()
+        self.catalogue = CatalogueCrawler(self.crawler, page_size=20, delay=0, api_url=self.server.base_url)
+
+    def tearDown(self):
+        self.server.stop()
+        shutil.rmtree(self.tmp)
+
+    def test_pages_through_catalogue(self):
+        courses = self.catalogue.get_courses(2025, 1)
+
+        self.assertEqual(len(courses), 45)
+        self.assertEqual([r['form']['startNum'] for r in self.server.requests_log], ['0', '20', '40', '45'])
+        first = courses[0]
+        self.assertEqual((first['subject_id'], first['code'], first['subject_name']), ('1520300', 'CSE2000-01', '자료구조'))
+        self.assertEqual(first['credit'], 3)
+        self.assertEqual(first['time_slots'], [make_slot('Thursday', 690, 870)])
+        online = [c for c in courses if c['time'] == '온라인강의']
+        self.assertTrue(online)
+        self.assertEqual(online[0]['time_slots'], [])
+
+        index = TimeSlotIndex([first])
+        self.assertFalse(index.conflicts_with(online[0]))
+
+    def test_incremental_refresh(self):
+        """다시 스캔하면 바뀐 강의만 기록하고, 사라진 강의는 삭제"""
+        store = SQLiteStore(':memory:')
+
+        stats = self.catalogue.refresh(store, 2025, 1)
+        self.assertEqual((stats['pages'], stats['inserted'], stats['error']), (3, 45, None))
+        self.assertEqual(store.count_courses(2025, 1), 45)
+
+        stats = self.catalogue.refresh(store, 2025, 1)
+        self.assertEqual((stats['inserted'], stats['updated'], stats['unchanged'], stats['removed']), (0, 0, 45, 0))
+
+        path = os.path.join(self.tmp, 'catalogue_2025_1.xml')
+        with open(path, encoding='utf-8') as f:
+            xml = f.read()
+        xml = xml.replace('professor="김민수" credit="3" place="IT관 301">', 'professor="홍길동" credit="3" place="IT관 301">', 1)
+        start = xml.index('<subject id="1520344"')
+        xml = xml[:start] + xml[xml.index('</subject>', start) + len('</subject>'):]
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(xml)
+
+        stats = self.catalogue.refresh(store, 2025, 1)
+        self.assertEqual((stats['updated'], stats['unchanged'], stats['removed']), (1, 43, 1))
+        courses = {c['subject_id']: c for c in store.get_courses(2025, 1)}
+        self.assertEqual(len(courses), 44)
+        self.assertEqual(courses['1520300']['professor'], '홍길동')
+        self.assertEqual(courses['1520300']['time_slots'], [make_slot('Thursday', 690, 870)])
+        store.close()
+
+    def test_capped_page_size_keeps_courses(self):
+        """서버가 limitNum보다 적게 돌려줘도 다음 startNum부터 이어 받고 강의를 삭제하지 않음"""
+        store = SQLiteStore(':memory:')
+        self.catalogue.refresh(store, 2025, 1)
+
+        self.server.httpd.max_limit = 15
+        del self.server.requests_log[:]
+        stats = self.catalogue.refresh(store, 2025, 1)
+
+        self.assertEqual([r['form']['startNum'] for r in self.server.requests_log], ['0', '15', '30', '45'])
+        self.assertEqual((stats['pages'], stats['unchanged'], stats['removed']), (3, 45, 0))
+        self.assertEqual(store.count_courses(2025, 1), 45)
+        store.close()
+
+    def test_partial_scan_keeps_courses(self):
+        """max_pages에서 멈추거나 첫 페이지가 비어 있으면 강의를 삭제하지 않음"""
+        store = SQLiteStore(':memory:')
+        self.catalogue.refresh(store, 2025, 1)
+
+        self.assertEqual(self.catalogue.refresh(store, 2025, 1, max_pages=2)['removed'], 0)
+
+        with open(os.path.join(self.tmp, 'catalogue_2025_1.xml'), 'w', encoding='utf-8') as f:
+            f.write('<response></response>')
+        stats = self.catalogue.refresh(store, 2025, 1)
+        self.assertEqual((stats['pages'], stats['error'], stats['removed']), (0, None, 0))
+        self.assertEqual(store.count_courses(2025, 1), 45)
+        store.close()
+
+    def test_logged_out_keeps_existing_courses(self):
+        """로그인이 풀려 거부되면 오류를 기록하고 기존 강의는 삭제하지 않음"""
+        store = SQLiteStore(':memory:')
+        self.catalogue.refresh(store, 2025, 1)
+
+        self.server.httpd.require_cookie = 'etsid'
+        stats = self.catalogue.refresh(store, 2025, 1)
+
+        self.assertIsNotNone(stats['error'])
+        self.assertEqual(stats['removed'], 0)
+        self.assertEqual(store.count_courses(2025, 1), 45)
+        store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+"""
+Parquet 컬럼 저장 테스트 (pyarrow가 없으면 건너뜀)
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import tempfile
+import unittest
+from unittest.mock import patch
+from everytime_crawler.columnar import ParquetSink, read_table, pa, ds
+
+
+def make_posts(count, board_id='free'):
+    return [
+        {
+            'title': f'글 {i}',
+            'author': '익명',
+            'created_time': '07/02 10:00',
+            'comment_count': str(i % 4),
+            'view_count': None,
+            'post_link': f'https://everytime.kr/387605/v/{1000 + i}',
+            'board_id': board_id,
+            'page': 1,
+            'collected_at': '2025-07-02T10:00:00'
+        }
+        for i in range(count)
+    ]
+
+
+@unittest.skipIf(pa is None, "pyarrow가 설치되지 않음")
+class TestParquetSink(unittest.TestCase):
+    """ParquetSink / read_table 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = self.tmpdir.name
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_typed_posts_partitioned_by_board_and_date(self):
+        """숫자 컬럼은 정수 타입, 게시판/날짜는 디렉토리 파티션"""
+        with ParquetSink(self.root) as sink:
+            sink.write_posts(make_posts(3, 'free') + make_posts(2, 'secret'))
+
+        self.assertTrue(os.path.isdir(os.path.join(self.root, 'posts', 'board_id=free', 'date=2025-07-02')))
+
+        df = read_table(self.root)
+        self.assertEqual(len(df), 5)
+        self.assertEqual(str(df['comment_count'].dtype), 'int32')
+        self.assertEqual(str(df['article_id'].dtype), 'int64')
+        self.assertEqual(sorted(df['board_id'].unique()), ['free', 'secret'])
+
+    def test_row_group_batches(self):
+        """row_group_size개마다 row group 하나로 기록"""
+        import pyarrow.parquet as pq
+
+        with ParquetSink(self.root, row_group_size=10) as sink:
+            sink.write_posts(make_posts(25))
+
+        self.assertEqual(len(sink.files), 1)
+        self.assertEqual(pq.ParquetFile(sink.files[0]).metadata.num_row_groups, 3)
+
+    def test_comments_join_on_post_id(self):
+        """댓글 테이블은 post_id로 게시글과 연결"""
+        with ParquetSink(self.root) as sink:
+            sink.write_posts(make_posts(2))
+            sink.write_post_detail({
+                'url': 'https://everytime.kr/387605/v/1001',
+                'comments': [{'author': '익명1', 'content': '댓글', 'created_time': '07/02 11:00'}] * 3,
+                'collected_at': '2025-07-02T11:00:00'
+            }, board_id='free')
+
+        posts = read_table(self.root, columns=['article_id', 'title'])
+        comments = read_table(self.root, 'comments')
+        joined = comments.merge(posts, left_on='post_id', right_on='article_id')
+
+        self.assertEqual(len(joined), 3)
+        self.assertEqual(set(joined['title']), {'글 1'})
+        self.assertEqual(list(comments['comment_index']), [0, 1, 2])
+
+    def test_comment_thread_columns(self):
+        """댓글 번호, 부모 댓글, 깊이를 정수 컬럼으로 저장"""
+        with ParquetSink(self.root) as sink:
+            sink.write_comments(1000, 'free', [
+                {'comment_id': 100, 'parent_id': None, 'depth': 0, 'content': '댓글'},
+                {'comment_id': 101, 'parent_id': 100, 'depth': 1, 'content': '대댓글'},
+            ], collected_at='2025-07-02T11:00:00')
+
+        comments = read_table(self.root, 'comments', columns=['comment_id', 'parent_id', 'depth'])
+        self.assertEqual(list(comments['comment_id']), [100, 101])
+        self.assertEqual(comments['parent_id'].tolist()[1], 100)
+        self.assertEqual(list(comments['depth']), [0, 1])
+
+    def test_comments_use_post_date_partition(self):
+        """자정 직전 글의 댓글은 다음 날 수집해도 게시글 작성 날짜 파티션에 저장"""
+        posts = make_posts(2)
+        posts[0]['created_at'] = '2025-07-01T23:50:00'
+        comment = {'author': '익명1', 'content': '댓글', 'created_time': '07/02 00:10'}
+        with ParquetSink(self.root) as sink:
+            sink.write_posts(posts)
+            sink.write_post_detail({'url': posts[0]['post_link'], 'comments': [comment],
+                                    'collected_at': '2025-07-02T09:00:00'}, board_id='free')
+            sink.write_post_detail({'url': 'https://everytime.kr/387605/v/2000', 'comments': [comment],
+                                    'created_at': '2025-06-30T12:00:00',
+                                    'collected_at': '2025-07-02T09:00:00'}, board_id='free')
+
+        comments = read_table(self.root, 'comments', columns=['post_id', 'date'])
+        self.assertEqual(dict(zip(comments['post_id'], comments['date'])),
+                         {1000: '2025-07-01', 2000: '2025-06-30'})
+
+    def test_post_dates_are_bounded(self):
+        """댓글 파티션용 게시글 날짜는 최근 max_buffered_rows개만 기억"""
+        with ParquetSink(self.root, max_buffered_rows=10) as sink:
+            sink.write_posts(make_posts(25))
+            self.assertEqual(list(sink._post_dates), list(range(1015, 1025)))
+
+    def test_buffer_is_bounded(self):
+        """모든 파티션에 모아 둔 행은 max_buffered_rows를 넘지 않음"""
+        with ParquetSink(self.root, row_group_size=100, max_buffered_rows=10) as sink:
+            for board_id in ('free', 'secret', 'freshman'):
+                sink.write_posts(make_posts(8, board_id))
+                self.assertLessEqual(sum(len(rows) for rows in sink._buffers.values()), 10)
+
+        self.assertEqual(len(read_table(self.root)), 24)
+
+    def test_flush_interval_completes_files(self):
+        """flush_interval이 지나면 close() 전에도 기록한 행을 읽을 수 있음"""
+        sink = ParquetSink(self.root, flush_interval=0)
+        try:
+            sink.write_posts(make_posts(3))
+            self.assertEqual(len(read_table(self.root)), 3)
+            sink.write_posts(make_posts(2, 'secret'))
+            sink.write_posts(make_posts(1))
+            self.assertEqual(len(read_table(self.root)), 6)
+            self.assertEqual(len(sink.files), 3)
+        finally:
+            sink.close()
+
+    def test_close_closes_writers_on_error(self):
+        """남은 행 기록이 실패해도 열린 파일은 닫혀 기록된 row group은 읽을 수 있음"""
+        sink = ParquetSink(self.root, row_group_size=2)
+        sink.write_posts(make_posts(3))
+
+        with patch.object(sink, '_flush_key', side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                sink.close()
+
+        self.assertEqual(sink._writers, {})
+        self.assertEqual(len(read_table(self.root)), 2)
+
+    def test_column_pruning_and_filter(self):
+        """필요한 컬럼과 파티션만 읽음"""
+        with ParquetSink(self.root) as sink:
+            sink.write_posts(make_posts(3, 'free') + make_posts(2, 'secret'))
+
+        df = read_table(self.root, columns=['article_id'], filter=ds.field('board_id') == 'secret')
+        self.assertEqual(list(df.columns), ['article_id'])
+        self.assertEqual(len(df), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
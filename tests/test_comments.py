@@ -0,0 +1,138 @@
+"""
+댓글 트리 파서 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import time
+import unittest
+from bs4 import BeautifulSoup
+from everytime_crawler import EverytimeCrawler
+from everytime_crawler.comments import parse_comments
+
+LARGE_THREAD = os.path.join(os.path.dirname(__file__), 'fixtures', 'post_384508500.html')
+
+
+def comments_of(html):
+    return parse_comments(BeautifulSoup(html, 'lxml'))
+
+
+class TestCommentTree(unittest.TestCase):
+    """parse_comments 테스트"""
+
+    def test_flat_parent_child_list(self):
+        """class="child" 대댓글은 바로 앞 댓글에 연결"""
+        comments = comments_of("""
+            <ul class="comments">
+              <li id="comment-1" class="parent"><h3 class="small">익명1</h3><p class="large">첫 댓글</p><time>10:00</time></li>
+              <li id="comment-2" class="child"><h3 class="small">글쓴이</h3><p class="large">답글입니다</p><time>10:01</time></li>
+              <li id="comment-3" class="parent"><h3 class="small">익명2</h3><p class="large">두번째</p><time>10:02</time></li>
+            </ul>
+        """)
+
+        self.assertEqual(
+            [(c['comment_id'], c['parent_id'], c['depth']) for c in comments],
+            [(1, None, 0), (2, 1, 1), (3, None, 0)]
+        )
+        self.assertEqual(comments[1], {
+            'content': '답글입니다', 'author': '글쓴이', 'created_time': '10:01',
+            'comment_id': 2, 'parent_id': 1, 'depth': 1
+        })
+
+    def test_nested_replies(self):
+        """<li> 안에 중첩된 답글은 깊이를 계산하고 부모 내용에 섞이지 않음"""
+        comments = comments_of("""
+            <ul class="comments">
+              <li id="comment-10"><p class="large">부모 댓글</p>
+                <ul>
+                  <li id="comment-11"><p class="large">자식 댓글</p>
+                    <ul><li id="comment-12"><p class="large">손자 댓글</p></li></ul>
+                  </li>
+                </ul>
+              </li>
+            </ul>
+        """)
+
+        self.assertEqual(
+            [(c['content'], c['parent_id'], c['depth']) for c in comments],
+            [('부모 댓글', None, 0), ('자식 댓글', 10, 1), ('손자 댓글', 11, 2)]
+        )
+
+    def test_duplicate_ids_are_dropped(self):
+        comments = comments_of("""
+            <ul class="comments">
+              <li id="comment-5"><p class="large">같은 댓글</p></li>
+              <li id="comment-5"><p class="large">같은 댓글</p></li>
+            </ul>
+        """)
+        self.assertEqual(len(comments), 1)
+
+    def test_fallback_selector_does_not_double_count(self):
+        """[class*="comment"]가 감싸는 요소와 안쪽 요소를 모두 선택해도 한 번만 포함"""
+        comments = comments_of("""
+            <div class="comment-area">
+              <div class="comment-box" data-id="7"><p>첫 번째 댓글</p><span class="comment-time">10:00</span></div>
+              <div class="comment-box" data-id="8"><p>두 번째 댓글</p></div>
+            </div>
+        """)
+        self.assertEqual([c['comment_id'] for c in comments], [7, 8])
+
+    def test_fallback_flat_reply_links_parent(self):
+        """ul.comments가 없어도 class="reply" 대댓글은 바로 앞 댓글에 연결"""
+        comments = comments_of("""
+            <div class="comment" data-id="20"><p>첫 댓글</p></div>
+            <div class="comment reply" data-id="21"><p>답글</p></div>
+            <div class="comment" data-id="22"><p>두번째 댓글</p></div>
+            <div class="comment reply" data-id="23"><p>두번째 답글</p></div>
+        """)
+        self.assertEqual(
+            [(c['comment_id'], c['parent_id'], c['depth']) for c in comments],
+            [(20, None, 0), (21, 20, 1), (22, None, 0), (23, 22, 1)]
+        )
+
+
+class TestPostDetailParser(unittest.TestCase):
+    """_parse_post_detail 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.crawler = EverytimeCrawler()
+        with open(LARGE_THREAD, encoding='utf-8') as f:
+            self.html = f.read()
+
+    def test_large_thread(self):
+        """댓글 300개 이상 게시글: 본문, 댓글 수, 대댓글 연결"""
+        start = time.perf_counter()
+        detail = self.crawler._parse_post_detail(self.html, 'https://everytime.kr/387605/v/384508500')
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(detail['title'], '댓글 많은 게시글')
+        self.assertEqual(detail['content'], '댓글이 300개 넘게 달린 게시글입니다.')
+        self.assertEqual(detail['comment_count'], 311)
+
+        comments = detail['comments']
+        self.assertEqual(len({c['comment_id'] for c in comments}), 311)
+        self.assertEqual(sum(c['depth'] == 0 for c in comments), 125)
+
+        by_id = {c['comment_id']: c for c in comments}
+        for comment in comments:
+            if comment['depth'] == 1:
+                parent = by_id[comment['parent_id']]
+                self.assertEqual(parent['depth'], 0)
+                self.assertTrue(comment['content'].startswith(parent['content'].split('번')[0]))
+
+        print(f"\n⏱️ 댓글 {len(comments)}개 상세 페이지 파싱: {elapsed * 1000:.1f}ms")
+
+    def test_extract_comment_info(self):
+        """개별 댓글 노드 추출 (다시 파싱하지 않음)"""
+        item = BeautifulSoup(self.html, 'lxml').select_one('ul.comments li')
+        self.assertEqual(self.crawler._extract_comment_info(item), {
+            'content': '댓글 1번 내용입니다', 'author': '익명1', 'created_time': '07/01 10:00',
+            'comment_id': 3845085000001
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
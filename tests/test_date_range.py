@@ -0,0 +1,98 @@
+"""
+작성 시각 범위 크롤링 테스트 (페이지 번호 탐색)
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from everytime_crawler import EverytimeCrawler
+
+NEWEST = datetime(2025, 9, 1, 12, 0)
+POSTS_PER_PAGE = 20
+TOTAL_PAGES = 500
+
+
+def fake_page(page):
+    """글 20개씩, 글 사이 1시간 간격으로 최신 글부터 정렬된 가짜 목록 페이지"""
+    if page > TOTAL_PAGES:
+        return []
+    first = (page - 1) * POSTS_PER_PAGE
+    return [
+        {
+            'article_id': 10_000_000 - i,
+            'page': page,
+            'created_at': (NEWEST - timedelta(hours=i)).isoformat()
+        }
+        for i in range(first, first + POSTS_PER_PAGE)
+    ]
+
+
+class TestDateRangeCrawl(unittest.TestCase):
+    """get_board_posts(since=, until=) 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.crawler = EverytimeCrawler()
+        self.loaded_pages = []
+
+        def load(board_id, board_number, page, fetch_mode):
+            self.loaded_pages.append(page)
+            return fake_page(page)
+
+        patcher = patch.object(self.crawler, '_load_board_page', side_effect=load)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def expected_posts(self, since, until):
+        return [
+            post for page in range(1, TOTAL_PAGES + 1) for post in fake_page(page)
+            if since <= datetime.fromisoformat(post['created_at']) < until
+        ]
+
+    def test_range_matches_linear_scan(self):
+        """탐색 결과가 전체를 순서대로 훑은 결과와 같은지 확인"""
+        since, until = datetime(2025, 7, 1), datetime(2025, 7, 8)
+
+        posts = self.crawler.get_board_posts("free", pages=100, delay=0, fetch_mode="http",
+                                             since=since, until=until)
+
+        self.assertEqual(posts, self.expected_posts(since, until))
+        self.assertEqual(len(posts), 7 * 24)
+
+    def test_page_loads_are_logarithmic(self):
+        """범위 앞 페이지를 모두 읽지 않고 O(log N) + 범위 페이지 수만 로드"""
+        since, until = datetime(2025, 7, 1), datetime(2025, 7, 2)
+        posts = self.crawler.get_board_posts("free", pages=100, delay=0, fetch_mode="http",
+                                             since="2025-07-01T00:00:00", until=until)
+
+        range_pages = {p['page'] for p in posts}
+        self.assertGreater(min(range_pages), 70)
+        self.assertLess(len(self.loaded_pages), 2 * 10 + len(range_pages) + 2)
+        self.assertEqual(len(self.loaded_pages), len(set(self.loaded_pages)))
+        self.assertEqual(posts, self.expected_posts(since, until))
+
+    def test_until_in_first_page(self):
+        """최신 글이 범위 안이면 start_page부터 바로 수집"""
+        posts = self.crawler.get_board_posts("free", pages=100, delay=0, fetch_mode="http",
+                                             since=NEWEST - timedelta(hours=30))
+
+        self.assertEqual(len(posts), 31)
+        self.assertEqual(self.loaded_pages, [1, 2])
+
+    def test_range_before_oldest_post(self):
+        """게시판보다 오래된 범위는 빈 결과"""
+        posts = self.crawler.get_board_posts("free", pages=100, delay=0, fetch_mode="http",
+                                             since=datetime(2020, 1, 1), until=datetime(2020, 2, 1))
+        self.assertEqual(posts, [])
+
+    def test_incremental_not_allowed(self):
+        with self.assertRaises(ValueError):
+            self.crawler.get_board_posts("free", since=datetime(2025, 7, 1), incremental=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
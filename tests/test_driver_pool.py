@@ -0,0 +1,114 @@
+"""
+WebDriver 풀 테스트 (가짜 크롤러 사용)
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import threading
+import unittest
+from unittest.mock import Mock
+from everytime_crawler import DriverPool
+
+
+class FakeCrawler:
+    """setup_driver/login/close 호출을 기록하는 가짜 크롤러"""
+
+    instances = []
+
+    def __init__(self, login_ok=True):
+        self.driver = None
+        self.login_ok = login_ok
+        self.setup_count = 0
+        self.closed = 0
+        FakeCrawler.instances.append(self)
+
+    def setup_driver(self, headless=True):
+        self.setup_count += 1
+        self.driver = Mock()
+        self.driver.execute_script.return_value = 1
+        return self.driver
+
+    def login(self):
+        return self.login_ok
+
+    def close(self):
+        self.closed += 1
+
+
+class TestDriverPool(unittest.TestCase):
+    """DriverPool 테스트"""
+
+    def setUp(self):
+        FakeCrawler.instances = []
+
+    def test_start_creates_logged_in_drivers(self):
+        """풀 크기만큼 드라이버를 한 번만 생성"""
+        with DriverPool(size=3, crawler_factory=FakeCrawler) as pool:
+            for _ in range(6):
+                with pool.acquire() as crawler:
+                    self.assertIsNotNone(crawler.driver)
+
+        self.assertEqual(len(FakeCrawler.instances), 3)
+        self.assertTrue(all(c.setup_count == 1 for c in FakeCrawler.instances))
+        self.assertTrue(all(c.closed == 1 for c in FakeCrawler.instances))
+
+    def test_recycle_after_max_pages(self):
+        """K페이지 처리 후 드라이버 재생성"""
+        with DriverPool(size=1, max_pages_per_driver=3, crawler_factory=FakeCrawler) as pool:
+            with pool.acquire() as crawler:
+                for _ in range(7):
+                    pool.record_page(crawler)
+
+            self.assertEqual(pool.recycle_count, 2)
+            self.assertEqual(crawler.setup_count, 3)
+
+    def test_unhealthy_driver_recycled_on_acquire(self):
+        """응답 없는 드라이버는 빌려주기 전에 재생성"""
+        with DriverPool(size=1, crawler_factory=FakeCrawler) as pool:
+            with pool.acquire() as crawler:
+                crawler.driver.execute_script.side_effect = Exception("chrome not reachable")
+
+            with pool.acquire() as crawler:
+                self.assertEqual(crawler.driver.execute_script("return 1"), 1)
+                self.assertEqual(crawler.setup_count, 2)
+
+    def test_acquire_is_exclusive(self):
+        """같은 크롤러를 두 스레드가 동시에 빌리지 않음"""
+        in_use = set()
+        conflicts = []
+        lock = threading.Lock()
+
+        with DriverPool(size=2, crawler_factory=FakeCrawler) as pool:
+            def worker():
+                for _ in range(50):
+                    with pool.acquire() as crawler:
+                        with lock:
+                            if id(crawler) in in_use:
+                                conflicts.append(crawler)
+                            in_use.add(id(crawler))
+                        with lock:
+                            in_use.discard(id(crawler))
+
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        self.assertEqual(conflicts, [])
+
+    def test_login_failure_closes_started_drivers(self):
+        """로그인 실패 시 RuntimeError, 이미 만든 드라이버는 종료"""
+        results = iter([True, False])
+        pool = DriverPool(size=2, crawler_factory=lambda: FakeCrawler(login_ok=next(results)))
+
+        with self.assertRaises(RuntimeError):
+            pool.start()
+
+        self.assertTrue(all(c.closed >= 1 for c in FakeCrawler.instances))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+HTTP 게시판 목록 수집 테스트 (로컬 fixture 서버 사용)
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+from unittest.mock import Mock
+from everytime_crawler import EverytimeCrawler
+from fixture_server import FixtureServer
+
+
+class TestHttpBoardFetch(unittest.TestCase):
+    """fetch_mode='http' 게시판 수집 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FixtureServer().start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.server.requests_log.clear()
+        self.crawler = EverytimeCrawler()
+        self.crawler.base_url = self.server.base_url
+
+    def test_sync_session_cookies(self):
+        """WebDriver 쿠키가 requests 세션으로 복사되는지 확인"""
+        self.crawler.driver = Mock()
+        self.crawler.driver.get_cookies.return_value = [
+            {'name': 'etsid', 'value': 'abc123', 'domain': '127.0.0.1', 'path': '/'}
+        ]
+        self.crawler.driver.execute_script.return_value = 'TestAgent/1.0'
+
+        count = self.crawler.sync_session_cookies()
+
+        self.assertEqual(count, 1)
+        self.assertEqual(self.crawler.session.cookies.get('etsid'), 'abc123')
+
+        self.crawler.get_board_posts("free", pages=1, delay=0, fetch_mode="http")
+        self.assertIn('etsid=abc123', self.server.requests_log[0]['cookie'])
+        self.assertEqual(self.server.requests_log[0]['user_agent'], 'TestAgent/1.0')
+
+    def test_sync_session_cookies_without_driver(self):
+        """드라이버 없이 쿠키 복사 시 오류"""
+        with self.assertRaises(ValueError):
+            self.crawler.sync_session_cookies()
+
+    def test_http_board_posts(self):
+        """여러 페이지를 HTTP로 가져와 파싱"""
+        posts = self.crawler.get_board_posts("free", pages=3, delay=0, fetch_mode="http")
+
+        self.assertEqual(len(posts), 60)
+        self.assertEqual([p['page'] for p in posts[::20]], [1, 2, 3])
+
+        first = posts[0]
+        self.assertEqual(first['title'], '오늘 학식 메뉴 뭐임')
+        self.assertEqual(first['author'], '익명')
+        self.assertEqual(first['created_time'], '1분 전')
+        self.assertEqual(first['board_id'], 'free')
+        self.assertEqual(first['selector_used'], 'article.list')
+        self.assertEqual(first['post_link'], f"{self.server.base_url}/387605/v/384508600")
+
+        paths = [r['path'] for r in self.server.requests_log]
+        self.assertEqual(paths, ['/387605', '/387605?page=2', '/387605?page=3'])
+
+    def test_http_matches_element_parsing(self):
+        """HTML 경로와 WebElement 경로의 파싱 결과가 같은지 확인"""
+        from bs4 import BeautifulSoup
+
+        with open(os.path.join(os.path.dirname(__file__), 'fixtures', 'board_387605_page1.html'),
+                  encoding='utf-8') as f:
+            html = f.read()
+
+        element = Mock()
+        element.get_attribute.return_value = str(BeautifulSoup(html, 'html.parser').select_one('article.list'))
+
+        from_element = self.crawler._extract_single_post_info(element, 'article.list')
+        from_html = self.crawler._extract_posts_from_html(html, 'free', 1)[0]
+
+        for key, value in from_element.items():
+            self.assertEqual(from_html[key], value)
+
+    def test_missing_page_stops(self):
+        """없는 페이지(404)에서 수집 중단"""
+        posts = self.crawler.get_board_posts("free", pages=5, delay=0, fetch_mode="http")
+        self.assertEqual(len(posts), 60)
+
+    def test_invalid_fetch_mode(self):
+        """지원하지 않는 fetch_mode"""
+        with self.assertRaises(ValueError):
+            self.crawler.get_board_posts("free", fetch_mode="ftp")
+
+
+if __name__ == "__main__":
+    unittest.main()
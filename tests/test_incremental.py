@@ -0,0 +1,139 @@
+"""
+증분 게시판 크롤링 테스트 (로컬 fixture 서버 사용)
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import tempfile
+import unittest
+from everytime_crawler import EverytimeCrawler
+from everytime_crawler.crawl_state import CrawlCheckpoint, HighWaterMarks, extract_article_id, split_new_posts
+from fixture_server import FixtureServer
+
+
+class TestCrawlState(unittest.TestCase):
+    """글 번호 추출 / high-water mark 테스트"""
+
+    def test_extract_article_id(self):
+        """게시글 링크에서 글 번호 추출"""
+        self.assertEqual(extract_article_id("https://everytime.kr/387605/v/384508581"), 384508581)
+        self.assertEqual(extract_article_id("/387605/v/384508581"), 384508581)
+        self.assertIsNone(extract_article_id(None))
+        self.assertIsNone(extract_article_id("/387605"))
+
+    def test_split_new_posts(self):
+        """mark 이하 글은 제외하고 도달 여부 반환"""
+        posts = [{'article_id': 10}, {'article_id': 9}, {'article_id': None}, {'article_id': 8}]
+        self.assertEqual(split_new_posts(posts, None), (posts, False))
+
+        new_posts, reached = split_new_posts(posts, 9)
+        self.assertEqual(new_posts, [{'article_id': 10}, {'article_id': None}])
+        self.assertTrue(reached)
+
+    def test_marks_persist_and_only_increase(self):
+        """mark는 파일에 저장되고 줄어들지 않음"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'marks.json')
+            marks = HighWaterMarks(path)
+            self.assertEqual(marks.update('free', [{'article_id': 5}, {'article_id': 7}]), 7)
+            self.assertEqual(marks.update('free', [{'article_id': 6}]), 7)
+
+            self.assertEqual(HighWaterMarks(path).get('free'), 7)
+            self.assertIsNone(HighWaterMarks(path).get('secret'))
+
+
+class TestCrawlCheckpoint(unittest.TestCase):
+    """CrawlCheckpoint 테스트"""
+
+    def test_update_persists_per_board(self):
+        """게시판별 진행 상황이 파일에 누적 저장됨"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'checkpoint.json')
+            checkpoint = CrawlCheckpoint(path)
+            checkpoint.update('free', status='in_progress', last_page=3, output_offset=2070)
+            checkpoint.update('free', last_page=4)
+            checkpoint.update('secret', status='completed')
+
+            reloaded = CrawlCheckpoint(path)
+            self.assertEqual(
+                reloaded.get('free'),
+                {'status': 'in_progress', 'last_page': 4, 'output_offset': 2070}
+            )
+            self.assertEqual(set(reloaded.boards()), {'free', 'secret'})
+
+            reloaded.reset()
+            self.assertIsNone(CrawlCheckpoint(path).get('free'))
+
+    def test_get_returns_copy(self):
+        """get() 결과를 수정해도 저장된 상태는 바뀌지 않음"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint = CrawlCheckpoint(os.path.join(tmpdir, 'checkpoint.json'))
+            checkpoint.update('free', last_page=1)
+            checkpoint.get('free')['last_page'] = 99
+            self.assertEqual(checkpoint.get('free')['last_page'], 1)
+
+
+class TestIncrementalBoardPosts(unittest.TestCase):
+    """get_board_posts(incremental=True) 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FixtureServer().start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.server.requests_log.clear()
+        self.crawler = EverytimeCrawler()
+        self.crawler.base_url = self.server.base_url
+        self.crawler.high_water_marks = HighWaterMarks(os.path.join(self.tmpdir.name, 'marks.json'))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_posts_have_article_id(self):
+        """게시글 정보에 글 번호 포함"""
+        posts = self.crawler.get_board_posts("free", pages=1, delay=0, fetch_mode="http")
+        self.assertEqual(posts[0]['article_id'], 384508600)
+
+    def test_stops_at_high_water_mark(self):
+        """이미 수집한 글 번호에 도달하면 다음 페이지를 요청하지 않음"""
+        self.crawler.high_water_marks.update('free', [{'article_id': 384508575}])
+
+        posts = self.crawler.get_board_posts("free", pages=3, delay=0, fetch_mode="http", incremental=True)
+
+        self.assertEqual(len(posts), 25)
+        self.assertEqual(min(p['article_id'] for p in posts), 384508576)
+        self.assertEqual(len(self.server.requests_log), 2)
+        self.assertEqual(self.crawler.high_water_marks.get('free'), 384508600)
+
+        # 새 글이 없으면 첫 페이지만 확인
+        self.server.requests_log.clear()
+        posts = self.crawler.get_board_posts("free", pages=3, delay=0, fetch_mode="http", incremental=True)
+        self.assertEqual(posts, [])
+        self.assertEqual(len(self.server.requests_log), 1)
+
+    def test_mark_not_advanced_when_gap_remains(self):
+        """이전 mark에 도달하기 전에 끝나면 mark를 올리지 않음"""
+        self.crawler.high_water_marks.update('free', [{'article_id': 384508500}])
+
+        posts = self.crawler.get_board_posts("free", pages=2, delay=0, fetch_mode="http", incremental=True)
+
+        self.assertEqual(len(posts), 40)
+        self.assertEqual(self.crawler.high_water_marks.get('free'), 384508500)
+
+    def test_non_incremental_ignores_mark(self):
+        """incremental=False이면 mark와 관계없이 모든 페이지 수집"""
+        self.crawler.high_water_marks.update('free', [{'article_id': 384508600}])
+        posts = self.crawler.get_board_posts("free", pages=2, delay=0, fetch_mode="http")
+        self.assertEqual(len(posts), 40)
+
+
+if __name__ == "__main__":
+    unittest.main()
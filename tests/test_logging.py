@@ -0,0 +1,92 @@
+"""
+구조화 로깅 테스트 (로컬 fixture 서버 사용)
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import io
+import json
+import logging
+import unittest
+from everytime_crawler import EverytimeCrawler, configure_logging
+from everytime_crawler.log import get_logger, event
+from fixture_server import FixtureServer
+
+
+class TestStructuredLogging(unittest.TestCase):
+    """configure_logging / JSON 이벤트 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FixtureServer().start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.crawler = EverytimeCrawler()
+        self.crawler.base_url = self.server.base_url
+
+    def tearDown(self):
+        logger = get_logger()
+        for handler in list(logger.handlers):
+            if not isinstance(handler, logging.NullHandler):
+                logger.removeHandler(handler)
+        logger.setLevel(logging.NOTSET)
+        logger.propagate = True
+
+    def events(self):
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    def test_page_events_as_json_lines(self):
+        """페이지마다 board/page/posts/elapsed_ms 필드가 있는 page_done 이벤트"""
+        configure_logging('INFO', json_output=True, stream=self.stream)
+
+        self.crawler.get_board_posts("free", pages=2, delay=0, fetch_mode="http")
+
+        events = self.events()
+        pages = [e for e in events if e['event'] == 'page_done']
+        self.assertEqual([e['page'] for e in pages], [1, 2])
+        for e in pages:
+            self.assertEqual(e['board'], 'free')
+            self.assertEqual(e['posts'], 20)
+            self.assertGreaterEqual(e['elapsed_ms'], 0)
+            self.assertEqual(e['message'], f"✅ 페이지 {e['page']}에서 20개 게시글 수집")
+        self.assertEqual(events[-1]['event'], 'board_done')
+        self.assertEqual(events[-1]['posts'], 40)
+
+    def test_disabled_level_skips_formatting(self):
+        """레벨이 꺼져 있으면 메시지 인자를 문자열로 만들지 않음"""
+        configure_logging('WARNING', stream=self.stream)
+
+        class Counting:
+            calls = 0
+
+            def __str__(self):
+                Counting.calls += 1
+                return 'x'
+
+        get_logger('test').info("%s", Counting(), extra=event('noop'))
+        self.crawler.get_board_posts("free", pages=1, delay=0, fetch_mode="http")
+
+        self.assertEqual(Counting.calls, 0)
+        self.assertEqual(self.stream.getvalue(), '')
+
+    def test_plain_console_output(self):
+        """기본 콘솔 출력은 메시지만 (기존 print와 같은 모양)"""
+        configure_logging('INFO', json_output=False, stream=self.stream)
+        configure_logging('INFO', json_output=False, stream=self.stream)  # 핸들러 중복 없음
+
+        self.crawler.get_board_posts("free", pages=1, delay=0, fetch_mode="http")
+
+        lines = self.stream.getvalue().splitlines()
+        self.assertIn("✅ 페이지 1에서 20개 게시글 수집", lines)
+        self.assertEqual(lines.count("✅ 페이지 1에서 20개 게시글 수집"), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+단계별 메트릭 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import json
+import tempfile
+import unittest
+import urllib.request
+from everytime_crawler import EverytimeCrawler, Metrics
+from everytime_crawler.board_crawler import BoardCrawler
+from fixture_server import FixtureServer
+from fake_driver import FakeDriver
+
+
+class TestMetrics(unittest.TestCase):
+    """Metrics 기록/내보내기 테스트"""
+
+    def test_disabled_records_nothing(self):
+        """비활성화 상태에서는 아무것도 기록하지 않음"""
+        metrics = Metrics(enabled=False)
+        with metrics.stage('parse'):
+            pass
+        metrics.observe('wait', 1.0)
+        metrics.inc('posts', 20)
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot['stages'], {})
+        self.assertEqual(snapshot['counters']['posts'], 0)
+
+    def test_histogram_and_counters(self):
+        """단계 시간은 누적 버킷으로, 카운터는 합계로 기록"""
+        metrics = Metrics(buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.5, 2.0):
+            metrics.observe('navigation', seconds)
+        metrics.inc('posts', 20)
+        metrics.inc('errors')
+
+        stats = metrics.snapshot()['stages']['navigation']
+        self.assertEqual(stats['count'], 3)
+        self.assertAlmostEqual(stats['sum'], 2.55)
+        self.assertEqual(stats['max'], 2.0)
+        self.assertEqual(stats['buckets'], {'0.1': 1, '1.0': 2, '+Inf': 3})
+
+        text = metrics.to_prometheus()
+        self.assertIn('everytime_stage_seconds_bucket{stage="navigation",le="1.0"} 2', text)
+        self.assertIn('everytime_stage_seconds_count{stage="navigation"} 3', text)
+        self.assertIn('everytime_posts_total 20', text)
+        self.assertIn('everytime_errors_total 1', text)
+
+    def test_json_snapshot_and_http_endpoint(self):
+        """JSON 스냅샷 파일과 /metrics HTTP 엔드포인트"""
+        metrics = Metrics()
+        metrics.inc('comments', 3)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'metrics.json')
+            metrics.start_snapshots(path, interval=60)
+            metrics.stop_snapshots()  # 종료 시 마지막 스냅샷 저장
+            with open(path, encoding='utf-8') as f:
+                self.assertEqual(json.load(f)['counters']['comments'], 3)
+
+        server = metrics.serve(port=0)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url) as response:
+                self.assertIn('everytime_comments_total 3', response.read().decode('utf-8'))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestCrawlerMetrics(unittest.TestCase):
+    """크롤러 핫 패스 계측 테스트 (로컬 fixture 서버 사용)"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FixtureServer().start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def test_http_board_pages_recorded_per_stage(self):
+        crawler = EverytimeCrawler()
+        crawler.base_url = self.server.base_url
+        crawler.metrics = Metrics()
+
+        posts = crawler.get_board_posts("free", pages=3, delay=0, fetch_mode="http")
+        with tempfile.TemporaryDirectory() as tmp:
+            crawler.save_board_posts_to_json(posts, os.path.join(tmp, 'posts.jsonl'))
+
+        snapshot = crawler.metrics.snapshot()
+        self.assertEqual(snapshot['counters']['posts'], len(posts))
+        for stage, count in [('throttle', 3), ('navigation', 3), ('parse', 3), ('persist', 1)]:
+            self.assertEqual(snapshot['stages'][stage]['count'], count, stage)
+
+    def test_driver_page_source_recorded_as_parse(self):
+        """driver 모드에서 page_source 읽기는 navigation이 아니라 parse로 기록"""
+        crawler = EverytimeCrawler()
+        crawler.metrics = Metrics()
+        crawler.driver = FakeDriver({'/387605': 'board_387605_page1.html'})
+
+        posts = crawler.get_board_posts("free", pages=1, delay=0)
+
+        stages = crawler.metrics.snapshot()['stages']
+        self.assertEqual(len(posts), 20)
+        self.assertEqual(stages['navigation']['count'], 1)
+        self.assertEqual(stages['parse']['count'], 1)
+
+    def test_board_crawler_parse_once_per_page(self):
+        """BoardCrawler도 목록 페이지와 상세 페이지마다 parse를 한 번만 기록"""
+        crawler = EverytimeCrawler()
+        crawler.metrics = Metrics()
+        crawler.driver = FakeDriver({'/free': 'board_387605_page1.html',
+                                     '/387605/v/384508500': 'post_384508500.html'})
+        board = BoardCrawler(crawler)
+
+        posts = board.get_board_posts("free", pages=1, delay=0)
+        self.assertEqual(len(posts), 20)
+        self.assertEqual(crawler.metrics.snapshot()['stages']['parse']['count'], 1)
+
+        self.assertIsNotNone(board.get_post_detail('https://everytime.kr/387605/v/384508500'))
+        self.assertEqual(crawler.metrics.snapshot()['stages']['parse']['count'], 2)
+
+    def test_metrics_disabled_by_default(self):
+        os.environ.pop('EVERYTIME_METRICS', None)
+        self.assertFalse(EverytimeCrawler().metrics.enabled)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+게시판 목록 페이지 캐시 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+from unittest.mock import patch
+from everytime_crawler import EverytimeCrawler
+from everytime_crawler.page_cache import PageCache, split_article_blocks
+from fixture_server import FixtureServer
+
+PAGE_URL = 'https://everytime.kr/387605'
+VOLATILE_KEYS = ('collected_at', 'created_at')
+
+
+def load_fixture(name='board_387605_page1.html'):
+    with open(os.path.join(os.path.dirname(__file__), 'fixtures', name), encoding='utf-8') as f:
+        return f.read()
+
+
+def strip_volatile(posts):
+    return [{k: v for k, v in p.items() if k not in VOLATILE_KEYS} for p in posts]
+
+
+class TestPageCache(unittest.TestCase):
+    """PageCache / _extract_posts_cached 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.crawler = EverytimeCrawler()
+        self.cache = self.crawler.page_cache
+        self.html = load_fixture()
+
+    def extract(self, html):
+        return self.crawler._extract_posts_cached(PAGE_URL, html, 'free', 1)
+
+    def test_same_result_as_full_parse(self):
+        """블록 단위 파싱 결과가 전체 페이지 파싱과 같은지 확인"""
+        cached = self.extract(self.html)
+        full = self.crawler._extract_posts_from_html(self.html, 'free', 1)
+
+        self.assertEqual(len(cached), 20)
+        self.assertEqual(strip_volatile(cached), strip_volatile(full))
+        self.assertTrue(all(p['created_at'] for p in cached))
+
+    def test_unchanged_page_skips_parsing(self):
+        """같은 HTML이면 파싱 없이 이전 결과 반환"""
+        first = self.extract(self.html)
+
+        with patch.object(self.crawler, '_parse_post_blocks') as parse_blocks, \
+                patch.object(self.crawler, '_extract_posts_from_html') as parse_page:
+            second = self.extract(self.html)
+            parse_blocks.assert_not_called()
+            parse_page.assert_not_called()
+
+        self.assertEqual(second, first)
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+        # 반환값을 수정해도 캐시에는 영향 없음
+        second[0]['title'] = '변경'
+        self.assertEqual(self.extract(self.html)[0]['title'], first[0]['title'])
+
+    def test_partial_change_parses_only_new_blocks(self):
+        """새 글이 올라오면 새 블록만 파싱"""
+        self.extract(self.html)
+
+        blocks = split_article_blocks(self.html)
+        new_block = blocks[0].replace('384508600', '384508601').replace('오늘 학식 메뉴 뭐임', '새 글')
+        updated = self.html.replace(blocks[0], new_block + '\n      ' + blocks[0], 1)
+
+        posts = self.extract(updated)
+
+        stats = self.cache.stats()
+        self.assertEqual(stats['partial_hits'], 1)
+        self.assertEqual(stats['blocks_parsed'], 20 + 1)
+        self.assertEqual(stats['blocks_reused'], 19)
+        self.assertEqual(posts[0]['title'], '새 글')
+        self.assertEqual(posts[0]['article_id'], 384508601)
+        self.assertEqual(len(posts), 20)
+        self.assertEqual(strip_volatile(posts), strip_volatile(
+            self.crawler._extract_posts_from_html(updated, 'free', 1)))
+
+    def test_non_article_layout_falls_back(self):
+        """article.list 블록이 없으면 셀렉터 탐색으로 전체 파싱"""
+        html = self.html.replace('<article class="list">', '<div class="board-item">').replace('</article>', '</div>')
+
+        posts = self.extract(html)
+
+        self.assertTrue(posts)
+        self.assertNotEqual(posts[0]['selector_used'], 'article.list')
+        self.assertEqual(self.cache.stats()['misses'], 1)
+
+    def test_lru_eviction(self):
+        cache = PageCache(max_pages=2)
+        parse = lambda blocks: [{'n': i} for i in range(len(blocks))]
+        for url in ('a', 'b', 'c'):
+            cache.extract(url, self.html, parse, lambda: [])
+        cache.extract('a', self.html, parse, lambda: [])
+        self.assertEqual(cache.stats()['hits'], 0)
+        cache.extract('c', self.html, parse, lambda: [])
+        self.assertEqual(cache.stats()['hits'], 1)
+
+    def test_disabled(self):
+        self.crawler.page_cache = None
+        self.assertEqual(len(self.extract(self.html)), 20)
+
+
+class TestPageCacheHttp(unittest.TestCase):
+    """HTTP 모드 반복 수집 시 캐시 적중 확인"""
+
+    def test_repeated_poll_hits_cache(self):
+        with FixtureServer() as server:
+            crawler = EverytimeCrawler()
+            crawler.base_url = server.base_url
+
+            first = crawler.get_board_posts("free", pages=3, delay=0, fetch_mode="http")
+            second = crawler.get_board_posts("free", pages=3, delay=0, fetch_mode="http")
+
+        self.assertEqual(second, first)
+        stats = crawler.page_cache.stats()
+        self.assertEqual((stats['misses'], stats['hits']), (3, 3))
+        self.assertEqual(stats['block_reuse_ratio'], 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
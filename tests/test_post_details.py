@@ -0,0 +1,127 @@
+"""
+게시글 상세 정보 동시 수집 테스트 (로컬 fixture 서버 사용)
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import time
+import asyncio
+import unittest
+from everytime_crawler import EverytimeCrawler, RateLimiter
+from fixture_server import FixtureServer
+
+
+class TestRateLimiter(unittest.TestCase):
+    """토큰 버킷 속도 제한 테스트"""
+
+    def test_unlimited(self):
+        """rate가 없으면 대기하지 않음"""
+        limiter = RateLimiter(None)
+        self.assertEqual(sum(limiter.acquire() for _ in range(100)), 0)
+
+    def test_rate_spacing(self):
+        """버스트 이후 요청은 1/rate 간격으로 허용"""
+        limiter = RateLimiter(50, burst=1)
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 5 / 50 * 0.9)
+
+    def test_async_acquire(self):
+        """비동기 대기도 같은 버킷을 사용"""
+        limiter = RateLimiter(50, burst=2)
+
+        async def run():
+            return [await limiter.acquire_async() for _ in range(4)]
+
+        waits = asyncio.run(run())
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        self.assertGreater(waits[2], 0)
+
+
+class TestFetchPostDetails(unittest.TestCase):
+    """fetch_post_details / iter_post_details 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FixtureServer().start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.crawler = EverytimeCrawler()
+        self.crawler.base_url = self.server.base_url
+        self.urls = [f"{self.server.base_url}/387605/v/{aid}" for aid in range(384508600, 384508595, -1)]
+
+    def test_fetch_post_details_shape(self):
+        """get_post_detail과 같은 형태, 입력 순서 유지"""
+        details = self.crawler.fetch_post_details(self.urls, concurrency=3, rate=None)
+
+        self.assertEqual([d['url'] for d in details], self.urls)
+        for idx, detail in enumerate(details):
+            self.assertEqual(
+                set(detail.keys()),
+                {'url', 'title', 'content', 'comments', 'comment_count', 'collected_at'}
+            )
+            self.assertEqual(detail['title'], f"테스트 게시글 {idx + 1}")
+            self.assertEqual(detail['comment_count'], idx + 1)
+            self.assertEqual(detail['comments'][0]['author'], '익명1')
+
+    def test_matches_sequential_parser(self):
+        """동시 수집 결과가 상세 페이지 파서 결과와 같은지 확인"""
+        import requests
+
+        detail = self.crawler.fetch_post_details(self.urls[:1], rate=None)[0]
+        expected = self.crawler._parse_post_detail(requests.get(self.urls[0]).text, self.urls[0])
+
+        for key in ('title', 'content', 'comments', 'comment_count'):
+            self.assertEqual(detail[key], expected[key])
+
+    def test_failed_urls_are_skipped(self):
+        """404 게시글은 결과에서 제외"""
+        urls = self.urls[:2] + [f"{self.server.base_url}/387605/v/1"]
+        details = self.crawler.fetch_post_details(urls, concurrency=2, rate=None)
+        self.assertEqual([d['url'] for d in details], self.urls[:2])
+
+    def test_rate_limit_applied(self):
+        """rate 제한이 전체 소요 시간에 반영되는지 확인"""
+        start = time.monotonic()
+        self.crawler.fetch_post_details(self.urls, concurrency=5, rate=20)
+        self.assertGreaterEqual(time.monotonic() - start, 4 / 20 * 0.9)
+
+    def test_iter_post_details_yields_all(self):
+        """비동기 제너레이터가 모든 결과를 yield"""
+        async def collect():
+            return [d async for d in self.crawler.iter_post_details(self.urls, concurrency=2, rate=None)]
+
+        details = asyncio.run(collect())
+        self.assertEqual(sorted(d['url'] for d in details), sorted(self.urls))
+
+    def test_reuses_adapter_and_loop(self):
+        """호출마다 어댑터를 다시 mount하거나 새 이벤트 루프를 만들지 않음"""
+        adapter = self.crawler.session.get_adapter(self.urls[0])
+        self.crawler.fetch_post_details(self.urls[:2], rate=None)
+        loop = self.crawler._detail_loop
+        self.crawler.fetch_post_details(self.urls[2:], rate=None)
+
+        self.assertIs(self.crawler.session.get_adapter(self.urls[0]), adapter)
+        self.assertIs(self.crawler._detail_loop, loop)
+        self.crawler.close()
+        self.assertTrue(loop.is_closed())
+
+    def test_running_loop_points_to_async_api(self):
+        """이벤트 루프 안에서 fetch_post_details를 부르면 iter_post_details를 안내"""
+        async def call():
+            self.crawler.fetch_post_details(self.urls[:1], rate=None)
+
+        with self.assertRaisesRegex(RuntimeError, 'iter_post_details'):
+            asyncio.run(call())
+
+
+if __name__ == "__main__":
+    unittest.main()
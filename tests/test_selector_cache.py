@@ -0,0 +1,95 @@
+"""
+셀렉터 캐시 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+from everytime_crawler import EverytimeCrawler
+from everytime_crawler.selector_cache import SelectorCache
+from fake_driver import FakeDriver
+
+
+def board_item_page(count, css_class="board-item"):
+    items = ''.join(
+        f'<div class="{css_class}"><a href="/387605/v/{1000 + i}"><h2 class="medium bold">제목 {i}</h2></a></div>'
+        for i in range(count)
+    )
+    return f"<html><body>{items}</body></html>"
+
+
+TIMETABLE_COURSE_PAGE = """<html><body><div class="tablebody">
+<div class="course" style="height: 90px; top: 540px;"><h3>자료구조</h3><p><em>김교수</em><span>공학관 301</span></p></div>
+<div class="course" style="height: 60px; top: 600px;"><h3>운영체제</h3><p><em>이교수</em><span>공학관 302</span></p></div>
+</div></body></html>"""
+
+
+class TestSelectorCache(unittest.TestCase):
+    """SelectorCache 단위 테스트"""
+
+    def test_reuses_winner_and_reprobes_on_empty(self):
+        cache = SelectorCache()
+        calls = []
+        layout = {'.b': [1, 2]}
+
+        def query(selector):
+            calls.append(selector)
+            return layout.get(selector, [])
+
+        self.assertEqual(cache.find('k', ['.a', '.b', '.c'], query), ('.b', [1, 2]))
+        self.assertEqual(calls, ['.a', '.b'])
+
+        calls.clear()
+        self.assertEqual(cache.find('k', ['.a', '.b', '.c'], query), ('.b', [1, 2]))
+        self.assertEqual(calls, ['.b'])
+
+        # 레이아웃이 바뀌면 기억한 셀렉터를 빼고 다시 탐색
+        layout = {'.c': [3]}
+        calls.clear()
+        self.assertEqual(cache.find('k', ['.a', '.b', '.c'], query), ('.c', [3]))
+        self.assertEqual(calls, ['.b', '.a', '.c'])
+        self.assertEqual(cache.get('k'), '.c')
+
+        layout = {}
+        self.assertEqual(cache.find('k', ['.a', '.b', '.c'], query), (None, []))
+        self.assertIsNone(cache.get('k'))
+        self.assertEqual((cache.hits, cache.probes), (1, 3))
+
+
+class TestCrawlerSelectorCache(unittest.TestCase):
+    """크롤러 목록/시간표 파싱에서 셀렉터 캐시 사용"""
+
+    def setUp(self):
+        self.crawler = EverytimeCrawler()
+
+    def test_fallback_list_layout_probed_once_per_board(self):
+        html = board_item_page(5)
+
+        posts = self.crawler._extract_posts_from_html(html, 'free', 1)
+        first_queries = self.crawler.selector_cache.queries
+        again = self.crawler._extract_posts_from_html(html, 'free', 2)
+
+        self.assertEqual(len(posts), 5)
+        self.assertEqual(len(again), 5)
+        self.assertEqual(posts[0]['selector_used'], '.board-item')
+        self.assertEqual(first_queries, self.crawler.POST_SELECTORS.index('.board-item') + 1)
+        self.assertEqual(self.crawler.selector_cache.queries - first_queries, 1)
+        self.assertEqual(self.crawler.selector_cache.get(('posts', 'free')), '.board-item')
+
+    def test_timetable_selector_cached_between_calls(self):
+        self.crawler.driver = FakeDriver({'/timetable': TIMETABLE_COURSE_PAGE})
+
+        first = self.crawler.get_timetable(save_to_file=False)
+        probes = self.crawler.selector_cache.queries
+        second = self.crawler.get_timetable(save_to_file=False)
+
+        self.assertEqual([s['subject_name'] for s in first], ['자료구조', '운영체제'])
+        self.assertEqual([s['subject_name'] for s in second], ['자료구조', '운영체제'])
+        self.assertEqual(probes, 2)  # .subject 실패 후 .course
+        self.assertEqual(self.crawler.selector_cache.queries - probes, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
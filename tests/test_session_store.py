@@ -0,0 +1,138 @@
+"""
+로그인 세션 저장/복원 테스트 (로컬 fixture 서버 사용)
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import stat
+import time
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+from everytime_crawler import EverytimeCrawler, SessionStore
+from fixture_server import FixtureServer
+from fake_driver import FakeDriver
+
+COOKIES = [{'name': 'etsid', 'value': 'abc123', 'domain': '127.0.0.1', 'path': '/'}]
+
+
+class TestSessionStore(unittest.TestCase):
+    """SessionStore 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'nested', 'session.json')
+        self.store = SessionStore(self.path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_save_and_load(self):
+        """저장한 쿠키를 그대로 로드하고 파일 권한은 0600"""
+        self.store.save(COOKIES, user_id='tester', user_agent='TestAgent/1.0')
+
+        saved = self.store.load(user_id='tester')
+        self.assertEqual(saved['cookies'], COOKIES)
+        self.assertEqual(saved['user_agent'], 'TestAgent/1.0')
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+
+    def test_other_account_or_expired(self):
+        """다른 계정이나 만료된 세션은 로드하지 않음"""
+        self.store.save(COOKIES, user_id='tester')
+        self.assertIsNone(self.store.load(user_id='someone'))
+
+        self.store.max_age = 1
+        with patch('everytime_crawler.session_store.time.time', return_value=time.time() + 10):
+            self.assertIsNone(self.store.load(user_id='tester'))
+
+    def test_missing_file(self):
+        """파일이 없으면 None, clear는 오류 없이 통과"""
+        self.assertIsNone(self.store.load())
+        self.store.clear()
+
+
+class TestRestoreSession(unittest.TestCase):
+    """EverytimeCrawler.restore_session / login 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FixtureServer(require_cookie='etsid=abc123').start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.crawler = EverytimeCrawler(session_file=os.path.join(self.tmpdir.name, 'session.json'))
+        self.crawler.base_url = self.server.base_url
+        self.crawler.user_id = 'tester'
+        self.crawler.password = 'secret'
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_login_uses_saved_session(self):
+        """유효한 쿠키가 있으면 브라우저 없이 1초 안에 로그인"""
+        self.crawler.session_store.save(COOKIES, user_id='tester')
+
+        with patch.object(self.crawler, 'setup_driver') as setup_driver:
+            start = time.monotonic()
+            self.assertTrue(self.crawler.login())
+            self.assertLess(time.monotonic() - start, 1)
+
+        setup_driver.assert_not_called()
+        posts = self.crawler.get_board_posts("free", pages=1, delay=0, fetch_mode="http")
+        self.assertEqual(len(posts), 20)
+
+    def test_expired_session_is_cleared(self):
+        """확인 요청이 로그인 페이지로 리다이렉트되면 실패하고 파일 삭제"""
+        self.crawler.session_store.save(
+            [{'name': 'etsid', 'value': 'expired', 'domain': '127.0.0.1', 'path': '/'}],
+            user_id='tester'
+        )
+
+        self.assertFalse(self.crawler.restore_session())
+        self.assertIsNone(self.crawler.session_store.load())
+        self.assertEqual(len(self.crawler.session.cookies), 0)
+
+    def test_cookies_loaded_into_driver(self):
+        """드라이버가 있으면 같은 쿠키를 드라이버에도 설정"""
+        self.crawler.session_store.save(COOKIES, user_id='tester')
+        self.crawler.driver = Mock()
+
+        self.assertTrue(self.crawler.restore_session())
+        self.crawler.driver.get.assert_called_once_with(self.server.base_url)
+        self.crawler.driver.add_cookie.assert_called_once_with(COOKIES[0])
+
+    def test_restored_session_sets_up_driver(self):
+        """드라이버 없이 복원한 뒤 드라이버 작업을 호출하면 드라이버를 띄우고 쿠키를 넣음"""
+        self.crawler.session_store.save(COOKIES, user_id='tester')
+        driver = FakeDriver({'/timetable': 'timetable.html'}, base_url=self.server.base_url)
+
+        with patch.object(self.crawler, 'setup_driver',
+                          side_effect=lambda: setattr(self.crawler, 'driver', driver)) as setup_driver:
+            self.assertTrue(self.crawler.login())
+            setup_driver.assert_not_called()
+
+            subjects = self.crawler.get_timetable(save_to_file=False)
+            self.crawler.get_timetable(save_to_file=False)
+
+        setup_driver.assert_called_once_with()
+        self.assertEqual(len(subjects), 12)
+        self.assertEqual(driver.cookies, COOKIES)
+
+    def test_without_store(self):
+        """저장소가 없으면 복원하지 않음"""
+        with patch.dict(os.environ, {'EVERYTIME_SESSION_FILE': ''}):
+            crawler = EverytimeCrawler()
+        self.assertIsNone(crawler.session_store)
+        self.assertFalse(crawler.restore_session())
+
+
+if __name__ == "__main__":
+    unittest.main()
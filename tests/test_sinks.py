@@ -0,0 +1,98 @@
+"""
+JSON Lines 스트리밍 저장 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+from everytime_crawler import EverytimeCrawler
+from everytime_crawler.sinks import JsonlWriter, iter_jsonl
+
+
+class TestJsonlWriter(unittest.TestCase):
+    """JsonlWriter / iter_jsonl 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'posts.jsonl')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_one_compact_line_per_record(self):
+        """레코드마다 한 줄, 들여쓰기 없이 기록"""
+        posts = [{'title': f'글 {i}', 'article_id': i} for i in range(3)]
+        with JsonlWriter(self.path) as writer:
+            writer.write_many(posts[:2])
+            writer.write(posts[2])
+
+        with open(self.path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[0], '{"title":"글 0","article_id":0}')
+        self.assertEqual(list(iter_jsonl(self.path)), posts)
+        self.assertEqual(writer.count, 3)
+
+    def test_visible_before_close(self):
+        """기록 직후(닫기 전에도) 파일에서 읽을 수 있음"""
+        writer = JsonlWriter(self.path)
+        writer.write({'n': 1})
+        self.assertEqual(list(iter_jsonl(self.path)), [{'n': 1}])
+        self.assertEqual(writer.offset, os.path.getsize(self.path))
+        writer.close()
+
+    def test_periodic_fsync(self):
+        """fsync_every개마다 fsync"""
+        with patch('everytime_crawler.sinks.os.fsync') as fsync:
+            writer = JsonlWriter(self.path, fsync_every=10, fsync_interval=3600)
+            for i in range(25):
+                writer.write({'n': i})
+            self.assertEqual(fsync.call_count, 2)
+            writer.close()
+            self.assertEqual(fsync.call_count, 3)
+
+    def test_append_and_lazy_open(self):
+        """기록이 없으면 파일을 만들지 않고, 'a' 모드는 이어 씀"""
+        with JsonlWriter(self.path):
+            pass
+        self.assertFalse(os.path.exists(self.path))
+
+        for n in range(2):
+            with JsonlWriter(self.path) as writer:
+                writer.write({'n': n})
+        self.assertEqual([r['n'] for r in iter_jsonl(self.path)], [0, 1])
+
+    def test_truncated_last_line_skipped(self):
+        """비정상 종료로 잘린 마지막 줄은 건너뜀"""
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('{"n":1}\n{"n":2}\n{"n":')
+        self.assertEqual(list(iter_jsonl(self.path)), [{'n': 1}, {'n': 2}])
+
+
+class TestSaveBoardPostsToJsonl(unittest.TestCase):
+    """save_board_posts_to_json JSON Lines 저장 테스트"""
+
+    def test_jsonl_and_legacy_json(self):
+        """.jsonl은 줄 단위, .json은 기존 배열 형식"""
+        crawler = EverytimeCrawler()
+        posts = [{'title': '테스트', 'board_id': 'free'}, {'title': '테스트2', 'board_id': 'free'}]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            jsonl_path = os.path.join(tmpdir, 'posts.jsonl')
+            crawler.save_board_posts_to_json(posts, jsonl_path)
+            crawler.save_board_posts_to_json(posts[:1], jsonl_path, append=True)
+            self.assertEqual(len(list(iter_jsonl(jsonl_path))), 3)
+
+            json_path = os.path.join(tmpdir, 'posts.json')
+            crawler.save_board_posts_to_json(posts, json_path)
+            with open(json_path, encoding='utf-8') as f:
+                self.assertEqual(json.load(f), posts)
+
+
+if __name__ == "__main__":
+    unittest.main()
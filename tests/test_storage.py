@@ -0,0 +1,151 @@
+"""
+SQLite 저장소 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import sqlite3
+import tempfile
+import unittest
+from everytime_crawler import SQLiteStore
+
+
+def make_post(article_id, comment_count='0', board_id='free', title=None):
+    return {
+        'title': title or f'글 {article_id}',
+        'content': '미리보기',
+        'author': '익명',
+        'created_time': '07/02 10:00',
+        'comment_count': comment_count,
+        'view_count': None,
+        'post_link': f'https://everytime.kr/387605/v/{article_id}',
+        'article_id': article_id,
+        'board_id': board_id,
+        'page': 1,
+        'collected_at': '2025-07-02T10:00:00'
+    }
+
+
+class TestSQLiteStore(unittest.TestCase):
+    """SQLiteStore 테스트"""
+
+    def setUp(self):
+        """테스트 셋업"""
+        self.store = SQLiteStore(':memory:')
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_upsert_deduplicates_by_article_id(self):
+        """같은 글을 다시 저장하면 새 행이 아니라 기존 행을 갱신"""
+        self.store.upsert_posts([make_post(1), make_post(2)])
+        self.store.upsert_posts([make_post(2, comment_count='7', title='수정된 제목'), make_post(3)])
+
+        self.assertEqual(self.store.count_posts(), 3)
+        row = self.store.query("SELECT * FROM posts WHERE article_id = 2").iloc[0]
+        self.assertEqual(row['comment_count'], 7)
+        self.assertEqual(row['title'], '수정된 제목')
+        self.assertEqual(row['first_seen_at'], '2025-07-02T10:00:00')
+
+    def test_posts_without_article_id_skipped(self):
+        """글 번호를 알 수 없는 게시글은 저장하지 않음"""
+        post = make_post(1)
+        post.update({'article_id': None, 'post_link': None})
+        self.assertEqual(self.store.upsert_posts([post]), 0)
+
+    def test_post_detail_comments(self):
+        """상세 정보 저장 시 본문을 채우고 댓글을 교체"""
+        self.store.upsert_posts([make_post(5)])
+        detail = {
+            'url': 'https://everytime.kr/387605/v/5',
+            'title': '글 5',
+            'content': '전체 본문',
+            'comments': [{'author': '익명1', 'content': '첫 댓글', 'created_time': '10:01'},
+                         {'author': '익명2', 'content': '두번째', 'created_time': '10:02'}],
+            'collected_at': '2025-07-02T11:00:00'
+        }
+        self.assertEqual(self.store.save_post_detail(detail), 2)
+        detail['comments'] = detail['comments'][:1]
+        self.store.save_post_detail(detail)
+
+        comments = self.store.get_comments(5)
+        self.assertEqual(list(comments['content']), ['첫 댓글'])
+
+        # 목록에서 다시 upsert 해도 상세 본문은 유지
+        self.store.upsert_posts([make_post(5)])
+        row = self.store.query("SELECT full_content, comment_count FROM posts WHERE article_id = 5").iloc[0]
+        self.assertEqual(row['full_content'], '전체 본문')
+
+    def test_comments_upsert_on_comment_id(self):
+        """댓글은 comment_id로 갱신하고 중간에 추가된 대댓글과 삭제된 댓글을 반영"""
+        def comment(comment_id, content, parent_id=None):
+            return {'comment_id': comment_id, 'parent_id': parent_id, 'depth': int(parent_id is not None),
+                    'author': '익명', 'content': content, 'created_time': '10:01'}
+
+        detail = {'url': 'https://everytime.kr/387605/v/5', 'content': '본문',
+                  'comments': [comment(100, '첫 댓글'), comment(200, '삭제될 댓글'), comment(300, '세번째')],
+                  'collected_at': '2025-07-02T11:00:00'}
+        self.store.save_post_detail(detail, board_id='free')
+
+        detail['comments'] = [comment(100, '첫 댓글 (수정)'), comment(101, '대댓글', parent_id=100),
+                              comment(300, '세번째')]
+        self.store.save_post_detail(detail, board_id='free')
+
+        comments = self.store.get_comments(5)
+        self.assertEqual(list(comments['comment_id']), [100, 101, 300])
+        self.assertEqual(list(comments['comment_index']), [0, 1, 2])
+        self.assertEqual(comments.iloc[0]['content'], '첫 댓글 (수정)')
+        self.assertEqual((comments.iloc[1]['parent_id'], comments.iloc[1]['depth']), (100, 1))
+
+    def test_migrates_old_comments_table(self):
+        """comment_id/parent_id/depth가 없는 예전 DB를 열면 컬럼을 추가하고 기존 댓글은 유지"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'old.db')
+            conn = sqlite3.connect(path)
+            conn.executescript("""
+                CREATE TABLE comments (
+                    post_id INTEGER NOT NULL, comment_index INTEGER NOT NULL, author TEXT, content TEXT,
+                    created_time TEXT, collected_at TEXT NOT NULL, PRIMARY KEY (post_id, comment_index)
+                );
+                INSERT INTO comments VALUES (5, 0, '익명', '예전 댓글', '10:01', '2025-07-01T10:00:00');
+            """)
+            conn.close()
+
+            with SQLiteStore(path) as store:
+                self.assertEqual(list(store.get_comments(5)['content']), ['예전 댓글'])
+                store.save_post_detail({'url': 'https://everytime.kr/387605/v/5', 'comments': [
+                    {'comment_id': 100, 'parent_id': None, 'depth': 0, 'author': '익명', 'content': '새 댓글'}
+                ]})
+                comments = store.get_comments(5)
+
+            self.assertEqual((list(comments['comment_id']), list(comments['content'])), ([100], ['새 댓글']))
+
+    def test_query_helpers_use_indexes(self):
+        """board_id / comment_count 조건 조회가 인덱스를 사용"""
+        self.store.upsert_posts([make_post(i, str(i), 'free' if i % 2 else 'secret') for i in range(1, 11)])
+
+        df = self.store.get_posts(board_id='free', min_comments=5, limit=2)
+        self.assertEqual(list(df['article_id']), [9, 7])
+        self.assertEqual(self.store.max_article_id('secret'), 10)
+
+        plan = ' '.join(self.store.query(
+            "EXPLAIN QUERY PLAN SELECT * FROM posts WHERE board_id = 'free'"
+        )['detail'])
+        self.assertIn('idx_posts_board_id', plan)
+        indexes = set(self.store.query("SELECT name FROM sqlite_master WHERE type = 'index'")['name'])
+        self.assertTrue({'idx_posts_board_id', 'idx_posts_created_at', 'idx_posts_comment_count'} <= indexes)
+
+    def test_file_database_persists(self):
+        """파일 DB는 다시 열어도 유지"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'db', 'everytime.db')
+            with SQLiteStore(path) as store:
+                store.upsert_posts([make_post(1)])
+            with SQLiteStore(path) as store:
+                self.assertEqual(store.count_posts('free'), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
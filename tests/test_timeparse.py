@@ -0,0 +1,92 @@
+"""
+작성 시간 정규화 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+from datetime import datetime
+from everytime_crawler import EverytimeCrawler
+from everytime_crawler.timeparse import parse_created_time, add_created_at
+from everytime_crawler.utils import TimetableAnalyzer
+
+
+REF = datetime(2025, 7, 2, 12, 0)
+
+
+class TestNormalizeCreatedTimes(unittest.TestCase):
+    """parse_created_time / add_created_at 테스트"""
+
+    def test_relative_times(self):
+        """상대 시간은 수집 시각 기준으로 계산"""
+        self.assertEqual(parse_created_time('방금', REF), REF)
+        self.assertEqual(parse_created_time('3분 전', REF), datetime(2025, 7, 2, 11, 57))
+        self.assertEqual(parse_created_time('2시간 전', REF), datetime(2025, 7, 2, 10, 0))
+
+    def test_time_only(self):
+        """시각만 있으면 오늘, 수집 시각보다 늦으면 어제"""
+        self.assertEqual(parse_created_time('09:30', REF), datetime(2025, 7, 2, 9, 30))
+        self.assertEqual(parse_created_time('20:26', REF), datetime(2025, 7, 1, 20, 26))
+
+    def test_dates(self):
+        """연도 없는 날짜는 올해, 수집 시각보다 늦으면 작년"""
+        self.assertEqual(parse_created_time('07/01 09:11', REF), datetime(2025, 7, 1, 9, 11))
+        self.assertEqual(parse_created_time('07/05', REF), datetime(2024, 7, 5))
+        self.assertEqual(parse_created_time('24/12/31 13:00', REF), datetime(2024, 12, 31, 13, 0))
+        self.assertEqual(parse_created_time('2023/07/02', REF), datetime(2023, 7, 2))
+
+    def test_unparseable(self):
+        """해석할 수 없는 값은 None"""
+        for raw in ['', None, '어제쯤', '13/45']:
+            self.assertIsNone(parse_created_time(raw, REF), raw)
+
+    def test_per_row_reference(self):
+        """행마다 다른 수집 시각을 기준으로 변환"""
+        records = add_created_at([
+            {'created_time': '1분 전', 'collected_at': '2025-07-02T12:00:00'},
+            {'created_time': '23:59', 'collected_at': '2025-01-01T00:30:00'},
+            {'created_time': '12/31', 'collected_at': '2025-01-01T00:30:00'},
+        ])
+        self.assertEqual([r['created_at'] for r in records],
+                         ['2025-07-02T11:59:00', '2024-12-31T23:59:00', '2024-12-31T00:00:00'])
+
+    def test_add_created_at(self):
+        """레코드에 ISO 형식 created_at 추가"""
+        records = [
+            {'created_time': '10분 전', 'collected_at': '2025-07-02T12:00:00'},
+            {'created_time': '', 'collected_at': '2025-07-02T12:00:00'},
+        ]
+        add_created_at(records)
+        self.assertEqual(records[0]['created_at'], '2025-07-02T11:50:00')
+        self.assertIsNone(records[1]['created_at'])
+
+
+class TestCreatedAtOnIngest(unittest.TestCase):
+    """게시판 목록 파싱 결과에 created_at이 포함되는지 확인"""
+
+    def test_board_page_posts_have_created_at(self):
+        with open(os.path.join(os.path.dirname(__file__), 'fixtures', 'board_387605_page1.html'),
+                  encoding='utf-8') as f:
+            html = f.read()
+
+        posts = EverytimeCrawler()._extract_posts_from_html(html, 'free', 1)
+
+        self.assertTrue(posts)
+        for post in posts:
+            expected = parse_created_time(post['created_time'], post['collected_at'])
+            self.assertEqual(post['created_at'], expected.isoformat())
+
+
+class TestTimetableParseTimeString(unittest.TestCase):
+    """TimetableAnalyzer.parse_time_string 테스트"""
+
+    def test_parse_time_string(self):
+        result = TimetableAnalyzer.parse_time_string('월 3,4교시')
+        self.assertEqual(result, {'day': 'Monday', 'periods': [3, 4], 'original': '월 3,4교시'})
+        self.assertEqual(TimetableAnalyzer.parse_time_string('미정')['day'], None)
+
+
+if __name__ == '__main__':
+    unittest.main()
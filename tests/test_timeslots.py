@@ -0,0 +1,105 @@
+"""
+time slot / 시간 충돌 검사 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import random
+import unittest
+from everytime_crawler import EverytimeCrawler, TimetableAnalyzer, TimeSlotIndex
+from everytime_crawler.timeslots import make_slot, find_conflicts
+from fake_driver import FakeDriver
+
+
+def subject(name, *slots):
+    return {'subject_name': name, 'time_slots': [make_slot(*slot) for slot in slots]}
+
+
+class TestSlotExtraction(unittest.TestCase):
+    """get_timetable의 time_slots 저장 테스트"""
+
+    def test_fixture_slots(self):
+        crawler = EverytimeCrawler()
+        crawler.driver = FakeDriver({'/timetable': 'timetable.html'})
+
+        subjects = crawler.get_timetable(save_to_file=False)
+
+        slots = {(s['subject_name'], s['time_slots'][0]['day']): s['time_slots'][0] for s in subjects}
+        self.assertEqual(slots[('자료구조', 'Monday')], make_slot('Monday', 540, 630))
+        self.assertEqual(slots[('데이터베이스', 'Tuesday')], make_slot('Tuesday', 780, 930))
+        self.assertEqual(slots[('채플', 'Friday')], make_slot('Friday', 660, 720))
+
+        # fixture의 화요일 데이터베이스(13:00-15:30)와 컴퓨터네트워크(15:00-16:30)가 겹침
+        conflicts = TimetableAnalyzer.check_time_conflicts(subjects)
+        self.assertEqual([(c['subject1'], c['subject2'], c['day'], c['start_minute'], c['end_minute'])
+                          for c in conflicts],
+                         [('데이터베이스', '컴퓨터네트워크', 'Tuesday', 900, 930)])
+
+
+class TestConflicts(unittest.TestCase):
+    """sort-and-sweep 충돌 검사 테스트"""
+
+    def test_overlap_and_back_to_back(self):
+        subjects = [
+            subject('자료구조', ('Monday', 540, 630)),
+            subject('운영체제', ('Monday', 600, 690), ('Wednesday', 540, 600)),
+            subject('영어', ('Monday', 630, 690)),  # 자료구조 직후 시작: 충돌 아님
+        ]
+
+        conflicts = TimetableAnalyzer.check_time_conflicts(subjects)
+
+        self.assertEqual(len(conflicts), 2)
+        first = conflicts[0]
+        self.assertEqual((first['subject1'], first['subject2'], first['day']), ('자료구조', '운영체제', 'Monday'))
+        self.assertEqual((first['start_minute'], first['end_minute']), (600, 630))
+        self.assertEqual(first['conflicted_periods'], [2])
+        self.assertEqual((conflicts[1]['subject1'], conflicts[1]['subject2']), ('운영체제', '영어'))
+
+    def test_period_strings(self):
+        """time_slots가 없는 과목은 '월 3,4교시' 문자열의 교시로 비교"""
+        subjects = [
+            {'subject_name': 'A', 'time': '월 3,4교시'},
+            {'subject_name': 'B', 'time': '월 4,5교시'},
+            {'subject_name': 'C', 'time': '화 4교시'},
+        ]
+
+        conflicts = TimetableAnalyzer.check_time_conflicts(subjects)
+
+        self.assertEqual(len(conflicts), 1)
+        self.assertEqual(conflicts[0]['day'], 'Monday')
+        self.assertEqual(conflicts[0]['conflicted_periods'], [4])
+
+    def test_matches_pairwise_check(self):
+        """무작위 시간표에서 모든 쌍을 비교한 결과와 같은지 확인"""
+        rng = random.Random(7)
+        subjects = []
+        for i in range(300):
+            start = rng.randrange(480, 1200, 30)
+            subjects.append(subject(f'과목 {i}', (rng.choice(['Monday', 'Tuesday']), start,
+                                                  start + rng.choice([60, 90, 180]))))
+
+        expected = set()
+        for i in range(len(subjects)):
+            for j in range(i + 1, len(subjects)):
+                a, b = subjects[i]['time_slots'][0], subjects[j]['time_slots'][0]
+                if a['day'] == b['day'] and a['start_minute'] < b['end_minute'] and b['start_minute'] < a['end_minute']:
+                    expected.add((f'과목 {i}', f'과목 {j}'))
+
+        found = {(c['subject1'], c['subject2']) for c in find_conflicts(subjects)}
+        self.assertEqual(found, expected)
+
+        index = TimeSlotIndex(subjects[:150])
+        for candidate in subjects[150:]:
+            slot = candidate['time_slots'][0]
+            brute = [s for s in subjects[:150]
+                     if s['time_slots'][0]['day'] == slot['day']
+                     and s['time_slots'][0]['start_minute'] < slot['end_minute']
+                     and slot['start_minute'] < s['time_slots'][0]['end_minute']]
+            self.assertEqual(index.conflicts_with(candidate), bool(brute))
+            self.assertEqual(len(index.overlaps(slot)), len(brute))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+시간표 파싱 테스트 (가짜 WebDriver 사용)
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+from bs4 import BeautifulSoup
+from everytime_crawler import EverytimeCrawler
+from everytime_crawler.timetable import TimeGrid, extract_subject_fields, format_time_range
+from fake_driver import FakeDriver
+
+
+def timetable_page(subject_count):
+    subjects = ''.join(
+        f'<div class="subject" style="height: 60px; top: {540 + 60 * (i % 8)}px;">'
+        f'<h3>과목 {i}</h3><p><em>교수 {i}</em><span>강의실 {i}</span></p></div>'
+        for i in range(subject_count)
+    )
+    return f'<html><body><div class="tablebody">{subjects}</div></body></html>'
+
+
+def semester_page(selected, subject_count):
+    """#semesters 드롭다운에서 selected 학기가 선택된 시간표 페이지"""
+    options = ''.join(
+        f'<option value="{value}"{" selected" if value == selected else ""}>'
+        f'{value[:4]}년 {value[-1]}학기</option>'
+        for value in ('2025-1', '2024-2', '2024-1')
+    )
+    subjects = ''.join(
+        f'<div class="subject" style="height: 60px; top: {540 + 60 * i}px;">'
+        f'<h3>{selected} 과목 {i}</h3><p><em>교수</em><span>강의실</span></p></div>'
+        for i in range(subject_count)
+    )
+    return (f'<html><body><select id="semesters">{options}</select>'
+            f'<div class="tablebody">{subjects}</div></body></html>')
+
+
+class TestTimetableExtraction(unittest.TestCase):
+    """get_timetable 과목 추출 테스트"""
+
+    def setUp(self):
+        self.crawler = EverytimeCrawler()
+
+    def test_fixture_subjects(self):
+        """과목명, 교수, 강의실, 시간이 WebElement 방식과 같은 값으로 추출되는지 확인"""
+        self.crawler.driver = FakeDriver({'/timetable': 'timetable.html'})
+
+        subjects = self.crawler.get_timetable(save_to_file=False)
+
+        self.assertEqual(len(subjects), 12)
+        first = subjects[0]
+        self.assertEqual(first['subject_name'], '자료구조')
+        self.assertEqual(first['year'], 2025)
+        self.assertEqual(first['semester'], 1)
+        self.assertTrue(first['time'].startswith('오전'))
+        chapel = [s for s in subjects if s['subject_name'] == '채플']
+        self.assertEqual(chapel[0]['professor'], '')
+
+    def test_round_trips_do_not_grow_with_subjects(self):
+        """과목 수와 관계없이 WebDriver 왕복 횟수가 일정한지 확인"""
+        trips = []
+        for count in (2, 40):
+            driver = FakeDriver({'/timetable': timetable_page(count)})
+            self.crawler.driver = driver
+            self.assertEqual(len(self.crawler.get_timetable(save_to_file=False)), count)
+            trips.append(driver.round_trips)
+
+        self.assertEqual(trips[0], trips[1])
+
+    def test_missing_fields_defaults(self):
+        """h3/p/em/span이 없을 때 기본값"""
+        node = BeautifulSoup('<div class="subject"><h3> 채플 </h3><p><span></span></p></div>', 'lxml').div
+        self.assertEqual(extract_subject_fields(node), {
+            'subject_name': '채플',
+            'professor': '교수 정보 없음',
+            'room': '강의실 정보 없음',
+            'style': None,
+        })
+
+
+class TestTimeGrid(unittest.TestCase):
+    """시간 열 기준 픽셀 -> 분 변환 테스트"""
+
+    def grid(self, labels, height):
+        rows = ''.join(f'<div class="time" style="height: {height}px;">{label}</div>' for label in labels)
+        return TimeGrid.from_soup(BeautifulSoup(f'<div class="times">{rows}</div>', 'lxml'))
+
+    def test_calibrated_offsets(self):
+        """오전 9시부터 시작하고 1시간이 50px인 격자에서 30분 단위 강의"""
+        grid = self.grid(['오전 9시', '오전 10시', '오전 11시', '오후 12시', '오후 1시'], 50)
+
+        self.assertEqual(grid.time_ranges(['height: 75px; top: 25px;', 'top: 150px; height: 50px;', None]),
+                         [(570, 660), (720, 780), None])
+        self.assertEqual(format_time_range((570, 660)), '오전 9시 30분 - 오전 11시')
+
+    def test_number_labels_and_default(self):
+        """숫자만 있는 라벨은 12 다음을 오후로 해석, 시간 열이 없으면 1시간 = 60px"""
+        grid = self.grid(['11', '12', '1', '2'], 60)
+        self.assertEqual(grid.time_range('top: 120px; height: 90px;'), (780, 870))
+
+        default = TimeGrid.from_soup(BeautifulSoup('<div></div>', 'lxml'))
+        self.assertEqual(default.time_range('height: 90px; top: 540px;'), (540, 630))
+
+
+class TestTimetableBatch(unittest.TestCase):
+    """get_timetables 여러 학기 수집 테스트"""
+
+    def test_switches_semesters_in_place(self):
+        """시간표 페이지는 한 번만 열고 드롭다운으로 학기를 전환"""
+        driver = FakeDriver(
+            {'/timetable': semester_page('2025-1', 3)},
+            selections={'2024-2': semester_page('2024-2', 5), '2024-1': semester_page('2024-1', 0)}
+        )
+        navigations = []
+        original_get = driver.get
+        driver.get = lambda url: (navigations.append(url), original_get(url))
+        crawler = EverytimeCrawler()
+        crawler.driver = driver
+
+        result = crawler.get_timetables([(2025, 1), (2024, 2), (2024, 1), (2023, 2)])
+
+        self.assertEqual(len(navigations), 1)
+        per_semester = {(r['year'], r['semester']): r for r in result['semesters']}
+        self.assertEqual(per_semester[(2025, 1)]['subject_count'], 3)
+        self.assertEqual(per_semester[(2024, 2)]['subject_count'], 5)
+        self.assertEqual(per_semester[(2024, 1)]['subjects'], [])
+        self.assertIsNone(per_semester[(2024, 1)]['error'])
+        self.assertIsNotNone(per_semester[(2023, 2)]['error'])
+        for r in result['semesters']:
+            self.assertGreaterEqual(r['elapsed_ms'], 0)
+
+        self.assertEqual(len(result['subjects']), 8)
+        spring = [s for s in result['subjects'] if s['semester'] == 2]
+        self.assertTrue(all(s['subject_name'].startswith('2024-2') and s['year'] == 2024 for s in spring))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+조건 기반 페이지 대기 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import time
+import unittest
+from unittest.mock import Mock
+from selenium.common.exceptions import TimeoutException
+from everytime_crawler import EverytimeCrawler
+from everytime_crawler.waits import PageWaiter, BOARD_READY_SELECTORS
+from fake_driver import FakeDriver
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+class DelayedDriver:
+    """n번째 확인부터 요소를 반환하는 가짜 드라이버"""
+
+    def __init__(self, ready_after):
+        self.ready_after = ready_after
+        self.calls = []
+
+    def find_elements(self, by, selector):
+        self.calls.append(selector)
+        return ['element'] if len(self.calls) >= self.ready_after else []
+
+
+class TestPageWaiter(unittest.TestCase):
+    """PageWaiter 테스트"""
+
+    def test_returns_as_soon_as_present(self):
+        """요소가 나타나면 즉시 반환하고 대기 시간을 기록"""
+        driver = DelayedDriver(ready_after=3)
+        waiter = PageWaiter(driver, timeout=5, poll_frequency=0.01)
+
+        self.assertTrue(waiter.for_any(["article.list", "tr.list"], "board_list"))
+
+        self.assertEqual(driver.calls, ["article.list, tr.list"] * 3)
+        summary = waiter.summary()
+        self.assertEqual(summary["board_list"]["count"], 1)
+        self.assertLess(summary["board_list"]["max"], 1)
+
+    def test_timeout_returns_none(self):
+        """시간 초과 시 None 반환 (required=False)"""
+        waiter = PageWaiter(DelayedDriver(ready_after=10 ** 6), timeout=0.05, poll_frequency=0.01)
+        self.assertIsNone(waiter.for_any(["ul.comments"], "post_detail"))
+        self.assertGreaterEqual(waiter.timings["post_detail"][0], 0.05)
+
+    def test_timeout_required_raises(self):
+        """required=True이면 TimeoutException"""
+        waiter = PageWaiter(DelayedDriver(ready_after=10 ** 6), timeout=0.05, poll_frequency=0.01)
+        with self.assertRaises(TimeoutException):
+            waiter.for_any(["input[name='id']"], "login_form", required=True)
+
+    def test_for_refresh_waits_for_stale(self):
+        """이전 요소가 교체될 때까지 대기"""
+        old = Mock()
+        old.is_enabled.side_effect = [True, True, Exception("stale")]
+        waiter = PageWaiter(DelayedDriver(ready_after=1), timeout=5, poll_frequency=0.01)
+
+        self.assertTrue(waiter.for_refresh([old], [".subject"], "timetable_semester"))
+        self.assertEqual(old.is_enabled.call_count, 3)
+
+    def test_empty_board_is_ready(self):
+        """게시글이 없는 페이지도 "게시글 없음" 표시가 있으면 시간 초과 없이 반환"""
+        driver = FakeDriver({'/387605': '<html><body><div class="wrap articles">'
+                                        '<article class="dialog">아직 글이 없습니다.</article></div></body></html>'})
+        driver.get("https://everytime.kr/387605")
+        waiter = PageWaiter(driver, timeout=5, poll_frequency=0.01)
+
+        self.assertTrue(waiter.for_any(BOARD_READY_SELECTORS, "board_list"))
+        self.assertLess(waiter.timings["board_list"][0], 1)
+
+
+class TestBoardPostsWithoutFixedSleeps(unittest.TestCase):
+    """드라이버 경로에서 고정 대기 없이 페이지를 처리하는지 확인"""
+
+    def test_driver_pages_not_padded(self):
+        """delay=0이면 페이지 처리 시간이 대기 추정치로 늘어나지 않음"""
+        with open(os.path.join(FIXTURES_DIR, 'board_387605_page1.html'), encoding='utf-8') as f:
+            html = f.read()
+
+        crawler = EverytimeCrawler()
+        crawler.driver = Mock()
+        crawler.driver.page_source = html
+        crawler.driver.current_url = "https://everytime.kr/387605"
+        crawler.driver.find_elements.return_value = ['element']
+        crawler.driver.find_element.return_value = 'body'
+
+        start = time.monotonic()
+        posts = crawler.get_board_posts("free", pages=3, delay=0)
+
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(len(posts), 60)
+        self.assertEqual(crawler.waiter.summary()["board_list"]["count"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()